@@ -0,0 +1,159 @@
+# -------------------- IMPORTS --------------------
+import argparse
+import heapq
+import sys
+from random import Random
+from statistics import median
+from time import monotonic_ns, sleep
+
+from src.engine import *
+
+
+# -------------------- CONSTANTS --------------------
+TIMERS = 200
+SHORTEST = 0.01
+LONGEST = 0.5
+# The bound on the 99th percentile of the lateness of the expiries, in milliseconds
+LIMIT = 1.0
+
+
+# -------------------- CLASSES --------------------
+class EventLoop:
+    def __init__(self) -> None:
+        """Builds a minimal real-time loop with Tk's after / after_cancel methods, so the engine can be measured
+        without a display.
+        """
+        self.queue = []
+        self.cancelled = set()
+        self.counter = 0
+
+    def after(self, delay: int, callback) -> int:
+        """Schedules a callback.
+
+        Args:
+            delay (int): the amount of milliseconds to wait.
+            callback (callable): the callback.
+
+        Returns:
+            int: the id of the callback.
+        """
+        self.counter += 1
+        heapq.heappush(self.queue, (monotonic_ns() + delay * NS_PER_MILLISECOND, self.counter, callback))
+        return self.counter
+
+    def after_cancel(self, identifier: int) -> None:
+        """Cancels a callback.
+
+        Args:
+            identifier (int): the id of the callback.
+        """
+        self.cancelled.add(identifier)
+
+    def mainloop(self) -> None:
+        """Runs the callbacks until none is left.
+        """
+        while self.queue:
+            due, identifier, callback = heapq.heappop(self.queue)
+            if identifier in self.cancelled:
+                continue
+            sleep(max(due - monotonic_ns(), 0) / NS_PER_SECOND)
+            callback()
+
+
+class LatencyRecorder(EngineObserver):
+    def __init__(self, engine: TimerEngine) -> None:
+        """Records how late each timer expires, compared to its deadline.
+
+        Args:
+            engine (TimerEngine): the engine to observe.
+        """
+        self.engine = engine
+        self.deadlines = {}
+        self.latencies = []
+
+    def on_run(self, indexes) -> None:
+        """Records the deadlines of the timers which were run.
+
+        Args:
+            indexes (Iterable): which timers were run.
+        """
+        for index in indexes:
+            self.deadlines[index] = self.engine.models.start[index] + self.engine.models.memory[index]
+
+    def on_expire(self, index: int) -> None:
+        """Records the latency of a timer.
+
+        Args:
+            index (int): which timer expired.
+        """
+        self.latencies.append(monotonic_ns() - self.deadlines[index])
+
+
+# -------------------- FUNCTIONS --------------------
+def percentiles(latencies: list) -> tuple:
+    """Returns the median, the 99th percentile and the maximum of some latencies.
+
+    Args:
+        latencies (list): the latencies, in milliseconds, sorted.
+
+    Returns:
+        tuple: the median, p99 and max, in milliseconds.
+    """
+    return median(latencies), latencies[int(len(latencies) * 0.99) - 1], latencies[-1]
+
+
+def sleep_overshoot(amount: int, random: Random) -> list:
+    """Measures how late the host wakes up from sleeps as short as the waits of the loop, without any engine: the
+    part of the lateness the application cannot remove.
+
+    Args:
+        amount (int): the amount of sleeps.
+        random (Random): the generator of their durations.
+
+    Returns:
+        list: how late each sleep returned, in milliseconds, sorted.
+    """
+    overshoots = []
+    for _ in range(amount):
+        duration = random.uniform(0, 2 * NS_PER_MILLISECOND)
+        start = monotonic_ns()
+        sleep(duration / NS_PER_SECOND)
+        overshoots.append((monotonic_ns() - start - duration) / NS_PER_MILLISECOND)
+    return sorted(overshoots)
+
+
+def main() -> None:
+    """Runs timers of random durations, and prints how late their expiries fire, next to how late the host wakes up
+    from a sleep. Exits with 1 if the 99th percentile of the lateness exceeds the limit.
+
+    Tk's after() counts whole milliseconds, so the scheduler rounds each wait down and waits again with a delay of 0
+    for the rest: an expiry is only late by the sleep overshoot of the host and the cost of the callbacks. On a loaded
+    or single core machine, the preemptions alone can exceed the limit, the sleeps show it.
+    """
+    parser = argparse.ArgumentParser(description="Measures how late the expiries of the timers fire.")
+    parser.add_argument("--limit", type=float, default=LIMIT, help="the bound on the p99 lateness, in milliseconds")
+    args = parser.parse_args()
+
+    loop = EventLoop()
+    engine = TimerEngine(TIMERS, scheduler=TickScheduler(loop))
+    recorder = LatencyRecorder(engine)
+    engine.subscribe(recorder)
+    random = Random(0)
+    for index in range(TIMERS):
+        engine.add_time(random.uniform(SHORTEST, LONGEST), index)
+    engine.run()
+    loop.mainloop()
+    latencies = sorted(latency / NS_PER_MILLISECOND for latency in recorder.latencies)
+    middle, p99, longest = percentiles(latencies)
+    print(f"{len(latencies)} expiries, latency in ms: median {middle:.3f}, p99 {p99:.3f}, max {longest:.3f}")
+    overshoots = sleep_overshoot(TIMERS, random)
+    middle, tail, longest = percentiles(overshoots)
+    print(f"{len(overshoots)} sleeps of the host, overshoot in ms: median {middle:.3f}, p99 {tail:.3f}, "
+          f"max {longest:.3f}")
+    if p99 > args.limit:
+        print(f"p99 latency {p99:.3f} ms above the limit of {args.limit} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
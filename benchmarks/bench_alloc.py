@@ -0,0 +1,87 @@
+# -------------------- IMPORTS --------------------
+import argparse
+from array import array
+import gc
+import sys
+import tracemalloc
+from statistics import median
+
+from . import tk_stub
+from .suite import application, controllers, unlock_sizes
+
+
+# -------------------- CONSTANTS --------------------
+TICKS = 100_000
+WARMUP = 1_000
+GROWTH_LIMIT = 1024
+# Beyond this amount of chronos, a controller gets proportionally fewer ticks, so every size runs in seconds
+FULL_SIZE = 16
+
+
+# -------------------- FUNCTIONS --------------------
+def measure(controller, ticks: int) -> tuple:
+    """Ticks a controller, the clock moving by a decisecond before each tick so every tick displays a new value, and
+    traces the memory allocated meanwhile: what the ticks keep, and what each tick allocates at most while it runs.
+    The warm-up is traced too, so the strings displayed before the ticks are known to tracemalloc when the ticks
+    replace them.
+
+    Args:
+        controller: the controller, running on a manual clock.
+        ticks (int): the amount of ticks.
+
+    Returns:
+        tuple: the growth of the traced memory over the ticks, in bytes, and the peak of each tick above the memory
+        traced before it, in bytes, sorted.
+    """
+    clock = controller.engine.models.clock
+    tick = controller.tick
+    gc.collect()
+    tracemalloc.start()
+    for _ in range(WARMUP):
+        clock.now += 100_000_000
+        tick()
+    # Preallocated, so recording the peaks allocates nothing
+    peaks = array("q", bytes(8 * ticks))
+    start = tracemalloc.get_traced_memory()[0]
+    for index in range(ticks):
+        clock.now += 100_000_000
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        tick()
+        peaks[index] = tracemalloc.get_traced_memory()[1] - before
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return current - start, sorted(peaks)
+
+
+def main() -> None:
+    """Measures the allocations of the ticks of every controller, at every size. Exits with 1 if the memory of one of
+    them grows by more than GROWTH_LIMIT bytes, whatever the amount of ticks.
+    """
+    parser = argparse.ArgumentParser(description="Traces the memory allocated by the ticks of the controllers.")
+    parser.add_argument("--ticks", type=int, default=TICKS, help="the amount of ticks of the controllers of up to "
+                                                                 f"{FULL_SIZE} chronos, fewer for the larger ones")
+    args = parser.parse_args()
+
+    tk_stub.install()
+    unlock_sizes()
+    growing = []
+    for name, controller in controllers(application()).items():
+        ticks = args.ticks * FULL_SIZE // max(len(controller.engine), FULL_SIZE)
+        # Large timers, so they are still running after the ticks
+        if hasattr(controller, "change_time"):
+            controller.change_time(24 * 60)
+        growth, peaks = measure(controller, ticks)
+        controller.close()
+        flag = "  GROWING" if growth > GROWTH_LIMIT else ""
+        if flag:
+            growing.append(name)
+        print(f"{name:<36}{ticks:6d} ticks: {growth:6d} B kept, per tick {median(peaks):6.0f} B median, "
+              f"{peaks[-1]:6d} B max{flag}")
+    if growing:
+        print(f"{len(growing)} controller(s) keep memory at every tick")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -------------------- IMPORTS --------------------
+import argparse
+import os
+from statistics import median
+from time import perf_counter_ns
+
+from src.constants import *
+from . import tk_stub
+
+
+# -------------------- CONSTANTS --------------------
+DURATION = 60
+TICKS = 600
+
+
+# -------------------- FUNCTIONS --------------------
+def countdown(renderer: str, tk: bool) -> list:
+    """Runs a timer of each diameter through a full countdown, and times each tick with the redraw of Tk. The faces
+    of the countdown are rendered in advance between the ticks, out of the measure.
+
+    Args:
+        renderer (str): "arc" or "sprites".
+        tk (bool): whether the real Tk is used.
+
+    Returns:
+        list: the duration of each tick, in nanoseconds, sorted.
+    """
+    from .suite import application
+    from src.controllers import MultiTimerController, TimerController
+    from src.models import ManualClock
+
+    os.environ[ARC_RENDERER] = renderer
+    app = application()
+    app.alarm = None
+    times = []
+    for controller in (TimerController(app), MultiTimerController(app)):
+        clock = controller.engine.models.clock = ManualClock()
+        controller.change_time(DURATION / 60)
+        controller.run()
+        for _ in range(TICKS):
+            clock.advance(DURATION / TICKS)
+            # The faces rendered in advance, as Tk is idle between the ticks
+            for diameter, step in list(app.view.clock_faces.queued):
+                app.view.clock_faces.prefetch(diameter, step)
+            start = perf_counter_ns()
+            controller.tick()
+            app.view.render_queue.flush()
+            app.view.update_idletasks()
+            times.append(perf_counter_ns() - start)
+        controller.close()
+    if tk:
+        app.view.destroy()
+    return sorted(times)
+
+
+def faces() -> None:
+    """Measures the rendering of the faces of each diameter, and the memory the cache may use.
+    """
+    from src.views import ClockFaceCache
+
+    cache = ClockFaceCache(tk_stub.Misc())
+    for diameter in (SMALL_DIAMETER, BIG_DIAMETER):
+        start = perf_counter_ns()
+        cache.prepare(diameter)
+        prepared = perf_counter_ns() - start
+        start = perf_counter_ns()
+        for step in range(cache.steps + 1):
+            cache.render(diameter, step)
+        rendered = (perf_counter_ns() - start) / (cache.steps + 1)
+        print(f"diameter {diameter}: empty face and pixel angles {prepared / 1e6:.1f} ms, "
+              f"{rendered / 1e6:.2f} ms per face (Python side)")
+    kept = cache.size + len(cache.full)
+    print(f"{kept} faces kept at most, with the full ones: {kept * BIG_DIAMETER ** 2 * 4 / 2 ** 20:.1f} MiB of pixels")
+
+
+def main() -> None:
+    """Compares the ticks of the timers drawing their slice with Tk, and swapping pre-rendered faces.
+    """
+    parser = argparse.ArgumentParser(description="Compares the renderers of the clocks of the timers.")
+    parser.add_argument("--tk", action="store_true", help="use the real Tk (needs a display, or xvfb-run)")
+    args = parser.parse_args()
+    if not args.tk:
+        tk_stub.install()
+    faces()
+    for renderer in ("arc", "sprites"):
+        times = countdown(renderer, args.tk)
+        print(f"{renderer:<8} {len(times)} ticks: median {median(times) / 1000:.0f} us, "
+              f"p99 {times[int(len(times) * 0.99)] / 1000:.0f} us, max {times[-1] / 1000:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
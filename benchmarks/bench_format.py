@@ -0,0 +1,74 @@
+# -------------------- IMPORTS --------------------
+from datetime import timedelta
+from timeit import repeat
+
+from src.formatting import *
+
+
+# -------------------- CONSTANTS --------------------
+NUMBER = 100_000
+REPEAT = 5
+TICK = timedelta(milliseconds=60)
+DECISECOND = timedelta(milliseconds=100)
+
+
+# -------------------- FUNCTIONS --------------------
+def legacy_format_time_str(value: timedelta) -> str:
+    """The str.format based formatter, kept as the reference of the benchmark.
+
+    Args:
+        value (timedelta): the timedelta to convert to string.
+
+    Returns:
+        str: the timedelta, converted to a string.
+    """
+    if value >= timedelta(hours=1):
+        return "{:01d}:{:02d}:{:02d}.{}".format(
+            value.seconds // 3600,
+            (value.seconds // 60) % 60,
+            value.seconds % 60,
+            value.microseconds // 100000,
+        )
+    else:
+        return "{:02d}:{:02d}.{}".format(
+            (value.seconds // 60) % 60,
+            value.seconds % 60,
+            value.microseconds // 100000,
+        )
+
+
+def best(statement) -> float:
+    """Returns the best time of a statement, per call.
+
+    Args:
+        statement (callable): the statement to time.
+
+    Returns:
+        float: the amount of nanoseconds per call.
+    """
+    return min(repeat(statement, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e9
+
+
+def main() -> None:
+    """Compares the legacy formatter with the decisecond formatter, with and without its cache. The values follow a
+    60 ms tick, so the cache sees the same value about 40% of the time, as in the application.
+    """
+    values = [TICK * tick for tick in range(NUMBER)]
+    deciseconds = [value // DECISECOND for value in values]
+    formatter = TimeFormatter()
+    legacy = iter(values * (REPEAT + 1))
+    plain = iter(deciseconds * (REPEAT + 1))
+    cached = iter(deciseconds * (REPEAT + 1))
+    results = {
+        "legacy format_time_str(timedelta)": best(lambda: legacy_format_time_str(next(legacy))),
+        "format_time_str(deciseconds)": best(lambda: format_time_str(next(plain))),
+        "TimeFormatter, 60 ms ticks": best(lambda: formatter(next(cached))),
+        "TimeFormatter, unchanged value": best(lambda: formatter(42)),
+    }
+    reference = results["legacy format_time_str(timedelta)"]
+    for name, duration in results.items():
+        print(f"{name:<36}{duration:8.1f} ns/call{reference / duration:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -------------------- IMPORTS --------------------
+import argparse
+import asyncio
+from random import Random
+from statistics import median
+from time import monotonic_ns, perf_counter_ns, process_time
+
+from src.host import *
+
+
+# -------------------- CONSTANTS --------------------
+SESSIONS = 10_000
+SECONDS = 10
+
+
+# -------------------- FUNCTIONS --------------------
+async def exams(sessions: int, seconds: float) -> None:
+    """Opens the sessions, each a timer with a random duration (from a seeded generator, so runs can be compared),
+    runs them all, and drives them in real time until every timer expired. Prints the cost of the ticks, the lateness
+    of the expiries, and the CPU used.
+
+    Args:
+        sessions (int): the amount of sessions.
+        seconds (float): the longest duration of the timers.
+    """
+    random = Random(0)
+    deadlines = {}
+    lateness = []
+    host = SessionHost(listener=lambda key, index: lateness.append(monotonic_ns() - deadlines[key]))
+
+    cpu = process_time()
+    start = perf_counter_ns()
+    for number in range(sessions):
+        key = f"room-{number}"
+        engine = host.open(key)
+        engine.add_time(random.uniform(0.5, seconds))
+        engine.run()
+        deadlines[key] = engine.models.start[0] + engine.models.total[0]
+    print(f"{len(host)} sessions opened and run in {(perf_counter_ns() - start) / 1e6:.0f} ms, "
+          f"{len(host.wheel)} deadlines in the wheel")
+
+    ticks = []
+    period = host.wheel.resolution / NS_PER_SECOND
+    while len(lateness) < sessions:
+        start = perf_counter_ns()
+        host.advance()
+        ticks.append(perf_counter_ns() - start)
+        await asyncio.sleep(period)
+    cpu = process_time() - cpu
+
+    ticks.sort()
+    lateness.sort()
+    print(f"{len(ticks)} ticks: median {median(ticks) / 1000:.0f} us, "
+          f"p99 {ticks[int(len(ticks) * 0.99)] / 1000:.0f} us, max {ticks[-1] / 1000:.0f} us")
+    print(f"expiry lateness: median {median(lateness) / 1e6:.1f} ms, max {lateness[-1] / 1e6:.1f} ms")
+    print(f"CPU: {cpu:.2f} s for {seconds} s of exams, {100 * cpu / seconds:.0f}% of one core")
+
+    # What a tick would cost if it asked every session for its next expiry
+    start = perf_counter_ns()
+    for session in host.sessions.values():
+        session.engine.next_expiry()
+    print(f"scanning every session instead: {(perf_counter_ns() - start) / 1000:.0f} us per tick")
+
+
+def main() -> None:
+    """Runs the benchmark of the session host.
+    """
+    parser = argparse.ArgumentParser(description="Drives thousands of exam timers from one timing wheel.")
+    parser.add_argument("--sessions", type=int, default=SESSIONS, help="the amount of sessions")
+    parser.add_argument("--seconds", type=float, default=SECONDS, help="the longest duration of the timers")
+    args = parser.parse_args()
+    asyncio.run(exams(args.sessions, args.seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -------------------- IMPORTS --------------------
+import os
+import tempfile
+from statistics import median
+from time import perf_counter_ns
+
+from src.journal import *
+
+
+# -------------------- CONSTANTS --------------------
+TRANSITIONS = 20_000
+CHRONOS = 16
+
+
+# -------------------- FUNCTIONS --------------------
+def transition_times(engine: ChronoEngine) -> list:
+    """Measures each run / pause of one chrono, the way a button handler calls the engine.
+
+    Args:
+        engine (ChronoEngine): the engine, journaled or not.
+
+    Returns:
+        list: the duration of each transition, in nanoseconds, sorted.
+    """
+    times = []
+    for transition in range(TRANSITIONS):
+        index = transition % len(engine)
+        start = perf_counter_ns()
+        if transition // len(engine) % 2:
+            engine.pause(index)
+        else:
+            engine.run(index)
+        times.append(perf_counter_ns() - start)
+    return sorted(times)
+
+
+def summary(times: list) -> str:
+    """Formats the distribution of some durations.
+
+    Args:
+        times (list): the durations, in nanoseconds, sorted.
+
+    Returns:
+        str: the median, p99 and max, in microseconds.
+    """
+    return (f"median {median(times) / 1000:.2f} us, p99 {times[int(len(times) * 0.99) - 1] / 1000:.2f} us, "
+            f"max {times[-1] / 1000:.2f} us")
+
+
+def main() -> None:
+    """Compares button transitions with and without the journal, then measures a replay of a full journal.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "session.journal")
+        print(f"without journal: {summary(transition_times(ChronoEngine(CHRONOS)))}")
+        journal = SessionJournal(path)
+        engine = ChronoEngine(CHRONOS)
+        journal.attach(engine, 3)
+        print(f"with journal:    {summary(transition_times(engine))}")
+        while journal.position < journal.capacity - 1:
+            journal.append(journal.records(RUN, (0,)))
+        start = perf_counter_ns()
+        journal.compact()
+        print(f"compaction: {(perf_counter_ns() - start) / 1000:.0f} us")
+        while journal.position < journal.capacity - 1:
+            journal.append(journal.records(RUN, (0,)))
+        journal.close()
+        start = perf_counter_ns()
+        replayed = SessionJournal(path)
+        session = replayed.replay()
+        print(f"replay of {journal.position} records: {(perf_counter_ns() - start) / 1000:.0f} us, "
+              f"{len(session.slots)} chronos restored")
+        replayed.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# -------------------- IMPORTS --------------------
+import argparse
+import base64
+import os
+from statistics import median
+from time import perf_counter_ns, process_time
+
+from src.server import *
+
+
+# -------------------- CONSTANTS --------------------
+CLIENTS = 1_000
+CHRONOS = 16
+TRANSITIONS = 200
+STREAM_PERIOD_MS = 60
+
+
+# -------------------- CLASSES --------------------
+class StandInClient:
+    def __init__(self) -> None:
+        """Builds a client which only counts what it receives, standing for a WebSocket, so the publishing side is
+        measured alone, without the network.
+        """
+        self.messages = 0
+        self.size = 0
+
+    def send(self, message: str) -> None:
+        """Receives a message.
+
+        Args:
+            message (str): the message.
+        """
+        self.messages += 1
+        self.size += len(message)
+
+
+# -------------------- FUNCTIONS --------------------
+def transitions(engine: ChronoEngine) -> list:
+    """Runs and pauses each chrono in turn, the way the buttons do.
+
+    Args:
+        engine (ChronoEngine): the published engine.
+
+    Returns:
+        list: the duration of each transition, publishing included, in nanoseconds, sorted.
+    """
+    times = []
+    for transition in range(TRANSITIONS):
+        index = transition % len(engine)
+        start = perf_counter_ns()
+        if transition // len(engine) % 2:
+            engine.pause(index)
+        else:
+            engine.run(index)
+        times.append(perf_counter_ns() - start)
+    return sorted(times)
+
+
+def stand_in() -> None:
+    """Connects the stand-in clients to a channel, publishes transitions to all of them from a single thread, and
+    compares the traffic with a stream of the values every STREAM_PERIOD_MS.
+    """
+    channel = StateChannel()
+    publisher = StatePublisher(channel.publish)
+    engine = ChronoEngine(CHRONOS)
+    publisher.attach(engine, 3)
+    clients = [StandInClient() for _ in range(CLIENTS)]
+    cpu = process_time()
+    for client in clients:
+        channel.connect(client, publisher.snapshot())
+    times = transitions(engine)
+    cpu = process_time() - cpu
+    messages = sum(client.messages for client in clients)
+    size = sum(client.size for client in clients)
+    print(f"{len(channel)} stand-in clients, {TRANSITIONS} transitions, one thread: {cpu:.2f} s of CPU")
+    print(f"transition + fan-out: median {median(times) / 1000:.0f} us, max {times[-1] / 1000:.0f} us "
+          f"({median(times) / CLIENTS:.0f} ns per client)")
+    print(f"sent {messages} messages, {size / messages:.0f} bytes each on average")
+    print(f"a {STREAM_PERIOD_MS} ms stream would send {CLIENTS * 1000 // STREAM_PERIOD_MS} messages per second, "
+          f"whatever happens")
+
+
+def live_client(port: int, counts: list, index: int) -> None:
+    """Connects a minimal WebSocket client to the server, and counts the messages it receives until the server
+    closes the connection.
+
+    Args:
+        port (int): the port of the server.
+        counts (list): the amount of messages received by each client.
+        index (int): which client.
+    """
+    from gevent import socket
+
+    connection = socket.create_connection(("127.0.0.1", port))
+    key = base64.b64encode(os.urandom(16)).decode()
+    connection.sendall((f"GET /ws HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nUpgrade: websocket\r\n"
+                        f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+    stream = connection.makefile("rb")
+    while stream.readline() not in (b"\r\n", b""):
+        pass
+    while True:
+        header = stream.read(2)
+        if len(header) < 2 or header[0] & 0x0F == 0x8:
+            break
+        length = header[1] & 0x7F
+        if length == 126:
+            length = int.from_bytes(stream.read(2), "big")
+        elif length == 127:
+            length = int.from_bytes(stream.read(8), "big")
+        stream.read(length)
+        counts[index] += 1
+    connection.close()
+
+
+def live() -> None:
+    """Starts the real server on a free port, connects the clients from greenlets of this process, and measures how
+    long each transition takes to reach every client. Needs the web stack of requirements.txt.
+    """
+    import gevent
+
+    try:
+        import resource
+
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, min(hard, 4 * CLIENTS)), hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+    server = StateServer(port=0)
+    server.start()
+    engine = ChronoEngine(CHRONOS)
+    server.publisher.attach(engine, 3)
+    counts = [0] * CLIENTS
+    greenlets = [gevent.spawn(live_client, server.port, counts, index) for index in range(CLIENTS)]
+    while len(server.channel) < CLIENTS:
+        gevent.sleep(0.01)
+    print(f"{len(server.channel)} clients connected")
+
+    cpu = process_time()
+    delays = []
+    for transition in range(TRANSITIONS):
+        expected = transition + 2
+        start = perf_counter_ns()
+        if transition // CHRONOS % 2:
+            engine.pause(transition % CHRONOS)
+        else:
+            engine.run(transition % CHRONOS)
+        while min(counts) < expected:
+            gevent.sleep(0)
+        delays.append(perf_counter_ns() - start)
+    cpu = process_time() - cpu
+    delays.sort()
+    print(f"{TRANSITIONS} transitions delivered to every client: median {median(delays) / 1000:.0f} us, "
+          f"max {delays[-1] / 1000:.0f} us, {cpu:.2f} s of CPU for the server and the clients")
+    server.stop()
+    gevent.joinall(greenlets, timeout=5)
+
+
+def main() -> None:
+    """Runs the load test against the stand-in clients, or the real server with --live.
+    """
+    parser = argparse.ArgumentParser(description="Load test of the server of the remote displays.")
+    parser.add_argument("--live", action="store_true", help="use the real server and WebSocket clients (needs gevent)")
+    args = parser.parse_args()
+    if args.live:
+        live()
+    else:
+        stand_in()
+
+
+if __name__ == "__main__":
+    main()
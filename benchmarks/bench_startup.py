@@ -0,0 +1,81 @@
+# -------------------- IMPORTS --------------------
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+
+from src.constants import *
+
+
+# -------------------- CONSTANTS --------------------
+RUNS = 10
+IMPORT_STATEMENT = "from time import perf_counter as p; t = p(); import src.application; print(p() - t)"
+
+
+# -------------------- FUNCTIONS --------------------
+def import_time() -> float:
+    """Measures, in a fresh interpreter, the import of the modules needed to display the menu.
+
+    Returns:
+        float: the import time, in seconds.
+    """
+    output = subprocess.run([sys.executable, "-c", IMPORT_STATEMENT], cwd=ROOT, capture_output=True, text=True,
+                            check=True)
+    return float(output.stdout)
+
+
+def first_frame_time(command: list) -> float | None:
+    """Measures the time between launching the application and the display of the menu, reported by the startup
+    probe of ApplicationView.
+
+    Args:
+        command (list): the command launching the application.
+
+    Returns:
+        float|None: the time to the first frame, in seconds, None if the application could not display it.
+    """
+    environment = dict(os.environ, **{STARTUP_PROBE: "1"})
+    start = perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=environment, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               text=True)
+    for line in process.stdout:
+        if line.strip() == STARTUP_PROBE:
+            duration = perf_counter() - start
+            process.wait()
+            return duration
+    process.wait()
+    return None
+
+
+def report(name: str, durations: list) -> None:
+    """Prints the median and the best of some durations.
+
+    Args:
+        name (str): what was measured.
+        durations (list): the durations, in seconds, None when the measure failed.
+    """
+    if None in durations or not durations:
+        print(f"{name:<36}unavailable (no display?)")
+        return
+    print(f"{name:<36}median {median(durations) * 1000:8.1f} ms, best {min(durations) * 1000:8.1f} ms")
+
+
+def main() -> None:
+    """Reports the import time and the time to the first frame, from the sources and, if given, from the frozen
+    executable.
+    """
+    parser = ArgumentParser(description="Measures the cold start of the application.")
+    parser.add_argument("--frozen", help="path of the executable built by PyInstaller")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    arguments = parser.parse_args()
+
+    report("import (sources)", [import_time() for _ in range(arguments.runs)])
+    report("first frame (sources)", [first_frame_time([sys.executable, "main.py"]) for _ in range(arguments.runs)])
+    if arguments.frozen:
+        report("first frame (frozen)", [first_frame_time([arguments.frozen]) for _ in range(arguments.runs)])
+
+
+if __name__ == "__main__":
+    main()
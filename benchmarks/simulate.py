@@ -0,0 +1,341 @@
+# -------------------- IMPORTS --------------------
+import argparse
+import hashlib
+import heapq
+import json
+import sys
+from itertools import count
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+
+from src.engine import *
+from . import tk_stub
+
+
+# -------------------- CONSTANTS --------------------
+REFERENCE = Path(__file__).parent / "simulations.json"
+
+# Each scenario: the controller, then the user commands at their second of the session, and the length of the session
+SCENARIOS = {
+    # A tiers-temps exam of 4 hours (5 h 20 for the second timer), with a fire drill of 5 minutes
+    "exam": ("MultiTimerController",
+             [(0, "change_time", 240), (1, "run"), (2 * 3600, "pause"), (2 * 3600 + 300, "run")], 6 * 3600),
+    "timer": ("TimerController", [(0, "change_time", 25), (1, "run"), (600, "pause"), (660, "run")], 30 * 60),
+    "chrono": ("ChronoController", [(0, "run")] + [(minutes * 60, "lap") for minutes in range(15, 120, 15)]
+               + [(3600, "pause"), (3900, "run")], 2 * 3600),
+}
+
+
+# -------------------- CLASSES --------------------
+class VirtualLoop:
+    def __init__(self, clock) -> None:
+        """Builds an event loop standing for the Tk one, on a virtual clock: the callbacks run in the order of their
+        deadline (Tk delays are whole milliseconds), and the clock jumps to each deadline instead of waiting for it.
+        The tick scheduler waits again with a delay of 0 when it wakes up less than 1 ms before its deadline, which Tk
+        runs until the deadline: the clock jumps to it as well.
+
+        Args:
+            clock (ManualClock): the virtual clock, in nanoseconds.
+        """
+        self.clock = clock
+        self.scheduler = None
+        self.events = []
+        self.ids = count(1)
+        self.cancelled = set()
+        self.durations = []
+
+    def after(self, delay: int, callback=None, *args) -> str:
+        """Schedules a callback, as Tk's after.
+
+        Args:
+            delay (int): the amount of milliseconds before the call.
+            callback (callable): the function to call.
+            *args: its arguments.
+
+        Returns:
+            str: the identifier of the call, to cancel it.
+        """
+        number = next(self.ids)
+        identifier = f"after#{number}"
+        due = self.clock.now + delay * NS_PER_MILLISECOND
+        if not delay and self.scheduler is not None and callback == self.scheduler.tick:
+            due = max(due, self.scheduler.wake_time)
+        heapq.heappush(self.events, (due, number, identifier, callback, args))
+        return identifier
+
+    def after_idle(self, callback, *args) -> str:
+        """Schedules a callback as soon as possible, as Tk's after_idle.
+
+        Args:
+            callback (callable): the function to call.
+            *args: its arguments.
+
+        Returns:
+            str: the identifier of the call.
+        """
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, identifier: str) -> None:
+        """Cancels a call.
+
+        Args:
+            identifier (str): the identifier of the call.
+        """
+        self.cancelled.add(identifier)
+
+    def run_until(self, end: int) -> None:
+        """Makes the calls due until a time, moving the clock along, and measures the real duration of each call.
+
+        Args:
+            end (int): the virtual time to stop at, in nanoseconds.
+        """
+        while self.events and self.events[0][0] <= end:
+            deadline, number, identifier, callback, args = heapq.heappop(self.events)
+            if identifier in self.cancelled:
+                self.cancelled.discard(identifier)
+                continue
+            self.clock.now = max(self.clock.now, deadline)
+            start = perf_counter_ns()
+            callback(*args)
+            self.durations.append(perf_counter_ns() - start)
+        self.clock.now = max(self.clock.now, end)
+
+
+class Recorder:
+    def __init__(self, clock) -> None:
+        """Builds the trace of a session: every displayed value which changed, every alarm, and every transition, with
+        its virtual time.
+
+        Args:
+            clock (ManualClock): the virtual clock.
+        """
+        self.clock = clock
+        self.start = clock.now
+        self.events = []
+        self.displayed = {}
+
+    def record(self, kind: str, slot: int, value) -> None:
+        """Adds an event to the trace.
+
+        Args:
+            kind (str): "display", "lap display", "alarm", or the name of the transition.
+            slot (int): which chrono / timer.
+            value: what was displayed, None for the other events.
+        """
+        self.events.append((self.clock.now - self.start, kind, slot, value))
+
+    def display(self, *args) -> None:
+        """Records the arguments of the update_display method of a view, if its text changed: (text), (text, percent),
+        (index, text) or (index, text, percent).
+
+        Args:
+            *args: the arguments given to the view.
+        """
+        slot, text = (args[0], args[1]) if isinstance(args[0], int) else (0, args[0])
+        if self.displayed.get(slot) != text:
+            self.displayed[slot] = text
+            self.record("display", slot, text)
+
+    def lines(self):
+        """Yields the events as JSON Lines.
+
+        Yields:
+            str: a line per event.
+        """
+        for event in self.events:
+            yield json.dumps(event)
+
+    def digest(self) -> str:
+        """Returns a digest of the trace, to compare sessions without keeping every event.
+
+        Returns:
+            str: the SHA-256 of the JSON Lines.
+        """
+        digest = hashlib.sha256()
+        for line in self.lines():
+            digest.update(line.encode() + b"\n")
+        return digest.hexdigest()
+
+
+class Alarm:
+    def __init__(self, recorder: Recorder) -> None:
+        """Builds an alarm which only records that it rang.
+
+        Args:
+            recorder (Recorder): the trace.
+        """
+        self.recorder = recorder
+
+    def ring(self) -> None:
+        """Records a ring.
+        """
+        self.recorder.record("alarm", 0, None)
+
+
+class Transitions(EngineObserver):
+    def __init__(self, recorder: Recorder) -> None:
+        """Builds an observer of the engine recording its transitions.
+
+        Args:
+            recorder (Recorder): the trace.
+        """
+        self.recorder = recorder
+
+    def on_run(self, indexes: Iterable) -> None:
+        """Records chronos / timers which were run.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        for index in indexes:
+            self.recorder.record("run", index, None)
+
+    def on_pause(self, indexes: Iterable) -> None:
+        """Records chronos / timers which were paused.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        for index in indexes:
+            self.recorder.record("pause", index, None)
+
+    def on_reset(self, indexes: Iterable) -> None:
+        """Records chronos / timers which were reset.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        for index in indexes:
+            self.recorder.record("reset", index, None)
+
+    def on_add_time(self, indexes: Iterable) -> None:
+        """Records timers whose duration was adjusted.
+
+        Args:
+            indexes (Iterable): which timers.
+        """
+        for index in indexes:
+            self.recorder.record("add_time", index, None)
+
+    def on_lap(self, indexes: Iterable) -> None:
+        """Records chronos which recorded a lap.
+
+        Args:
+            indexes (Iterable): which chronos.
+        """
+        for index in indexes:
+            self.recorder.record("lap", index, None)
+
+    def on_expire(self, index: int) -> None:
+        """Records a timer which expired.
+
+        Args:
+            index (int): which timer.
+        """
+        self.recorder.record("expire", index, None)
+
+
+# -------------------- FUNCTIONS --------------------
+def simulate(name: str, events: bool = False) -> tuple:
+    """Runs a scenario on a virtual clock: the controller, its views (headless), its engine and the tick scheduler are
+    the real ones, only the clock and the Tk event loop are virtual. Rendering every decisecond of a session costs
+    seconds for hours (the 6 hour exam takes about 2 s), so the events mode drops the display ticks and the displayed
+    values: only the transitions, the expiries and the alarms are run and traced, in milliseconds.
+
+    Args:
+        name (str): the name of the scenario.
+        events (bool): whether to skip the rendering.
+
+    Returns:
+        tuple: the trace (Recorder), the loop (VirtualLoop), and the real duration of the simulation in nanoseconds.
+    """
+    from .suite import application
+    from src import controllers
+    from src.models import ManualClock
+    from src.scheduler import TickScheduler
+
+    controller_name, commands, duration = SCENARIOS[name]
+    clock = ManualClock()
+    loop = VirtualLoop(clock)
+    recorder = Recorder(clock)
+    app = application()
+    app.scheduler = loop.scheduler = TickScheduler(loop, clock=clock)
+    app.alarm = Alarm(recorder)
+
+    start = perf_counter_ns()
+    controller = getattr(controllers, controller_name)(app)
+    controller.engine.models.clock = clock
+    controller.engine.subscribe(Transitions(recorder))
+    if events:
+        # Unsubscribed by its first call, the expiries being scheduled by the engine itself
+        controller.tick = lambda: None
+        controller.view.update_display = lambda *args: None
+        controller.view.update_lap = lambda text: None
+    else:
+        controller.view.update_display = recorder.display
+        if hasattr(controller.view, "update_lap"):
+            controller.view.update_lap = lambda text: recorder.record("lap display", 0, text)
+    for second, command, *args in commands:
+        loop.run_until(recorder.start + second * NS_PER_SECOND)
+        getattr(controller, command)(*args)
+    loop.run_until(recorder.start + duration * NS_PER_SECOND)
+    controller.close()
+    return recorder, loop, perf_counter_ns() - start
+
+
+def main() -> None:
+    """Runs the scenarios, prints what each emitted and what it cost, and compares their traces with the reference.
+    Exits with 1 if a trace changed.
+    """
+    parser = argparse.ArgumentParser(description="Runs whole sessions on a virtual clock, thousands of times faster.")
+    parser.add_argument("scenarios", nargs="*", default=list(SCENARIOS), help="the scenarios to run")
+    parser.add_argument("--trace", type=Path, help="a directory to write the trace of each scenario to, as JSON Lines")
+    parser.add_argument("--reference", type=Path, default=REFERENCE, help="the traces to compare with")
+    parser.add_argument("--update-reference", action="store_true", help="save the traces as the new reference")
+    parser.add_argument("--events", action="store_true", help="skip the rendering, only run and trace the transitions, "
+                                                              "expiries and alarms")
+    args = parser.parse_args()
+
+    tk_stub.install()
+    reference = {}
+    if args.reference.exists():
+        reference = json.loads(args.reference.read_text(encoding="utf-8"))
+    changed = []
+    for name in args.scenarios:
+        recorder, loop, duration = simulate(name, args.events)
+        length = SCENARIOS[name][2]
+        alarms = [time for time, kind, slot, value in recorder.events if kind == "alarm"]
+        kinds = {}
+        for event in recorder.events:
+            kinds[event[1]] = kinds.get(event[1], 0) + 1
+        durations = sorted(loop.durations)
+        print(f"{name}: {length / 3600:.1f} h simulated in {duration / 1e6:.1f} ms "
+              f"({length * NS_PER_SECOND / duration:,.0f}x real time)")
+        print(f"    {kinds}")
+        print(f"    alarms at {[f'{time / NS_PER_SECOND:.3f} s' for time in alarms]}")
+        print(f"    {len(durations)} callbacks of the loop: median {median(durations) / 1000:.1f} us, "
+              f"p99 {durations[int(len(durations) * 0.99)] / 1000:.1f} us")
+
+        summary = {"events": len(recorder.events), "alarms": alarms, "digest": recorder.digest()}
+        key = f"{name}/events" if args.events else name
+        if args.update_reference:
+            reference[key] = summary
+        elif key in reference and reference[key] != summary:
+            changed.append(key)
+            print(f"    CHANGED: {reference[key]['events']} events in the reference")
+        if args.trace:
+            args.trace.mkdir(parents=True, exist_ok=True)
+            (args.trace / f"{name}.jsonl").write_text("".join(line + "\n" for line in recorder.lines()),
+                                                      encoding="utf-8")
+
+    if args.update_reference:
+        args.reference.write_text(json.dumps(reference, indent=2) + "\n", encoding="utf-8")
+        print(f"saved to {args.reference}")
+    if changed:
+        print(f"{len(changed)} scenario(s) changed: {', '.join(changed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
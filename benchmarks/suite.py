@@ -0,0 +1,344 @@
+# -------------------- IMPORTS --------------------
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from statistics import median
+from time import perf_counter_ns
+
+from . import tk_stub
+
+
+# -------------------- CONSTANTS --------------------
+BASELINE = Path(__file__).parent / "baseline.json"
+RESULTS = Path(__file__).parent / "results.json"
+THRESHOLD = 1.5
+# A result is only a regression if it is also slower by this amount of nanoseconds: below 1 us, 1.5x is noise
+FLOOR = 1000
+REPEAT = 7
+ROUNDS = 3
+SIZES = 1, 10, 16, 1000
+FORMAT_CALLS = 100_000
+TICKS = 200
+MODEL_OPERATIONS = 2_000
+VIEWS = 20
+CALIBRATION = 2_000
+SWITCHES = 20
+TRANSITIONS = 20
+
+
+# -------------------- CLASSES --------------------
+class NullController:
+    """Stands for the controller of a view built alone: every command does nothing.
+    """
+    def __getattr__(self, name: str):
+        """Returns a command which does nothing.
+
+        Args:
+            name (str): the name of the command.
+
+        Returns:
+            callable: the command.
+        """
+        return lambda *args: None
+
+
+# -------------------- FUNCTIONS --------------------
+def best(function, number: int) -> float:
+    """Returns the median time of a function, per call, over a few repeats.
+
+    Args:
+        function (callable): the function to time, called without arguments.
+        number (int): the amount of calls of each repeat.
+
+    Returns:
+        float: the amount of nanoseconds per call.
+    """
+    times = []
+    for _ in range(REPEAT):
+        start = perf_counter_ns()
+        for _ in range(number):
+            function()
+        times.append(perf_counter_ns() - start)
+    return median(times) / number
+
+
+def calibrate() -> float:
+    """Measures a fixed pure Python workload, so results from a slower or busier machine can be scaled before being
+    compared with the baseline.
+
+    Returns:
+        float: the amount of nanoseconds of the workload.
+    """
+    return best(lambda: sum([index * index for index in range(1000)]), CALIBRATION)
+
+
+def bench_formatting(results: dict) -> None:
+    """Measures the throughput of the formatting functions, with values changing at every call.
+
+    Args:
+        results (dict): the results, by name, in nanoseconds.
+    """
+    from src.formatting import TimeFormatter, format_time_percent, format_time_str
+
+    values = iter(range(10 ** 9))
+    formatter = TimeFormatter()
+    results["format/format_time_str"] = best(lambda: format_time_str(next(values)), FORMAT_CALLS)
+    results["format/format_time_percent"] = best(lambda: format_time_percent(next(values), 3_600_000_000_000),
+                                                 FORMAT_CALLS)
+    results["format/TimeFormatter"] = best(lambda: formatter(next(values)), FORMAT_CALLS)
+
+
+def bench_models(results: dict) -> None:
+    """Measures run then pause (a pause of a paused chrono does nothing), reset, and reading the values, of the banks
+    of chronos / timers at every size.
+
+    Args:
+        results (dict): the results, by name, in nanoseconds.
+    """
+    from src.models import TimeBank
+
+    for size in SIZES:
+        for countdown in (False, True):
+            bank = TimeBank(size, countdown=countdown)
+            name = f"model/TimeBank/{'timers' if countdown else 'chronos'}/{size}"
+            number = MODEL_OPERATIONS // size + 10
+            results[f"{name}.run+pause"] = best(lambda: (bank.run(), bank.pause()), number)
+            results[f"{name}.reset"] = best(bank.reset, number)
+            bank.run()
+            results[f"{name}.values"] = best(bank.values, number)
+
+
+def unlock_sizes() -> None:
+    """Lets the views accept up to max(SIZES) chronos, to measure how they scale. Called once tkinter is chosen.
+    """
+    from src import views
+
+    views.MAX_SIM_CHRONOS = views.MAX_MLT_CHRONOS = views.MAX_MLT_CANVAS_CHRONOS = max(SIZES)
+
+
+def application():
+    """Builds an application without running its main loop, without journal, server nor usage file.
+
+    Returns:
+        ApplicationController: the application, with its view, scheduler and pool.
+    """
+    from src.application import ApplicationController
+
+    app = ApplicationController(journal=False, server=False, usage=False, run=False)
+    app.load_pool()
+    return app
+
+
+def controllers(app) -> dict:
+    """Builds the controllers to measure, every chrono / timer running on a manual clock.
+
+    Args:
+        app (ApplicationController): the application.
+
+    Returns:
+        dict: the controllers, by name.
+    """
+    from src import controllers
+    from src.models import ManualClock
+
+    built = {
+        "ChronoController": controllers.ChronoController(app),
+        "TimerController": controllers.TimerController(app),
+        "MultiTimerController": controllers.MultiTimerController(app),
+    }
+    for size in SIZES:
+        built[f"MultiChronoController/{size}"] = controllers.MultiChronoController(app, size)
+        built[f"SimultaneousChronoController/{size}"] = controllers.SimultaneousChronoController(app, size)
+    for controller in built.values():
+        controller.engine.models.clock = ManualClock()
+        if hasattr(controller, "change_time"):
+            controller.change_time(60)
+        if isinstance(controller, controllers.MultiChronoController):
+            controller.run(0)
+        elif isinstance(controller, controllers.SimultaneousChronoController):
+            controller.run_all()
+        else:
+            controller.run()
+    return built
+
+
+def bench_ticks(results: dict, app) -> None:
+    """Measures a tick of each controller at every size, each tick displaying new values (the clock moves by a
+    decisecond between ticks). The views of several chronos have at least 2 of them.
+
+    Args:
+        results (dict): the results, by name, in nanoseconds.
+        app (ApplicationController): the application.
+    """
+    for name, controller in controllers(app).items():
+        clock = controller.engine.models.clock
+
+        def tick() -> None:
+            clock.advance(0.1)
+            controller.tick()
+
+        results[f"tick/{name}"] = best(tick, TICKS)
+        # Closed, so the scheduler does not keep its views alive during the next benchmarks
+        controller.close()
+
+
+def bench_views(results: dict, app) -> None:
+    """Measures the construction and destruction of each view, at every size for the views of several chronos.
+
+    Args:
+        results (dict): the results, by name, in nanoseconds.
+        app (ApplicationController): the application, the master of the views.
+    """
+    from src import views
+
+    controller = NullController()
+    cases = [(views.ChronoView, ()), (views.TimerView, ()), (views.MultiTimerView, (2,))]
+    cases += [(view, (size,)) for view in (views.MultiChronoView, views.MultiChronoCanvasView,
+                                           views.SimultaneousChronoView) for size in SIZES]
+    for view, args in cases:
+        built = []
+        name = f"view/{view.__name__}" + "".join(f"/{size}" for size in args[:1] if view is not views.MultiTimerView)
+        results[f"{name}/build"] = best(lambda: built.append(view(controller, *args)), VIEWS)
+        results[f"{name}/delete"] = best(lambda: built.pop().delete(), VIEWS)
+
+
+def bench_transitions(results: dict, app) -> None:
+    """Measures running then pausing the simultaneous chronos at every size, all of them, then all but the first one
+    (a selection, as when some were paused alone), through the engine and the view.
+
+    Args:
+        results (dict): the results, by name, in nanoseconds.
+        app (ApplicationController): the application.
+    """
+    from src.controllers import SimultaneousChronoController
+    from src.models import ManualClock
+
+    for size in SIZES:
+        controller = SimultaneousChronoController(app, size)
+        engine = controller.engine
+        engine.models.clock = ManualClock()
+        name = f"transition/SimultaneousChrono/{size}"
+        results[f"{name}/all.run+pause"] = best(lambda: (engine.run(), engine.pause()), TRANSITIONS)
+        selection = range(1, size)
+        results[f"{name}/some.run+pause"] = best(lambda: (engine.run(selection), engine.pause(selection)), TRANSITIONS)
+        results[f"{name}/all.reset"] = best(engine.reset, TRANSITIONS)
+        controller.close()
+
+
+def bench_switches(results: dict, app) -> None:
+    """Measures opening a mode from the menu then going back to the menu, with every mode closed when left (cold),
+    then with the modes kept by the pool (warm).
+
+    Args:
+        results (dict): the results, by name, in nanoseconds.
+        app (ApplicationController): the application.
+    """
+    from src.pool import ModePool
+
+    def switch(mode: int, size: int) -> None:
+        app.open_mode(mode, size)
+        app.type_app.destroy()
+
+    # The timers never run here, so no alarm player is started
+    alarm, app.alarm = app.alarm, NullController()
+    pool = app.pool
+    for name, size in (("cold", 0), ("warm", pool.size)):
+        app.pool = ModePool(size, usage_path=None)
+        for mode, nb_chronos in ((1, 0), (2, 10), (3, 16), (4, 0), (5, 0)):
+            results[f"switch/{name}/{mode}/{nb_chronos}"] = best(lambda: switch(mode, nb_chronos), SWITCHES)
+        while app.pool.modes:
+            app.pool.modes.popitem()[1].close()
+    app.pool, app.alarm = pool, alarm
+
+
+def measure(app) -> tuple:
+    """Runs every benchmark once, after a calibration.
+
+    Args:
+        app (ApplicationController): the application.
+
+    Returns:
+        tuple: the calibration, and the results by name, in nanoseconds.
+    """
+    results = {}
+    calibration = calibrate()
+    bench_formatting(results)
+    bench_models(results)
+    bench_ticks(results, app)
+    bench_views(results, app)
+    bench_transitions(results, app)
+    bench_switches(results, app)
+    return calibration, results
+
+
+def compare(report: dict, baseline: dict, threshold: float, floor: float) -> list:
+    """Prints the results next to the baseline. Ratios are scaled by the calibrations of both runs.
+
+    Args:
+        report (dict): the results, by name, in nanoseconds, and the calibration.
+        baseline (dict): the baseline results and calibration, empty if there is no baseline.
+        threshold (float): the ratio to the baseline above which a result is a regression.
+        floor (float): the amount of nanoseconds a regression is at least slower by than the baseline.
+
+    Returns:
+        list: the names of the regressions.
+    """
+    regressions = []
+    scale = baseline.get("calibration", report["calibration"]) / report["calibration"]
+    for name, value in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference:
+            ratio = value * scale / reference
+            flag = "  REGRESSION" if ratio > threshold and value * scale - reference > floor else ""
+            if flag:
+                regressions.append(name)
+            print(f"{name:<58}{value:14.0f} ns{reference:14.0f} ns{ratio:8.2f}x{flag}")
+        else:
+            print(f"{name:<58}{value:14.0f} ns{'-':>17}")
+    return regressions
+
+
+def main() -> None:
+    """Runs the suite a few times, saves the median of each result as JSON, and compares them to the baseline. Exits
+    with 1 on regression.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks the formatting, the models, the ticks and the views.")
+    parser.add_argument("--tk", action="store_true", help="use the real Tk (needs a display, or xvfb-run)")
+    parser.add_argument("--output", type=Path, default=RESULTS, help="where to save the results")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="the results to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="save the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="the ratio flagged as a regression")
+    parser.add_argument("--floor", type=float, default=FLOOR, help="the nanoseconds a regression is at least slower by")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="the amount of runs of the suite")
+    args = parser.parse_args()
+
+    if not args.tk:
+        tk_stub.install()
+    unlock_sizes()
+
+    app = application()
+    # Whole runs are repeated, so a slow phase of the machine only affects one of them
+    runs = [measure(app) for _ in range(args.rounds)]
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "tk": "real" if args.tk else "stub",
+        "calibration": median(calibration for calibration, results in runs),
+        "results": {name: median(results[name] for calibration, results in runs) for name in runs[0][1]},
+    }
+    path = args.baseline if args.update_baseline else args.output
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    baseline = {}
+    if args.baseline.exists() and not args.update_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(report, baseline, args.threshold, args.floor)
+    print(f"saved to {path}")
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold}x the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
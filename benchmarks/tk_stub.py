@@ -0,0 +1,249 @@
+# -------------------- IMPORTS --------------------
+import sys
+import types
+from itertools import count
+
+
+# -------------------- CONSTANTS --------------------
+NORMAL = "normal"
+DISABLED = "disabled"
+END = "end"
+LEFT = "left"
+NE = "ne"
+NW = "nw"
+NS = "ns"
+W = "w"
+HIDDEN = "hidden"
+INSERT = "insert"
+VERTICAL = "vertical"
+
+# The first Tk built, used by the widgets built without a master, as in tkinter
+default_root = None
+
+
+# -------------------- CLASSES --------------------
+class Misc:
+    ids = count(1)
+
+    def __init__(self, master=None, *args, **options) -> None:
+        """Builds a widget which does nothing, so views can be built and driven without a display. Only the Python side
+        of the views is measured.
+
+        Args:
+            master (Misc|None): the parent widget, the default root if None.
+            *args: ignored.
+            **options: the options of the widget.
+        """
+        self.master = master if master is not None else default_root
+        self.options = options
+
+    def config(self, **options) -> None:
+        self.options.update(options)
+
+    configure = config
+
+    def grid(self, **options) -> None:
+        pass
+
+    def grid_forget(self) -> None:
+        pass
+
+    def grid_remove(self) -> None:
+        pass
+
+    def place(self, **options) -> None:
+        pass
+
+    def place_forget(self) -> None:
+        pass
+
+    def lift(self) -> None:
+        pass
+
+    def bind(self, sequence: str, callback) -> None:
+        pass
+
+    def bind_all(self, sequence: str, callback) -> None:
+        pass
+
+    def register(self, callback) -> str:
+        return callback.__name__
+
+    def focus_set(self) -> None:
+        pass
+
+    def destroy(self) -> None:
+        pass
+
+    def winfo_exists(self) -> int:
+        return 1
+
+    def after(self, delay: int, callback=None, *args) -> str:
+        return f"after#{next(self.ids)}"
+
+    def after_idle(self, callback, *args) -> str:
+        return self.after(0, callback, *args)
+
+    def after_cancel(self, identifier: str) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def update_idletasks(self) -> None:
+        pass
+
+    def wait_visibility(self) -> None:
+        pass
+
+
+class Tk(Misc):
+    def __init__(self, *args, **options) -> None:
+        """Builds a root window, which becomes the default root.
+        """
+        global default_root
+        super().__init__(None)
+        self.master = None
+        if default_root is None:
+            default_root = self
+
+    def title(self, text: str) -> None:
+        pass
+
+    def iconbitmap(self, path) -> None:
+        pass
+
+    def mainloop(self) -> None:
+        pass
+
+
+class Frame(Misc):
+    pass
+
+
+class Button(Misc):
+    pass
+
+
+class Label(Misc):
+    pass
+
+
+class Entry(Misc):
+    def __init__(self, master=None, **options) -> None:
+        super().__init__(master, **options)
+        self.text = ""
+
+    def get(self) -> str:
+        return self.text
+
+    def delete(self, first, last=None) -> None:
+        self.text = ""
+
+    def insert(self, index, text) -> None:
+        self.text = str(text) + self.text
+
+    def icursor(self, index) -> None:
+        pass
+
+
+class Spinbox(Entry):
+    def __init__(self, master=None, **options) -> None:
+        super().__init__(master, **options)
+        self.text = str(options.get("from_", 0))
+
+
+class Scrollbar(Misc):
+    def set(self, first: float, last: float) -> None:
+        pass
+
+
+class Canvas(Misc):
+    def __init__(self, master=None, **options) -> None:
+        super().__init__(master, **options)
+        self.texts = {}
+
+    def create_oval(self, *coords, **options) -> int:
+        return next(self.ids)
+
+    def create_arc(self, *coords, **options) -> int:
+        return next(self.ids)
+
+    def create_rectangle(self, *coords, **options) -> int:
+        return next(self.ids)
+
+    def create_polygon(self, *coords, **options) -> int:
+        return next(self.ids)
+
+    def create_image(self, *coords, **options) -> int:
+        return next(self.ids)
+
+    def create_window(self, *coords, **options) -> int:
+        return next(self.ids)
+
+    def delete(self, item: int) -> None:
+        pass
+
+    def create_text(self, *coords, **options) -> int:
+        item = next(self.ids)
+        self.texts[item] = str(options.get("text", ""))
+        return item
+
+    def itemconfig(self, item: int | str, **options) -> None:
+        if "text" in options:
+            self.texts[item] = str(options["text"])
+
+    def itemcget(self, item: int, option: str) -> str:
+        return self.texts.get(item, "")
+
+    def dchars(self, item: int, first, last=None) -> None:
+        self.texts[item] = ""
+
+    def canvasy(self, y: int) -> float:
+        return float(y)
+
+    def yview(self, *args) -> None:
+        pass
+
+    def yview_scroll(self, number: int, what: str) -> None:
+        pass
+
+    def yview_moveto(self, fraction: float) -> None:
+        pass
+
+
+class StringVar:
+    def __init__(self, master=None, value: str = "") -> None:
+        self.value = value
+
+    def set(self, value: str) -> None:
+        self.value = value
+
+    def get(self) -> str:
+        return self.value
+
+
+class PhotoImage:
+    def __init__(self, *args, **options) -> None:
+        self.options = options
+
+    def subsample(self, x: int, y: int | None = None) -> "PhotoImage":
+        return PhotoImage(**self.options)
+
+    def copy(self) -> "PhotoImage":
+        return PhotoImage(**self.options)
+
+    def put(self, data, to=None) -> None:
+        pass
+
+
+# -------------------- FUNCTIONS --------------------
+def install() -> None:
+    """Replaces tkinter by this module, before the views are imported.
+    """
+    module = sys.modules[__name__]
+    module.__all__ = ["NORMAL", "DISABLED", "END", "LEFT", "NE", "NW", "NS", "W", "HIDDEN", "INSERT", "VERTICAL",
+                      "Misc", "Tk", "Frame", "Button", "Label", "Entry", "Spinbox", "Scrollbar", "Canvas", "StringVar",
+                      "PhotoImage"]
+    sys.modules["tkinter"] = module
+    sys.modules["tkinter.filedialog"] = types.SimpleNamespace(asksaveasfilename=lambda **options: "")
@@ -1,4 +1,4 @@
-from src import controllers
+from src import application
 
 
-app = controllers.ApplicationController()
+app = application.ApplicationController()
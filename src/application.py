@@ -0,0 +1,243 @@
+# -------------------- IMPORTS --------------------
+from os import environ
+
+from .scheduler import *
+from .views import *
+
+
+# -------------------- CLASSES --------------------
+class ApplicationController:
+    def __init__(self, journal: bool = True, server: bool = True, usage: bool = True, run: bool = True) -> None:
+        """Builds the application. Only the menu is loaded at startup, the controllers of the modes are imported when
+        a mode is built for the first time.
+
+        Args:
+            journal (bool): whether the session is journaled, and restored after a crash.
+            server (bool): whether the remote displays are served, if the SERVER environment variable is set.
+            usage (bool): whether the uses of the modes are read from, and saved to, the usage file.
+            run (bool): whether the main loop runs until the window is closed, False to drive the application from a
+                script (the benchmarks).
+        """
+        self.view = ApplicationView(self)
+        self.scheduler = TickScheduler(self.view)
+        self.type_app = None
+        self.mode_key = None
+        self.pool = None
+        self.usage_path = USAGE if usage else None
+        self.alarm = None
+        self.journal = None
+        self.server = None
+        self.probe = None
+        self.debug_refresh = None
+        if journal:
+            self.view.after_idle(self.open_journal)
+        if server and environ.get(SERVER):
+            self.view.after_idle(self.open_server)
+        self.view.after(POOL_PREBUILD_MS, self.prebuild)
+        if run:
+            self.view.launch_app()
+            self.close()
+
+    def close(self) -> None:
+        """Releases what the application started, once its window is closed: the alarm worker and its sink, the
+        server of the remote displays, and the journal, which records the end of the session so a normal exit is not
+        restored as a crash.
+        """
+        if self.alarm is not None:
+            self.alarm.close()
+            self.alarm = None
+        if self.server is not None:
+            self.server.stop()
+            self.server = None
+        if self.journal is not None:
+            self.journal.detach()
+            self.journal.close()
+            self.journal = None
+        if self.pool is not None:
+            self.pool.save_usage()
+
+    def open_journal(self) -> None:
+        """Opens the session journal once the menu is displayed, and restores the session interrupted by a crash, if
+        any. The JOURNAL_FILE environment variable chooses another file, or turns the journal off. The application runs
+        without a journal if the file cannot be opened.
+        """
+        from .journal import SessionJournal
+
+        path = environ.get(JOURNAL_FILE) or JOURNAL
+        if path == JOURNAL_OFF:
+            return
+        try:
+            self.journal = SessionJournal(path)
+        except OSError:
+            return
+        session = self.journal.replay()
+        if session is not None:
+            self.view.restore_app(session.mode, session.size)
+            self.journal.resume(self.type_app.engine, session)
+            self.scheduler.subscribe(self.type_app.tick)
+
+    def open_server(self) -> None:
+        """Starts the server of the remote displays, on the port (or host:port) of the SERVER environment variable.
+        The application runs without it if the port is unavailable or the web stack is not installed.
+        """
+        from .server import StateServer
+
+        host, _, port = environ[SERVER].rpartition(":")
+        try:
+            server = StateServer(host or SERVER_HOST, int(port))
+            server.start()
+        except (ImportError, OSError, ValueError):
+            return
+        self.server = server
+        if self.type_app is not None:
+            self.server.publisher.attach(self.type_app.engine, self.mode_key[0])
+
+    def toggle_debug(self) -> None:
+        """Shows the tick instrumentation overlay, or hides it. The refresh loop is only instrumented while the
+        overlay is shown.
+        """
+        if self.probe is None:
+            from .instrumentation import TickProbe
+
+            self.probe = TickProbe(self.scheduler)
+            self.probe.install()
+            self.refresh_debug()
+        else:
+            self.probe.uninstall()
+            self.probe = None
+            self.view.after_cancel(self.debug_refresh)
+            self.view.hide_overlay()
+
+    def refresh_debug(self) -> None:
+        """Displays the histograms of the instrumentation, periodically while the overlay is shown.
+        """
+        self.view.show_overlay(self.probe.report())
+        self.debug_refresh = self.view.after(DEBUG_REFRESH_MS, self.refresh_debug)
+
+    def dump_debug(self) -> None:
+        """Writes the histograms of the instrumentation to a file, if the overlay is shown.
+        """
+        if self.probe is not None:
+            self.probe.dump(DEBUG_DUMP)
+
+    def record_session(self, mode: int) -> None:
+        """Starts journaling, and publishing to the remote displays, the mode which was just built.
+
+        Args:
+            mode (int): the index of the mode in the menu.
+        """
+        if self.journal is not None:
+            self.journal.attach(self.type_app.engine, mode)
+        if self.server is not None:
+            self.server.publisher.attach(self.type_app.engine, mode)
+
+    def load_alarm(self) -> None:
+        """Starts the application-wide alarm player, when the first timer is shown. Its worker thread decodes the
+        sound in advance, so nothing is read from the disk when a timer expires.
+        """
+        if self.alarm is None:
+            from .audio import AlarmPlayer
+
+            self.alarm = AlarmPlayer()
+
+    def load_pool(self) -> None:
+        """Creates the pool of the modes, when a mode is opened or prebuilt for the first time.
+        """
+        if self.pool is None:
+            from .pool import ModePool
+
+            self.pool = ModePool(usage_path=self.usage_path)
+
+    def build_mode(self, mode: int, size: int = 0):
+        """Builds the controller and the view of a mode.
+
+        Args:
+            mode (int): the index of the mode in the menu.
+            size (int): the amount of chronos, for the modes of several chronos.
+
+        Returns:
+            ModeController: the controller of the mode.
+        """
+        from . import controllers
+
+        match mode:
+            case 1:
+                return controllers.ChronoController(self)
+            case 2:
+                return controllers.MultiChronoController(self, nb_chronos=size)
+            case 3:
+                return controllers.SimultaneousChronoController(self, nb_chronos=size)
+            case 4:
+                return controllers.TimerController(self)
+            case 5:
+                return controllers.MultiTimerController(self)
+
+    def open_mode(self, mode: int, size: int = 0) -> None:
+        """Shows a mode, reused from the pool if the user already opened it, built otherwise. The alarm player is
+        started when a timer is shown, not when it is prebuilt.
+
+        Args:
+            mode (int): the index of the mode in the menu.
+            size (int): the amount of chronos, for the modes of several chronos.
+        """
+        self.load_pool()
+        self.view.hide_menu()
+        if mode in (4, 5):
+            self.load_alarm()
+        self.mode_key = mode, built_size(mode, size)
+        self.type_app = self.pool.take(self.mode_key)
+        if self.type_app is None:
+            self.type_app = self.build_mode(*self.mode_key)
+        else:
+            self.type_app.show()
+        self.pool.count(self.mode_key)
+        self.record_session(mode)
+
+    def prebuild(self) -> None:
+        """Builds, hidden, the most used mode which is neither in the pool nor displayed, then schedules the next
+        one. A single mode is built at a time, so the menu stays responsive.
+        """
+        self.load_pool()
+        for mode, size in self.pool.most_used(POOL_PREBUILD):
+            key = mode, built_size(mode, size)
+            if key not in self.pool and key != self.mode_key:
+                self.pool.release(key, self.build_mode(*key))
+                self.view.after(POOL_PREBUILD_MS, self.prebuild)
+                return
+
+    def build_one_chrono(self) -> None:
+        """Builds a chrono.
+        """
+        self.open_mode(1)
+
+    def build_mlt_chrono(self) -> None:
+        """Builds an aleternate multichrono.
+        """
+        self.open_mode(2, self.view.nb_mlt_chronos)
+
+    def build_one_timer(self) -> None:
+        """Builds a timer.
+        """
+        self.open_mode(4)
+
+    def build_mlt_timer(self) -> None:
+        """Builds 2 timers, the second one counts 4/3 the other.
+        """
+        self.open_mode(5)
+
+    def build_sim_chronos(self):
+        """Builds a simultaneous multichrono.
+        """
+        self.open_mode(3, self.view.nb_sim_chronos)
+
+    def reset_application(self) -> None:
+        """Resets the application, displaying the main menu. The session is over, it will not be restored. The mode
+        is hidden and reset in the pool, to be shown again.
+        """
+        if self.journal is not None:
+            self.journal.detach()
+        if self.server is not None:
+            self.server.publisher.detach()
+        self.pool.release(self.mode_key, self.type_app)
+        self.type_app = self.mode_key = None
+        self.view.show_menu()
@@ -0,0 +1,423 @@
+# -------------------- IMPORTS --------------------
+import io
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import wave
+from array import array
+from time import monotonic_ns
+
+from .constants import *
+
+
+# -------------------- CONSTANTS --------------------
+# Swaps the unsigned 8-bit samples of a WAV file with signed bytes, both ways.
+SIGN_8_BITS = bytes((byte + 128) % 256 for byte in range(256))
+
+
+# -------------------- CLASSES --------------------
+class Sound:
+    def __init__(self, channels: int, width: int, rate: int, samples: array) -> None:
+        """Builds a decoded sound. Samples are interleaved and stored as 32-bit integers aligned on the most
+        significant bits, whatever the width of the file, so they can be mixed without scaling.
+
+        Args:
+            channels (int): the amount of channels.
+            width (int): the size of a sample in the file, in bytes.
+            rate (int): the amount of frames per second.
+            samples (array): the samples, as an array of 'i'.
+        """
+        self.channels = channels
+        self.width = width
+        self.rate = rate
+        self.samples = samples
+        self.data = self.encode(samples)
+
+    @classmethod
+    def load(cls, path) -> "Sound":
+        """Decodes a PCM WAV file.
+
+        Args:
+            path (Path|str): the file to read.
+
+        Returns:
+            Sound: the decoded sound.
+        """
+        with wave.open(str(path), "rb") as file:
+            channels, width, rate = file.getnchannels(), file.getsampwidth(), file.getframerate()
+            data = file.readframes(file.getnframes())
+        if width == 1:
+            data = data.translate(SIGN_8_BITS)
+        aligned = bytearray(4 * (len(data) // width))
+        for byte in range(width):
+            aligned[4 - width + byte::4] = data[byte::width]
+        samples = array("i", aligned)
+        if sys.byteorder == "big":
+            samples.byteswap()
+        return cls(channels, width, rate, samples)
+
+    def __len__(self) -> int:
+        """Returns the amount of frames.
+
+        Returns:
+            int: the length of the sound, in frames.
+        """
+        return len(self.samples) // self.channels
+
+    def frames(self, ns: int) -> int:
+        """Converts a duration to an amount of frames.
+
+        Args:
+            ns (int): the duration, in nanoseconds.
+
+        Returns:
+            int: the amount of frames played during this duration.
+        """
+        return ns * self.rate // NS_PER_SECOND
+
+    def encode(self, samples: array) -> bytes:
+        """Converts aligned samples back to the PCM format of the file.
+
+        Args:
+            samples (array): the samples, as an array of 'i'.
+
+        Returns:
+            bytes: the PCM frames.
+        """
+        if sys.byteorder == "big":
+            samples = array("i", samples)
+            samples.byteswap()
+        aligned = samples.tobytes()
+        data = bytearray(len(samples) * self.width)
+        for byte in range(self.width):
+            data[byte::self.width] = aligned[4 - self.width + byte::4]
+        if self.width == 1:
+            return bytes(data.translate(SIGN_8_BITS))
+        return bytes(data)
+
+    def mix(self, offsets: list) -> bytes:
+        """Mixes several plays of the sound, each one started some frames ago, from now until the last one ends.
+
+        Args:
+            offsets (list): the amount of frames already played, for each play.
+
+        Returns:
+            bytes: the PCM frames of the mix.
+        """
+        starts = sorted(offset * self.channels for offset in offsets if offset < len(self))
+        if not starts:
+            return b""
+        if len(starts) == 1:
+            return self.data[starts[0] * self.width:]
+        mix = self.samples[starts[0]:].tolist()
+        for start in starts[1:]:
+            mix[:len(self.samples) - start] = [mixed + sample for mixed, sample in zip(mix, self.samples[start:])]
+        mix = [-0x80000000 if sample < -0x80000000 else 0x7FFFFFFF if sample > 0x7FFFFFFF else sample for sample in mix]
+        return self.encode(array("i", mix))
+
+    def to_bytes(self, data: bytes) -> bytes:
+        """Builds a WAV file in memory from PCM frames of this sound format: only a header is added to the frames.
+
+        Args:
+            data (bytes): the PCM frames.
+
+        Returns:
+            bytes: the content of the WAV file.
+        """
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as file:
+            file.setnchannels(self.channels)
+            file.setsampwidth(self.width)
+            file.setframerate(self.rate)
+            file.writeframes(data)
+        return buffer.getvalue()
+
+    def to_wav(self, data: bytes, path) -> None:
+        """Writes PCM frames of this sound format to a WAV file.
+
+        Args:
+            data (bytes): the PCM frames.
+            path (Path|str): the file to write.
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes(data))
+
+
+class AudioSink:
+    """Receives the mixes of an AlarmPlayer. Every method does nothing, subclasses override what they need. A mix
+    replaces whatever the sink was playing, as it already contains the end of the previous plays.
+    """
+    def play(self, sound: Sound, data: bytes, when: int) -> None:
+        """Plays PCM frames, stopping the previous ones.
+
+        Args:
+            sound (Sound): the format of the frames.
+            data (bytes): the PCM frames.
+            when (int): the time the frames start, in nanoseconds.
+        """
+
+    def close(self) -> None:
+        """Stops playing and releases the sink.
+        """
+
+
+class NullSink(AudioSink):
+    def __init__(self) -> None:
+        """Builds a silent sink, which only counts what it is asked to play. Used when no audio device is available.
+        """
+        self.plays = 0
+        self.last = b""
+
+    def play(self, sound: Sound, data: bytes, when: int) -> None:
+        """Records a mix without playing it.
+
+        Args:
+            sound (Sound): the format of the frames.
+            data (bytes): the PCM frames.
+            when (int): the time the frames start, in nanoseconds.
+        """
+        self.plays += 1
+        self.last = data
+
+
+class WaveFileSink(AudioSink):
+    def __init__(self, path) -> None:
+        """Builds a sink recording what would be heard to a WAV file, each mix overwriting the tail of the previous
+        one from its start time. The file is written when the sink is closed.
+
+        Args:
+            path (Path|str): the file to write.
+        """
+        self.path = path
+        self.sound = None
+        self.origin = None
+        self.data = bytearray()
+
+    def play(self, sound: Sound, data: bytes, when: int) -> None:
+        """Records a mix at its position in time.
+
+        Args:
+            sound (Sound): the format of the frames.
+            data (bytes): the PCM frames.
+            when (int): the time the frames start, in nanoseconds.
+        """
+        if self.origin is None:
+            self.sound, self.origin = sound, when
+        position = sound.frames(when - self.origin) * sound.channels * sound.width
+        if position > len(self.data):
+            self.data.extend(bytes(position - len(self.data)))
+        self.data[position:] = data
+
+    def close(self) -> None:
+        """Writes the recorded frames.
+        """
+        if self.sound is not None:
+            self.sound.to_wav(self.data, self.path)
+
+
+class WinSoundSink(AudioSink):
+    def __init__(self) -> None:
+        """Builds a sink playing through winsound, from memory. winsound cannot play from memory asynchronously, so
+        a playback thread plays the mixes one after the other, each new mix stopping the previous one.
+        """
+        import winsound
+
+        self.winsound = winsound
+        self.mixes = queue.Queue()
+        self.player = threading.Thread(target=self.work, name="alarm playback", daemon=True)
+        self.player.start()
+
+    def play(self, sound: Sound, data: bytes, when: int) -> None:
+        """Plays a mix, replacing the previous one. The sound playing is stopped before the mix is queued, so the stop
+        cannot silence the new mix if the playback thread was idle.
+
+        Args:
+            sound (Sound): the format of the frames.
+            data (bytes): the PCM frames.
+            when (int): the time the frames start, in nanoseconds.
+        """
+        image = sound.to_bytes(data)
+        self.winsound.PlaySound(None, 0)
+        self.mixes.put(image)
+
+    def work(self) -> None:
+        """Plays the latest mix, until closed.
+        """
+        while True:
+            image = self.mixes.get()
+            while not self.mixes.empty():
+                image = self.mixes.get_nowait()
+            if image is None:
+                return
+            self.winsound.PlaySound(image, self.winsound.SND_MEMORY)
+
+    def close(self) -> None:
+        """Stops playing and the playback thread.
+        """
+        self.mixes.put(None)
+        self.winsound.PlaySound(None, 0)
+        self.player.join()
+
+
+class CommandSink(AudioSink):
+    def __init__(self, command: str) -> None:
+        """Builds a sink playing through a command line player (paplay, aplay) reading a WAV file from its standard
+        input: the mix is piped from memory, nothing is written to the disk.
+
+        Args:
+            command (str): the player, found in the PATH.
+        """
+        self.arguments = (command, *ALARM_PLAYERS.get(command, ()))
+        self.process = None
+
+    def play(self, sound: Sound, data: bytes, when: int) -> None:
+        """Plays a mix in a new process, stopping the previous one. The mix is fed by a thread, as the player reads
+        it at the pace of the sound.
+
+        Args:
+            sound (Sound): the format of the frames.
+            data (bytes): the PCM frames.
+            when (int): the time the frames start, in nanoseconds.
+        """
+        self.stop()
+        self.process = subprocess.Popen(
+            self.arguments, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        feeder = threading.Thread(target=self.feed, args=(self.process, sound.to_bytes(data)), name="alarm playback",
+                                  daemon=True)
+        feeder.start()
+
+    @staticmethod
+    def feed(process: subprocess.Popen, image: bytes) -> None:
+        """Writes a WAV file to the standard input of a player. A stopped player closes the pipe, which is harmless.
+
+        Args:
+            process (Popen): the player.
+            image (bytes): the content of the WAV file.
+        """
+        try:
+            process.stdin.write(image)
+            process.stdin.close()
+        except OSError:
+            pass
+
+    def stop(self) -> None:
+        """Stops the process playing the previous mix.
+        """
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            self.process.wait()
+        self.process = None
+
+    def close(self) -> None:
+        """Stops playing.
+        """
+        self.stop()
+
+
+class FileCommandSink(CommandSink):
+    def __init__(self, command: str) -> None:
+        """Builds a sink playing through a command line player which only reads files (afplay). The mix is written
+        to a temporary file only when it differs from the one already written, so a lone ring, which plays the whole
+        sound, is written once. The file is removed when the sink is closed.
+
+        Args:
+            command (str): the player, found in the PATH.
+        """
+        super().__init__(command)
+        self.path = os.path.join(tempfile.gettempdir(), f"time_manager_alarm_{os.getpid()}.wav")
+        self.written = None
+
+    def play(self, sound: Sound, data: bytes, when: int) -> None:
+        """Plays a mix in a new process, stopping the previous one.
+
+        Args:
+            sound (Sound): the format of the frames.
+            data (bytes): the PCM frames.
+            when (int): the time the frames start, in nanoseconds.
+        """
+        self.stop()
+        if data != self.written:
+            sound.to_wav(data, self.path)
+            self.written = data
+        self.process = subprocess.Popen(
+            (*self.arguments, self.path), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+    def close(self) -> None:
+        """Stops playing and removes the temporary file.
+        """
+        self.stop()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class AlarmPlayer:
+    def __init__(self, path=ALARM, sink: AudioSink | None = None, clock=monotonic_ns) -> None:
+        """Builds the alarm player. A worker thread decodes the sound once, then waits for rings: the Tk thread only
+        posts a time to a queue. Rings which overlap are mixed, each one continuing from where it is.
+
+        Args:
+            path (Path|str): the WAV file of the alarm.
+            sink (AudioSink|None): where the mixes are played, the best available one if None.
+            clock (Callable): the clock the rings are timed with.
+        """
+        self.path = path
+        self.sink = sink
+        self.clock = clock
+        self.sound = None
+        self.voices = []
+        self.requests = queue.Queue()
+        self.worker = threading.Thread(target=self.work, name="alarm", daemon=True)
+        self.worker.start()
+
+    def ring(self) -> None:
+        """Plays the alarm, without blocking.
+        """
+        self.requests.put(self.clock())
+
+    def close(self) -> None:
+        """Stops the worker and releases the sink.
+        """
+        self.requests.put(None)
+        self.worker.join()
+
+    def work(self) -> None:
+        """Loads the sound and the sink, then mixes the rings until closed. Rings posted together are mixed at once.
+        """
+        self.sound = Sound.load(self.path)
+        if self.sink is None:
+            self.sink = default_sink()
+        while True:
+            rings = [self.requests.get()]
+            while not self.requests.empty():
+                rings.append(self.requests.get_nowait())
+            if None in rings:
+                break
+            now = self.clock()
+            self.voices = [start for start in self.voices if self.sound.frames(now - start) < len(self.sound)]
+            self.voices.extend(rings)
+            self.sink.play(self.sound, self.sound.mix([self.sound.frames(now - start) for start in self.voices]), now)
+        self.sink.close()
+
+
+# -------------------- FUNCTIONS --------------------
+def default_sink() -> AudioSink:
+    """Returns the best sink available: winsound on Windows, a command line player reading a pipe, afplay on macOS,
+    silence otherwise.
+
+    Returns:
+        AudioSink: the sink to play the alarms.
+    """
+    if sys.platform == "win32":
+        return WinSoundSink()
+    for command in ALARM_PLAYERS:
+        if shutil.which(command):
+            return CommandSink(command)
+    if shutil.which(FILE_ALARM_PLAYER):
+        return FileCommandSink(FILE_ALARM_PLAYER)
+    return NullSink()
@@ -14,10 +14,15 @@ MULTICHRONO = "Chronomètres alternés"
 TIMER = "Minuteur"
 MULTITIMER = "Minuteur Tiers Temps"
 SIMCHRONOS = "Chronomètres simultanés"
+LAP = "Tour"
+EXPORT = "Exporter"
+EXPORT_TYPES = ("CSV", "*.csv"), ("JSON Lines", "*.jsonl")
+EXPORT_ERROR = "Export impossible"
 
 # Dimensions
 BUTTON_WIDTH = 30
-SPINBOX_WIDTH = 2
+# Wide enough for the largest amount of chronos of the menu (MAX_SIM_CHRONOS)
+SPINBOX_WIDTH = 3
 SMALL_DIAMETER = 120
 BIG_DIAMETER = 240
 MARGIN = 4
@@ -26,6 +31,9 @@ BIG_PAD = 10
 
 # Sounds
 ALARM = ASSETS / "alarm.wav"
+# The players reading a WAV file from their standard input, with their options, then the one which needs a file
+ALARM_PLAYERS = {"paplay": (), "aplay": ("-q",)}
+FILE_ALARM_PLAYER = "afplay"
 
 # Fonts
 SMALL_FONT = "Verdana", 12
@@ -40,6 +48,11 @@ PAUSE = ASSETS / "pause.png"
 RESET = ASSETS / "reset.png"
 DOWN = ASSETS / "down.png"
 UP = ASSETS / "up.png"
+IMAGE_CACHE_SIZE = 32
+
+# Pre-rendered clock faces of the timers: amount of angles of the slice, and of faces kept
+CLOCK_FACE_STEPS = 120
+CLOCK_FACE_CACHE_SIZE = 16
 
 # Colors
 CHRONO_COLOR = "#909090"
@@ -49,5 +62,61 @@ TXT_COLOR = "#000000"
 # Time Manager
 COEFFICIENT = 4/3
 NUMBER = 2
-MAX_SIM_CHRONOS = 16
+MAX_SIM_CHRONOS = 500
+SIM_VISIBLE_ROWS = 16
+WHEEL_ROWS = 3
 MAX_MLT_CHRONOS = 10
+MAX_MLT_CANVAS_CHRONOS = 100
+MLT_VISIBLE_ROWS = 12
+ROW_HEIGHT = 44
+NAME_CHARS = 16
+
+# Time units
+NS_PER_SECOND = 1_000_000_000
+NS_PER_DECISECOND = 100_000_000
+NS_PER_MILLISECOND = 1_000_000
+NS_PER_MICROSECOND = 1_000
+
+# Journal
+JOURNAL = Path.home() / ".time_manager.journal"
+# The environment variable choosing another journal file, or turning the journal off
+JOURNAL_FILE = "TIME_MANAGER_JOURNAL"
+JOURNAL_OFF = "off"
+JOURNAL_RECORDS = 4096
+
+# Pool of the modes
+POOL_SIZE = 3
+POOL_PREBUILD = 2
+POOL_PREBUILD_MS = 500
+USAGE = Path.home() / ".time_manager.usage.json"
+
+# Server of the remote displays, started if the variable is set to a port, or host:port
+SERVER = "TIME_MANAGER_SERVER"
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8037
+
+# Host of the sessions
+HOST_PORT = 8038
+# The largest amount of chronos / timers of a hosted session
+HOST_MAX_SIZE = 1000
+WHEEL_RESOLUTION_NS = 10 * NS_PER_MILLISECOND
+WHEEL_BITS = 6
+WHEEL_LEVELS = 4
+
+# Debug
+DEBUG_KEY = "<F12>"
+DEBUG_DUMP_KEY = "<Control-F12>"
+DEBUG_DUMP = Path.home() / "time_manager_ticks.json"
+DEBUG_FONT = "Courier", 9
+DEBUG_REFRESH_MS = 500
+HISTOGRAM_BUCKETS = 32
+
+# Startup
+STARTUP_PROBE = "TIME_MANAGER_STARTUP_PROBE"
+
+# Renderer of the alternate chronos, "canvas" to draw up to MAX_MLT_CANVAS_CHRONOS of them on a single scrollable
+# canvas, a row of widgets per chrono otherwise
+MLT_RENDERER = "TIME_MANAGER_MLT_RENDERER"
+
+# Renderer of the clocks of the timers, "sprites" for pre-rendered faces, a pie slice drawn by Tk otherwise
+ARC_RENDERER = "TIME_MANAGER_ARC_RENDERER"
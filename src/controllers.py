@@ -1,250 +1,345 @@
 # -------------------- IMPORTS --------------------
-import winsound
-
-from .models import *
+from .application import *
+from .engine import *
+from .export import *
+from .formatting import *
 from .views import *
         
         
 # -------------------- CLASSES --------------------
-class ApplicationController:
-    def __init__(self) -> None:
-        """Builds the application.
-        """
-        self.view = ApplicationView(self)
-        self.type_app = None
-        self.view.launch_app()
-
-    def build_one_chrono(self) -> None:
-        """Builds a chrono.
-        """
-        self.view.hide_menu()
-        self.type_app = ChronoController(self)
-
-    def build_mlt_chrono(self) -> None:
-        """Builds an aleternate multichrono.
-        """
-        self.view.hide_menu()
-        self.type_app = MultiChronoController(self, nb_chronos=self.view.nb_mlt_chronos)
-
-    def build_one_timer(self) -> None:
-        """Builds a timer.
+class ModeController(EngineObserver):
+    """The lifecycle shared by the controllers of the modes. Leaving a mode hides and resets it in the pool of the
+    application, which shows it again or closes it.
+    """
+    def destroy(self) -> None:
+        """Goes to menu. The mode is kept, hidden, by the application.
         """
-        self.view.hide_menu()
-        self.type_app = TimerController(self)
+        self.application.reset_application()
 
-    def build_mlt_timer(self) -> None:
-        """Builds 2 timers, the second one counts 4/3 the other.
+    def hide(self) -> None:
+        """Stops ticking, resets the chronos / timers, and hides the view, so the mode is ready to be shown again.
         """
-        self.view.hide_menu()
-        self.type_app = MultiTimerController(self)
+        self.application.scheduler.unsubscribe(self.tick)
+        self.engine.reset()
+        self.view.hide()
 
-    def build_sim_chronos(self):
-        """Builds a simultaneous multichrono.
+    def show(self) -> None:
+        """Shows the view of the hidden mode again.
         """
-        self.view.hide_menu()
-        self.type_app = SimultaneousChronoController(self, nb_chronos=self.view.nb_sim_chronos)
+        self.view.show()
 
-    def reset_application(self) -> None:
-        """Resets the application, displaying the main menu.
+    def close(self) -> None:
+        """Destroys the view, and forgets the engine.
         """
-        self.view.show_menu()
+        self.application.scheduler.unsubscribe(self.tick)
+        self.engine.unsubscribe(self)
+        self.view.delete()
+        del self.engine
 
 
-class SimultaneousChronoController:
+class SimultaneousChronoController(ModeController):
     def __init__(self, application: ApplicationController, nb_chronos: int) -> None:
-        """Builds a multiple chrono controller, which controls views (in views.py) and models (in models.py).
+        """Builds a multiple chrono controller, which controls views (in views.py) and an engine (in engine.py).
 
         Args:
             application (ApplicationController): the application containing the instance.
-            nb_chronos (int): the amount of chrono to bulid (from 2 to 16).
+            nb_chronos (int): the amount of chrono to bulid (from 2 to 500).
         """
         self.application = application
         self.nb_chronos = nb_chronos
         self.view = SimultaneousChronoView(self, self.nb_chronos)
-        self.models = []
-        for i in range(self.nb_chronos):
-            self.models.append(ChronoModel())
+        self.engine = ChronoEngine(self.view.nb_chronos)
+        self.engine.subscribe(self)
+        self.formatter = TimeFormatter(len(self.engine))
 
     def pause_all(self) -> None:
-        """Runs one chrono and pauses all the others.
+        """Pauses all the chronos.
         """
-        self.view.pause_all()
-        for chrono in self.models:
-            chrono.pause()
+        self.engine.pause()
 
     def reset_all(self) -> None:
-        """Runs one chrono and pauses all the others.
+        """Resets all the chronos.
         """
-        self.view.reset_all()
-        for chrono in self.models:
-            chrono.reset()
+        self.engine.reset()
 
     def run_all(self) -> None:
-        """Pauses all the chronos.
+        """Runs all the chronos.
         """
-        self.view.run_all()
-        for chrono in self.models:
-            if chrono.paused:
-                chrono.run()
-        self.update_every_60ms()
+        self.engine.run()
 
     def pause_one(self, index: int) -> None:
-        """Runs one chrono and pauses all the others.
+        """Pauses one chrono.
 
         Args:
             index (int): which chrono to pause.
         """
-        self.models[index].pause()
-        self.view.pause_one(index)
-        all_paused = True
-        for model in self.models:
-            if not model.paused:
-                all_paused = False
-        if all_paused:
-            self.view.pause_all()
+        self.engine.pause(index)
 
     def run_one(self, index: int) -> None:
-        """Pauses all the chronos.
+        """Runs one chrono.
+
+        Args:
+            index (int): which chrono to run.
         """
-        self.models[index].run()
-        self.view.run_one(index)
-        self.update_every_60ms()
-        all_running = True
-        for model in self.models:
-            if model.paused:
-                all_running = False
-        if all_running:
-            self.view.run_all()
+        self.engine.run(index)
 
     def reset_one(self, index: int) -> None:
-        """Disables the PAUSE button of the selected chrono.
+        """Resets one chrono.
 
         Args:
            index (int): which chrono to reset.
         """
-        self.models[index].reset()
-        self.view.reset_one(index)
-        self.update_every_60ms()
+        self.engine.reset(index)
 
-    def display_value(self, index) -> None:
-        """Calls the method to display the time value in the view (binding model and view), as a str.
+    def lap_one(self, index: int) -> None:
+        """Records a lap of one chrono. Nothing is displayed, so the click only reads the clock once.
+
+        Args:
+            index (int): which chrono.
         """
-        time_value = format_time_str(self.models[index].elapsed_time)
-        self.view.update_display(index, time_value)
+        self.engine.lap(index)
 
-    def update_every_60ms(self) -> None:
-        """Calls the method to update the time value in the view every 60 ms (binding model and view).
+    def export(self) -> None:
+        """Writes the laps of every chrono to a CSV or JSONL file chosen by the user.
         """
-        for index in range(len(self.models)):
-            self.display_value(index)
-        self.view.update_every_60ms()
+        path = ask_export_path(self.view)
+        if path:
+            try:
+                export_laps(path, self.engine.laps, self.view.names())
+            except OSError as error:
+                show_export_error(self.view, error)
 
-    def destroy(self) -> None:
-        """Destroys the app and goes to menu.
+    def on_run(self, indexes) -> None:
+        """Disables the RUN buttons of the chronos which were run, and starts ticking. The engine started all of them
+        at the same instant.
+
+        Args:
+            indexes (Sequence): which chronos were run.
         """
-        self.view.delete()
-        del self.models
-        self.application.reset_application()
-        del self
+        self.view.run_many(indexes)
+        self.application.scheduler.subscribe(self.tick)
 
+    def on_pause(self, indexes) -> None:
+        """Disables the PAUSE buttons of the chronos which were paused.
 
-class MultiTimerController:
+        Args:
+            indexes (Sequence): which chronos were paused.
+        """
+        self.view.pause_many(indexes)
+
+    def on_reset(self, indexes) -> None:
+        """Resets the lines of the chronos which were reset, and displays the value of the visible ones.
+
+        Args:
+            indexes (Sequence): which chronos were reset.
+        """
+        self.view.reset_many(indexes)
+        visible = self.view.visible
+        for index in visible if len(indexes) == len(self.engine) else indexes:
+            if index in visible:
+                self.display_value(index)
+
+    def display_value(self, index) -> None:
+        """Calls the method to display the time value in the view (binding engine and view), as a str.
+
+        Args:
+            index (int): which chrono to display.
+        """
+        time_value = self.formatter(self.engine.models.elapsed_ns(index) // NS_PER_DECISECOND, index)
+        self.view.update_display(index, time_value)
+
+    def display_visible(self) -> None:
+        """Displays the chronos the view just scrolled to, and ticks again if one of them is running.
+        """
+        for index in self.view.visible:
+            self.display_value(index)
+        if not self.engine.models.all_paused:
+            self.application.scheduler.subscribe(self.tick)
+
+    def tick(self) -> int | None:
+        """Calls the method to update the time values in the view (binding engine and view). Only the visible chronos
+        are read, for a single clock read, so a tick costs the same with 16 or 500 chronos.
+
+        Returns:
+            int|None: the amount of nanoseconds before a displayed value changes, None once every visible chrono is
+            paused.
+        """
+        models = self.engine.models
+        now = models.clock()
+        delay = None
+        for index in self.view.visible:
+            value = models.elapsed_ns(index, now)
+            self.view.update_display(index, self.formatter(value // NS_PER_DECISECOND, index))
+            if not models.paused[index]:
+                change = next_change(value, NS_PER_DECISECOND)
+                if delay is None or change < delay:
+                    delay = change
+        return delay
+
+
+class MultiTimerController(ModeController):
     def __init__(self, application: ApplicationController) -> None:
-        """Builds a timer controller, which controls a view (in views.py) and a model (in models.py). The second timer
-        is 4/3 longer than the other.
+        """Builds a timer controller, which controls a view (in views.py) and an engine (in engine.py). The second
+        timer is 4/3 longer than the other.
 
         Args:
             application (ApplicationController): the application containing the instance.
         """
         self.application = application
         self.view = MultiTimerView(self, NUMBER)
-        self.models = [TimerModel() for _ in range(NUMBER)]
-        self.allow_rings = [False for _ in range(NUMBER)]
+        self.engine = TimerEngine(NUMBER, scheduler=self.application.scheduler)
+        self.engine.subscribe(self)
+        self.formatter = TimeFormatter(NUMBER)
+        self.arc_totals = [-1] * NUMBER
+        self.arc_periods = [1] * NUMBER
         self.change_time(0)
 
     def run(self) -> None:
-        """On user command, runs all the timers, disables run button and enables other buttons.
+        """On user command, runs all the timers.
         """
-        for model in self.models:
-            model.run()
-        self.view.run()
-        self.update_every_60ms()
+        self.engine.run()
 
     def pause(self) -> None:
-        """On user command, pauses all the timers, disables pause button and enables other buttons.
+        """On user command, pauses all the timers.
         """
-        for model in self.models:
-            model.pause()
-        self.view.pause()
+        self.engine.pause()
 
     def reset(self) -> None:
-        """On user command, resets all the timers, disables reset button and enables other buttons.
+        """On user command, resets all the timers.
         """
-        for index, model in enumerate(self.models):
-            model.reset()
-            self.allow_rings[index] = False
-        self.view.reset()
+        self.engine.reset()
 
     def change_time(self, minutes: int | float) -> None:
-        """Adds an amount of time (positive or negative) to every timer. Be careful to the coefficient.
+        """Adds an amount of time (positive or negative) to every timer, at once. Be careful to the coefficient.
 
         Args:
             minutes (int|float): amount of time to add to the timer.
         """
-        for index, timer in enumerate(self.models):
-            if index % 2:
-                timer.add_time(60 * minutes * COEFFICIENT)
-            else:
-                timer.add_time(60 * minutes)
-            self.allow_rings[index] = True
+        self.engine.add_time([60 * minutes * (COEFFICIENT if index % 2 else 1) for index in range(len(self.engine))])
+
+    def on_run(self, indexes) -> None:
+        """Disables run button, enables other buttons, and starts ticking.
+
+        Args:
+            indexes (Iterable): which timers were run.
+        """
+        self.view.run()
+        self.application.scheduler.subscribe(self.tick)
+
+    def on_pause(self, indexes) -> None:
+        """Disables pause button and enables other buttons.
+
+        Args:
+            indexes (Iterable): which timers were paused.
+        """
+        self.view.pause()
         self.display_values()
 
-    def display_values(self) -> None:
-        """Calls the method to display the time value in all the timers of the view (binding models and views), as str.
+    def on_reset(self, indexes) -> None:
+        """Disables reset button, enables other buttons, and displays the values.
+
+        Args:
+            indexes (Iterable): which timers were reset.
         """
-        values_and_percents = []
-        for model in self.models:
-            time_value = format_time_str(model.remaining_time)
-            percent = format_time_percent(model.remaining_time, model.total_time)
-            if percent < 0:
-                percent = 0
-                time_value = format_time_str(timedelta())
-            values_and_percents.append((time_value, percent))
-        self.view.update_display(values_and_percents)
+        self.view.reset()
+        self.display_values()
+
+    def on_add_time(self, indexes) -> None:
+        """Displays the new durations.
 
-    def update_every_60ms(self) -> None:
-        """Calls the method to update the time values in the view every 60 ms (binding models and views).
+        Args:
+            indexes (Iterable): which timers were adjusted.
         """
         self.display_values()
-        if self.models:
-            for index, model in enumerate(self.models):
-                if model.remaining_time <= timedelta():
-                    if self.allow_rings[index]:
-                        play_alarm_WAV()
-                        self.allow_rings[index] = False
-            self.view.update_every_60ms()
 
-    def destroy(self) -> None:
-        """Destroys the app and goes to menu.
+    def on_expire(self, index: int) -> None:
+        """Rings when a timer expires.
+
+        Args:
+            index (int): which timer expired.
         """
-        self.view.delete()
-        del self.models
-        self.application.reset_application()
-        del self
+        self.application.alarm.ring()
+
+    def display_value(self, index: int, value: int) -> None:
+        """Calls the method to display the time value of a timer in the view (binding engine and views), as str.
 
+        Args:
+            index (int): which timer.
+            value (int): its remaining time, in nanoseconds.
+        """
+        if value < 0:
+            value = 0
+        self.view.update_display(index, self.formatter(value // NS_PER_DECISECOND, index),
+                                 format_time_percent(value, self.engine.models.total[index]))
+
+    def display_values(self) -> None:
+        """Displays the time value of every timer, for a single clock read.
+        """
+        models = self.engine.models
+        now = models.clock()
+        for index in range(len(models)):
+            self.display_value(index, models.remaining_ns(index, now))
 
-class MultiChronoController:
+    def arc_period(self, index: int) -> int:
+        """Returns the amount of nanoseconds moving the edge of the arc of a timer by a pixel, computed again only
+        when its duration changed, so the ticks stay on integers.
+
+        Args:
+            index (int): which timer.
+
+        Returns:
+            int: the amount of nanoseconds.
+        """
+        total = self.engine.models.total[index]
+        if total != self.arc_totals[index]:
+            self.arc_totals[index] = total
+            self.arc_periods[index] = max(int(total * self.view.views[index].arc_step / 360), 1)
+        return self.arc_periods[index]
+
+    def tick(self) -> int | None:
+        """Calls the method to update the time values in the view (binding engine and views). Expiries are fired by
+        the engine itself, at their deadline.
+
+        Returns:
+            int|None: the amount of nanoseconds before a displayed value or arc changes, None once every timer is
+            paused or expired.
+        """
+        models = self.engine.models
+        now = models.clock()
+        delay = None
+        for index in range(len(models)):
+            value = models.remaining_ns(index, now)
+            self.display_value(index, value)
+            if value > 0 and not models.paused[index]:
+                change = min(
+                    next_change(value, NS_PER_DECISECOND, countdown=True),
+                    next_change(value, self.arc_period(index), countdown=True),
+                )
+                if delay is None or change < delay:
+                    delay = change
+        return delay
+
+    def close(self) -> None:
+        """Cancels the scheduled expiry, and destroys the view.
+        """
+        self.engine.close()
+        super().close()
+
+
+class MultiChronoController(ModeController):
     def __init__(self, application: ApplicationController, nb_chronos: int) -> None:
-        """Builds a multiple chrono controller, which controls views (in views.py) and models (in models.py).
+        """Builds a multiple chrono controller, which controls views (in views.py) and an engine (in engine.py).
 
         Args:
             application (ApplicationController): the application containing the instance.
-            nb_chronos (int): the amount of chrono to bulid (from 2 to 10).
+            nb_chronos (int): the amount of chrono to bulid (from 2 to 10, 100 on a canvas).
         """
         self.application = application
         self.nb_chronos = nb_chronos
-        self.view = MultiChronoView(self, self.nb_chronos)
-        self.models = [ChronoModel() for number in range(self.nb_chronos)]
+        self.view = multi_chrono_view()(self, self.nb_chronos)
+        self.engine = ChronoEngine(self.view.nb_chronos)
+        self.engine.subscribe(self)
+        self.formatter = TimeFormatter(len(self.engine))
 
     def run(self, index) -> None:
         """Runs one chrono and pauses all the others.
@@ -252,54 +347,95 @@ class MultiChronoController:
         Args:
             index (int): which chrono to run.
         """
-        self.pause()
-        self.models[index].run()
-        self.view.run(index)
-        self.update_every_60ms()
+        self.engine.pause()
+        self.engine.run(index)
 
     def pause(self) -> None:
         """Pauses all the chronos.
         """
-        self.view.pause()
-        for chrono in self.models:
-            chrono.pause()
+        self.engine.pause()
 
     def reset(self) -> None:
         """Resets all the chronos.
         """
+        self.engine.reset()
+
+    def lap(self) -> None:
+        """Records a lap of the running chrono. Nothing is displayed, so the click only reads the clock once.
+        """
+        self.engine.lap()
+
+    def export(self) -> None:
+        """Writes the laps of every chrono to a CSV or JSONL file chosen by the user.
+        """
+        path = ask_export_path(self.view)
+        if path:
+            try:
+                export_laps(path, self.engine.laps, self.view.names())
+            except OSError as error:
+                show_export_error(self.view, error)
+
+    def on_run(self, indexes) -> None:
+        """Disables the RUN button of the chrono which was run, and starts ticking.
+
+        Args:
+            indexes (Iterable): which chronos were run.
+        """
+        for index in indexes:
+            self.view.run(index)
+        self.application.scheduler.subscribe(self.tick)
+
+    def on_pause(self, indexes) -> None:
+        """Enables all RUN buttons, and disables the PAUSE button.
+
+        Args:
+            indexes (Iterable): which chronos were paused.
+        """
+        self.view.pause()
+
+    def on_reset(self, indexes) -> None:
+        """Enables all the buttons, clears all the entries, and displays the values.
+
+        Args:
+            indexes (Iterable): which chronos were reset.
+        """
         self.view.reset()
-        for chrono in self.models:
-            chrono.reset()
+        for index in indexes:
+            self.display_value(index)
 
     def display_value(self, index: int) -> None:
-        """Calls the method to display the time value in the view (binding model and view), as a str.
+        """Calls the method to display the time value in the view (binding engine and view), as a str.
 
         Args:
             index (int): which chrono to display.
         """
-        time_value = format_time_str(self.models[index].elapsed_time)
+        time_value = self.formatter(self.engine.elapsed_ns(index) // NS_PER_DECISECOND, index)
         self.view.update_display(index, time_value)
 
-    def update_every_60ms(self) -> None:
-        """Calls the method to update the time value in the view every 60 ms (binding model and view).
-        """
-        for index in range(len(self.models)):
-            self.display_value(index)
-        self.view.update_every_60ms()
+    def tick(self) -> int | None:
+        """Calls the method to update the time values in the view (binding engine and view), for a single clock
+        read.
 
-    def destroy(self) -> None:
-        """Destroys the app and goes to menu.
+        Returns:
+            int|None: the amount of nanoseconds before a displayed value changes, None once every chrono is paused.
         """
-        self.view.delete()
-        del self.models
-        self.application.reset_application()
-        del self
+        models = self.engine.models
+        now = models.clock()
+        delay = None
+        for index in range(len(models)):
+            value = models.elapsed_ns(index, now)
+            self.view.update_display(index, self.formatter(value // NS_PER_DECISECOND, index))
+            if not models.paused[index]:
+                change = next_change(value, NS_PER_DECISECOND)
+                if delay is None or change < delay:
+                    delay = change
+        return delay
 
 
-class TimerController:
+class TimerController(ModeController):
     def __init__(self, application: ApplicationController, coefficient: float = 1) -> None:
-        """Builds a timer controller, which controls a view (in views.py) and a model (in models.py). The coefficient
-        is used to calculate the increase of time.
+        """Builds a timer controller, which controls a view (in views.py) and an engine (in engine.py). The
+        coefficient is used to calculate the increase of time.
 
         Args:
             application (ApplicationController): the application containing the instance.
@@ -308,32 +444,27 @@ class TimerController:
         self.application = application
         self.coefficient = coefficient
         self.view = TimerView(self)
-        self.model = TimerModel()
+        self.engine = TimerEngine(scheduler=self.application.scheduler)
+        self.engine.subscribe(self)
+        self.formatter = TimeFormatter()
+        self.arc_total = -1
+        self.arc_period = 1
         self.change_time(0)
-        self.allow_ring = False
 
     def run(self) -> None:
-        """On user command, runs the timer, disables run button and enables other buttons.
+        """On user command, runs the timer.
         """
-        self.view.run()
-        self.model.run()
-        self.update_every_60ms()
+        self.engine.run()
 
     def pause(self) -> None:
-        """On user command, pauses the chrono, disables pause button and enables other buttons.
+        """On user command, pauses the timer.
         """
-        self.view.pause()
-        self.model.pause()
-        self.display_value()
+        self.engine.pause()
 
     def reset(self) -> None:
-        """On user command, resets the chrono, disables reset button and enables other buttons.
+        """On user command, resets the timer.
         """
-        self.view.reset()
-        self.model.reset()
-        self.display_value()
-        self.change_time(0)
-        self.allow_ring = False
+        self.engine.reset()
 
     def change_time(self, minutes: int | float) -> None:
         """Adds an amount of time (positive or negative) to the timer
@@ -341,135 +472,193 @@ class TimerController:
         Args:
             minutes (int|float): time to add to the timer.
         """
-        self.model.add_time(60 * minutes * self.coefficient)
-        self.allow_ring = True
+        self.engine.add_time(60 * minutes * self.coefficient)
+
+    def on_run(self, indexes) -> None:
+        """Disables run button, enables other buttons, and starts ticking.
+
+        Args:
+            indexes (Iterable): which timers were run.
+        """
+        self.view.run()
+        self.application.scheduler.subscribe(self.tick)
+
+    def on_pause(self, indexes) -> None:
+        """Disables pause button, enables other buttons, and displays the value.
+
+        Args:
+            indexes (Iterable): which timers were paused.
+        """
+        self.view.pause()
         self.display_value()
 
-    def display_value(self) -> None:
-        """Calls the method to display the time value in the view (binding model and view), as a str.
+    def on_reset(self, indexes) -> None:
+        """Disables reset button, enables other buttons, and displays the value.
+
+        Args:
+            indexes (Iterable): which timers were reset.
         """
-        time_value = format_time_str(self.model.remaining_time)
-        percent = format_time_percent(self.model.remaining_time, self.model.total_time)
-        if percent < 0:
-            percent = 0
-            time_value = format_time_str(timedelta())
-            self.view.update_display(time_value, percent)
-            return
-        self.view.update_display(time_value, percent)
+        self.view.reset()
+        self.display_value()
 
-    def update_every_60ms(self) -> None:
-        """Calls the method to update the time value in the view every 60 ms (binding model and view).
+    def on_add_time(self, indexes) -> None:
+        """Displays the new duration.
+
+        Args:
+            indexes (Iterable): which timers were adjusted.
         """
         self.display_value()
-        if self.model.remaining_time <= timedelta():
-            if self.allow_ring:
-                play_alarm_WAV()
-        else:
-            self.view.update_every_60ms()
 
-    def destroy(self) -> None:
-        """Destroys the app and goes to menu.
+    def on_expire(self, index: int) -> None:
+        """Rings when the timer expires.
+
+        Args:
+            index (int): which timer expired.
+        """
+        self.application.alarm.ring()
+
+    def display_value(self) -> int:
+        """Calls the method to display the time value in the view (binding engine and view), as a str.
+
+        Returns:
+            int: the displayed remaining time, in nanoseconds.
+        """
+        remaining_time = self.engine.remaining_ns()
+        shown = remaining_time if remaining_time > 0 else 0
+        self.view.update_display(self.formatter(shown // NS_PER_DECISECOND),
+                                 format_time_percent(shown, self.engine.models.total[0]))
+        return remaining_time
+
+    def tick(self) -> int | None:
+        """Calls the method to update the time value in the view (binding engine and view). The expiry is fired by
+        the engine itself, at its deadline.
+
+        Returns:
+            int|None: the amount of nanoseconds before the displayed value or arc changes, None once the timer is
+            paused or expired.
+        """
+        remaining_time = self.display_value()
+        if remaining_time <= 0 or not self.engine.running:
+            return None
+        total = self.engine.models.total[0]
+        if total != self.arc_total:
+            self.arc_total = total
+            self.arc_period = max(int(total * self.view.arc_step / 360), 1)
+        return min(
+            next_change(remaining_time, NS_PER_DECISECOND, countdown=True),
+            next_change(remaining_time, self.arc_period, countdown=True),
+        )
+
+    def close(self) -> None:
+        """Cancels the scheduled expiry, and destroys the view.
         """
-        self.view.delete()
-        del self.model
-        self.application.reset_application()
-        del self
+        self.engine.close()
+        super().close()
 
 
-class ChronoController:
+class ChronoController(ModeController):
     def __init__(self, application: ApplicationController) -> None:
-        """Builds a chrono controller, which controls a view (in views.py) and a model (in models.py).
+        """Builds a chrono controller, which controls a view (in views.py) and an engine (in engine.py).
 
         Args:
             application (ApplicationController): the application containing the instance.
         """
         self.application = application
         self.view = ChronoView(self)
-        self.model = ChronoModel()
+        self.engine = ChronoEngine()
+        self.engine.subscribe(self)
+        self.formatter = TimeFormatter()
+        self.displayed_laps = 0
 
     def run(self) -> None:
-        """On user command, runs the chrono, disables run button and enables other buttons.
+        """On user command, runs the chrono.
         """
-        self.view.run()
-        self.model.run()
-        self.update_every_60ms()
+        self.engine.run()
 
     def pause(self) -> None:
-        """On user command, pauses the chrono, disables pause button and enables other buttons.
+        """On user command, pauses the chrono.
         """
-        self.view.pause()
-        self.model.pause()
-        self.display_value()
+        self.engine.pause()
 
     def reset(self) -> None:
-        """On user command, resets the chrono, disables reset button and enables other buttons.
+        """On user command, resets the chrono.
         """
-        self.view.reset()
-        self.model.reset()
-        self.display_value()
+        self.engine.reset()
 
-    def display_value(self):
-        """Calls the method to display the time value in the view (binding model and view), as a str.
+    def lap(self) -> None:
+        """On user command, records a lap. The lap is displayed by the next tick, so the click only reads the clock
+        once.
         """
-        time_value = format_time_str(self.model.elapsed_time)
-        self.view.update_display(time_value)
+        self.engine.lap()
 
-    def update_every_60ms(self) -> None:
-        """Calls the method to update the time value in the view every 60 ms (binding model and view).
+    def export(self) -> None:
+        """On user command, writes the laps to a CSV or JSONL file chosen by the user.
         """
-        self.display_value()
-        self.view.update_every_60ms()
+        path = ask_export_path(self.view)
+        if path:
+            try:
+                export_laps(path, self.engine.laps)
+            except OSError as error:
+                show_export_error(self.view, error)
 
-    def destroy(self) -> None:
-        """Destroys the app and goes to menu.
-        """
-        self.view.delete()
-        del self.model
-        self.application.reset_application()
-        del self
+    def on_run(self, indexes) -> None:
+        """Disables run button, enables other buttons, and starts ticking.
 
+        Args:
+            indexes (Iterable): which chronos were run.
+        """
+        self.view.run()
+        self.application.scheduler.subscribe(self.tick)
 
-# -------------------- FUNCTIONS --------------------
-def format_time_str(value: timedelta) -> str:
-    """Formats a timedelta value as a str : {h}:{mm}:{ss}.{µ} or {mm}:{ss}.{µ}, depending on value (> or < 1 hour).
+    def on_pause(self, indexes) -> None:
+        """Disables pause button, enables other buttons, and displays the value.
 
-    Args:
-        value (timedelta): the timedelta to convert to string.
+        Args:
+            indexes (Iterable): which chronos were paused.
+        """
+        self.view.pause()
+        self.display_value()
 
-    Returns:
-        str: the timedelta, converted to a string.
-    """
-    if value >= timedelta(hours=1):
-        return "{:01d}:{:02d}:{:02d}.{}".format(
-            value.seconds // 3600,
-            (value.seconds // 60) % 60,
-            value.seconds % 60,
-            value.microseconds // 100000,
-        )
-    else:
-        return "{:02d}:{:02d}.{}".format(
-            (value.seconds // 60) % 60,
-            value.seconds % 60,
-            value.microseconds // 100000,
-        )
+    def on_reset(self, indexes) -> None:
+        """Disables reset button, enables other buttons, and displays the value.
 
+        Args:
+            indexes (Iterable): which chronos were reset.
+        """
+        self.view.reset()
+        self.display_value()
+        self.display_lap()
 
-def format_time_percent(value: timedelta, total: timedelta) -> float:
-    """Formats a timedelta percentage as a float.
+    def display_value(self) -> int:
+        """Calls the method to display the time value in the view (binding engine and view), as a str.
 
-    Args:
-        value (timedelta): the counted time.
-        total: (timedelta): the total time.
+        Returns:
+            int: the displayed elapsed time, in nanoseconds.
+        """
+        elapsed_time = self.engine.elapsed_ns()
+        self.view.update_display(self.formatter(elapsed_time // NS_PER_DECISECOND))
+        return elapsed_time
 
-    Returns:
-        float: the percentage of the timedelta.
-    """
-    if total == timedelta():
-        return 0
-    return value / total
+    def display_lap(self) -> None:
+        """Displays the last lap, if laps were recorded (or forgotten) since the last display.
+        """
+        laps = self.engine.laps
+        if len(laps) == self.displayed_laps:
+            return
+        self.displayed_laps = len(laps)
+        if laps:
+            self.view.update_lap(f"{LAP} {laps.numbers[-1]} : {format_time_str(laps.laps[-1] // NS_PER_DECISECOND)}")
+        else:
+            self.view.update_lap("")
 
+    def tick(self) -> int | None:
+        """Calls the method to update the time value and the last lap in the view (binding engine and view).
 
-def play_alarm_WAV() -> None:
-    """Plays a .WAV file, but allows user to click thanks to SND_ASYNC.
-    """
-    winsound.PlaySound(str(ALARM), winsound.SND_FILENAME | winsound.SND_ASYNC)
+        Returns:
+            int|None: the amount of nanoseconds before the displayed value changes, None once the chrono is paused.
+        """
+        elapsed_time = self.display_value()
+        self.display_lap()
+        if not self.engine.running:
+            return None
+        return next_change(elapsed_time, NS_PER_DECISECOND)
\ No newline at end of file
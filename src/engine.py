@@ -0,0 +1,348 @@
+# -------------------- IMPORTS --------------------
+from collections.abc import Iterable, Sequence
+from time import monotonic_ns
+
+from .models import *
+from .scheduler import *
+
+
+# -------------------- CLASSES --------------------
+class EngineObserver:
+    """Receives the state transitions of an engine. Every method does nothing, subclasses override what they need.
+    """
+    def on_run(self, indexes: Iterable) -> None:
+        """Called after chronos / timers were run.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+
+    def on_pause(self, indexes: Iterable) -> None:
+        """Called after chronos / timers were paused.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+
+    def on_reset(self, indexes: Iterable) -> None:
+        """Called after chronos / timers were reset.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+
+    def on_add_time(self, indexes: Iterable) -> None:
+        """Called after the duration of timers was adjusted.
+
+        Args:
+            indexes (Iterable): which timers.
+        """
+
+    def on_lap(self, indexes: Iterable) -> None:
+        """Called after laps of chronos were recorded.
+
+        Args:
+            indexes (Iterable): which chronos.
+        """
+
+    def on_expire(self, index: int) -> None:
+        """Called once when a timer expires.
+
+        Args:
+            index (int): which timer.
+        """
+
+
+class ChronoEngine:
+    countdown = False
+
+    def __init__(self, size: int = 1, clock: Clock = monotonic_ns) -> None:
+        """Builds the timing logic of some chronos, without any user interface. Observers are notified of every
+        state transition.
+
+        Args:
+            size (int): the amount of chronos.
+            clock (Clock): the clock shared by every chrono.
+        """
+        self.models = TimeBank(size, countdown=self.countdown, clock=clock)
+        self.laps = LapBook(size)
+        self.observers = []
+
+    def __len__(self) -> int:
+        """Returns the amount of chronos / timers.
+
+        Returns:
+            int: the size of the engine.
+        """
+        return len(self.models)
+
+    @property
+    def running(self) -> bool:
+        """Returns True if something is running.
+
+        Returns:
+            bool: whether a chrono / timer is running.
+        """
+        return not self.models.all_paused
+
+    def subscribe(self, observer: EngineObserver) -> None:
+        """Adds an observer.
+
+        Args:
+            observer (EngineObserver): the observer to notify.
+        """
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+    def unsubscribe(self, observer: EngineObserver) -> None:
+        """Removes an observer.
+
+        Args:
+            observer (EngineObserver): the observer to forget.
+        """
+        if observer in self.observers:
+            self.observers.remove(observer)
+
+    def value(self, index: int = 0) -> int:
+        """Returns the elapsed (or remaining, for timers) time of one chrono / timer.
+
+        Args:
+            index (int): which chrono / timer.
+
+        Returns:
+            int: the amount of time, in nanoseconds.
+        """
+        return self.models.value(index)
+
+    def elapsed_ns(self, index: int = 0) -> int:
+        """Returns the elapsed time of one chrono, the integer fast path of the refreshes.
+
+        Args:
+            index (int): which chrono.
+
+        Returns:
+            int: the amount of elapsed time, in nanoseconds.
+        """
+        return self.models.elapsed_ns(index)
+
+    def values(self) -> list:
+        """Returns the elapsed (or remaining, for timers) time of every chrono / timer.
+
+        Returns:
+            list: the amounts of time, in nanoseconds.
+        """
+        return self.models.values()
+
+    def run(self, indexes: int | Iterable | None = None) -> None:
+        """Runs the selected chronos / timers.
+
+        Args:
+            indexes (int|Iterable|None): which chronos / timers, all of them if None.
+        """
+        indexes = self.models.select(indexes)
+        self.models.run(indexes)
+        self._notify("on_run", indexes)
+
+    def pause(self, indexes: int | Iterable | None = None) -> None:
+        """Pauses the selected chronos / timers.
+
+        Args:
+            indexes (int|Iterable|None): which chronos / timers, all of them if None.
+        """
+        indexes = self.models.select(indexes)
+        self.models.pause(indexes)
+        self._notify("on_pause", indexes)
+
+    def reset(self, indexes: int | Iterable | None = None) -> None:
+        """Resets the selected chronos / timers, and forgets their laps.
+
+        Args:
+            indexes (int|Iterable|None): which chronos / timers, all of them if None.
+        """
+        indexes = self.models.select(indexes)
+        self.models.reset(indexes)
+        if len(self.laps):
+            self.laps.clear(indexes)
+        self._notify("on_reset", indexes)
+
+    def lap(self, indexes: int | Iterable | None = None) -> None:
+        """Records a lap of the selected chronos which are running, for a single clock read.
+
+        Args:
+            indexes (int|Iterable|None): which chronos, all of them if None.
+        """
+        now = self.models.clock()
+        indexes = [index for index in self.models.select(indexes) if not self.models.paused[index]]
+        for index in indexes:
+            self.laps.record(index, self.models.value(index, now))
+        if indexes:
+            self._notify("on_lap", indexes)
+
+    def restore(self, states: dict) -> None:
+        """Restores the state of some chronos / timers, then notifies the observers as if the interrupted ones were
+        paused, and the running ones run.
+
+        Args:
+            states (dict): the (start, memory, total, paused, armed) state of each restored chrono / timer, by index.
+        """
+        for index, (start, memory, total, paused, armed) in states.items():
+            self.models.set_state(index, start, memory, total, paused)
+        paused = [index for index in states if self.models.paused[index]
+                  and self.models.memory[index] != self.models.total[index]]
+        running = [index for index in states if not self.models.paused[index]]
+        if paused:
+            self._notify("on_pause", paused)
+        if running:
+            self._notify("on_run", running)
+
+    def _notify(self, event: str, *args) -> None:
+        """Calls a method of every observer.
+
+        Args:
+            event (str): the name of the EngineObserver method.
+            *args: the arguments of the method.
+        """
+        for observer in list(self.observers):
+            getattr(observer, event)(*args)
+
+
+class TimerEngine(ChronoEngine):
+    countdown = True
+
+    def __init__(self, size: int = 1, clock: Clock = monotonic_ns, scheduler: TickScheduler | None = None) -> None:
+        """Builds the timing logic of some timers, without any user interface. A timer is armed when its duration is
+        set, and expires once. With a scheduler, expiries are scheduled for the exact deadline of each timer, and
+        rescheduled on every transition, instead of being detected by the next refresh.
+
+        Args:
+            size (int): the amount of timers.
+            clock (Clock): the clock shared by every timer.
+            scheduler (TickScheduler|None): the scheduler firing the expiries, the scheduler must use the same clock.
+        """
+        super().__init__(size, clock)
+        self.armed = bytearray(size)
+        self.scheduler = scheduler
+
+    def remaining_ns(self, index: int = 0) -> int:
+        """Returns the remaining time of one timer, the integer fast path of the refreshes.
+
+        Args:
+            index (int): which timer.
+
+        Returns:
+            int: the amount of remaining time, in nanoseconds.
+        """
+        return self.models.remaining_ns(index)
+
+    def run(self, indexes: int | Iterable | None = None) -> None:
+        """Runs the selected timers, and schedules their expiry.
+
+        Args:
+            indexes (int|Iterable|None): which timers, all of them if None.
+        """
+        super().run(indexes)
+        self._schedule_expiry()
+
+    def pause(self, indexes: int | Iterable | None = None) -> None:
+        """Pauses the selected timers, and reschedules the expiry of the others.
+
+        Args:
+            indexes (int|Iterable|None): which timers, all of them if None.
+        """
+        super().pause(indexes)
+        self._schedule_expiry()
+
+    def reset(self, indexes: int | Iterable | None = None) -> None:
+        """Resets and disarms the selected timers.
+
+        Args:
+            indexes (int|Iterable|None): which timers, all of them if None.
+        """
+        indexes = self.models.select(indexes)
+        for index in indexes:
+            self.armed[index] = 0
+        super().reset(indexes)
+        self._schedule_expiry()
+
+    def add_time(self, seconds: int | float | Sequence, indexes: int | Iterable | None = None) -> None:
+        """Adjusts the duration of the selected timers, arming those with a duration.
+
+        Args:
+            seconds (int|float|Sequence): the amount of time to increase / decrease, or one amount per selected timer.
+            indexes (int|Iterable|None): which timers, all of them if None.
+        """
+        indexes = self.models.select(indexes)
+        self.models.add_time(seconds, indexes)
+        for index in indexes:
+            self.armed[index] = self.models.total[index] > 0
+        self._notify("on_add_time", indexes)
+        self._schedule_expiry()
+
+    def restore(self, states: dict) -> None:
+        """Restores the state of some timers, displays their duration, and schedules their expiry. A timer which
+        expired meanwhile rings at once.
+
+        Args:
+            states (dict): the (start, memory, total, paused, armed) state of each restored timer, by index.
+        """
+        for index, (start, memory, total, paused, armed) in states.items():
+            self.armed[index] = 1 if armed else 0
+        super().restore(states)
+        self._notify("on_add_time", self.models.select(states))
+        self._schedule_expiry()
+
+    def next_expiry(self) -> int | None:
+        """Returns the delay before the next armed and running timer expires.
+
+        Returns:
+            int|None: the amount of nanoseconds before the next expiry, None if no timer can expire.
+        """
+        now = self.models.clock()
+        delay = None
+        for index, armed in enumerate(self.armed):
+            if armed and not self.models.paused[index]:
+                remaining = self.models.start[index] + self.models.memory[index] - now
+                if delay is None or remaining < delay:
+                    delay = remaining
+        if delay is None:
+            return None
+        return max(delay, 0)
+
+    def expire_due(self) -> int | None:
+        """Expires the timers which reached their deadline. Called by the scheduler.
+
+        Returns:
+            int|None: the amount of nanoseconds before the next expiry, None if no timer can expire.
+        """
+        self.check_expiry()
+        return self.next_expiry()
+
+    def close(self) -> None:
+        """Cancels the scheduled expiry, before the engine is forgotten.
+        """
+        if self.scheduler is not None:
+            self.scheduler.unsubscribe(self.expire_due)
+
+    def _schedule_expiry(self) -> None:
+        """Schedules the next expiry, or cancels it if no timer can expire.
+        """
+        if self.scheduler is None:
+            return
+        delay = self.next_expiry()
+        if delay is None:
+            self.scheduler.unsubscribe(self.expire_due)
+        else:
+            self.scheduler.subscribe(self.expire_due, delay)
+
+    def check_expiry(self, values: list | None = None) -> None:
+        """Notifies the observers of the armed timers which reached zero, and disarms them.
+
+        Args:
+            values (list|None): the remaining times, if already read.
+        """
+        if values is None:
+            values = self.models.values()
+        for index, value in enumerate(values):
+            if value <= 0 and self.armed[index]:
+                self.armed[index] = 0
+                self._notify("on_expire", index)
@@ -0,0 +1,99 @@
+# -------------------- IMPORTS --------------------
+import csv
+import json
+from collections.abc import Iterable, Sequence
+
+from .formatting import *
+from .models import *
+
+
+# -------------------- CONSTANTS --------------------
+LAP_FIELDS = ("chrono", "name", "lap", "split", "lap_time", "split_ns", "lap_ns")
+
+
+# -------------------- CLASSES --------------------
+class LineBuffer:
+    def __init__(self) -> None:
+        """Builds a file-like object receiving the lines of a csv.writer, one at a time, so they can be yielded.
+        """
+        self.line = ""
+
+    def write(self, line: str) -> None:
+        """Keeps the line written.
+
+        Args:
+            line (str): the line.
+        """
+        self.line = line
+
+    def pop(self) -> str:
+        """Returns the last line written, and forgets it.
+
+        Returns:
+            str: the line.
+        """
+        line, self.line = self.line, ""
+        return line
+
+
+# -------------------- FUNCTIONS --------------------
+def lap_records(laps: LapBook, names: Sequence | None = None) -> Iterable:
+    """Yields the laps one by one, as records ready to be written, so the whole report is never built in memory.
+
+    Args:
+        laps (LapBook): the laps to export.
+        names (Sequence|None): the name of each chrono, if any.
+
+    Yields:
+        tuple: the values of a lap, in the order of LAP_FIELDS.
+    """
+    for index, number, split, lap in laps.rows():
+        name = names[index] if names else ""
+        yield (index + 1, name, number, format_time_str(split // NS_PER_DECISECOND),
+               format_time_str(lap // NS_PER_DECISECOND), split, lap)
+
+
+def csv_lines(records: Iterable) -> Iterable:
+    """Yields the CSV lines of some lap records, header first.
+
+    Args:
+        records (Iterable): the lap records.
+
+    Yields:
+        str: a line of the CSV file.
+    """
+    line = LineBuffer()
+    writer = csv.writer(line)
+    writer.writerow(LAP_FIELDS)
+    yield line.pop()
+    for record in records:
+        writer.writerow(record)
+        yield line.pop()
+
+
+def jsonl_lines(records: Iterable) -> Iterable:
+    """Yields the JSON Lines of some lap records, one object per lap.
+
+    Args:
+        records (Iterable): the lap records.
+
+    Yields:
+        str: a line of the JSONL file.
+    """
+    for record in records:
+        yield json.dumps(dict(zip(LAP_FIELDS, record)), ensure_ascii=False) + "\n"
+
+
+def export_laps(path, laps: LapBook, names: Sequence | None = None) -> None:
+    """Writes the laps to a file, as JSON Lines if its extension is .jsonl, as CSV otherwise. Lines are streamed to
+    the file as they are produced.
+
+    Args:
+        path (Path|str): the file to write.
+        laps (LapBook): the laps to export.
+        names (Sequence|None): the name of each chrono, if any.
+    """
+    lines = jsonl_lines if str(path).lower().endswith(".jsonl") else csv_lines
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        file.writelines(lines(lap_records(laps, names)))
+
@@ -0,0 +1,102 @@
+# -------------------- IMPORTS --------------------
+from datetime import timedelta
+
+from .constants import *
+
+
+# -------------------- CONSTANTS --------------------
+# Precomputed digits, so formatting never goes through str.format
+TWO_DIGITS = tuple(f"{number:02d}" for number in range(60))
+ONE_DIGIT = tuple(str(number) for number in range(10))
+
+
+# -------------------- CLASSES --------------------
+class TimeFormatter:
+    def __init__(self, size: int = 1) -> None:
+        """Builds a formatter remembering the last value displayed in each slot (a label, a timer...). As the display
+        only shows tenths, most ticks ask for the value already formatted, which then costs a single comparison.
+
+        Args:
+            size (int): the amount of display slots.
+        """
+        self.values = [-1] * size
+        self.texts = [""] * size
+        self.seconds = [-1] * size
+        self.prefixes = [""] * size
+
+    def __call__(self, deciseconds: int, slot: int = 0) -> str:
+        """Formats an amount of deciseconds, reusing the last string of the slot if the value did not change. The
+        text before the tenths ("{mm}:{ss}.") is kept too, so a new tenth only costs a concatenation.
+
+        Args:
+            deciseconds (int): the amount of deciseconds to format.
+            slot (int): the display slot.
+
+        Returns:
+            str: the formatted time.
+        """
+        if self.values[slot] == deciseconds:
+            return self.texts[slot]
+        if deciseconds <= 0:
+            text = format_time_str(deciseconds)
+        else:
+            seconds = deciseconds // 10
+            if self.seconds[slot] != seconds:
+                self.seconds[slot] = seconds
+                self.prefixes[slot] = format_time_str(seconds * 10)[:-1]
+            text = self.prefixes[slot] + ONE_DIGIT[deciseconds - seconds * 10]
+        self.values[slot] = deciseconds
+        self.texts[slot] = text
+        return text
+
+
+# -------------------- FUNCTIONS --------------------
+def next_change(value: int, period: int | float, countdown: bool = False) -> int:
+    """Returns the amount of nanoseconds before the displayed step of a value (value // period) changes.
+
+    Args:
+        value (int): the elapsed (or remaining, if countdown) time, in nanoseconds.
+        period (int|float): the length of a displayed step, in nanoseconds.
+        countdown (bool): True if the value decreases over time.
+
+    Returns:
+        int: the amount of nanoseconds before the next step.
+    """
+    if countdown:
+        return int(value % period) + 1
+    return int(period - value % period)
+
+
+def format_time_str(deciseconds: int) -> str:
+    """Formats an amount of deciseconds as a str : {h}:{mm}:{ss}.{d} or {mm}:{ss}.{d}, depending on value (> or < 1
+    hour). Negative values are displayed as zero.
+
+    Args:
+        deciseconds (int): the amount of deciseconds to convert to string.
+
+    Returns:
+        str: the amount of time, converted to a string.
+    """
+    if deciseconds <= 0:
+        return "00:00.0"
+    seconds, tenths = divmod(deciseconds, 10)
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return TWO_DIGITS[minutes] + ":" + TWO_DIGITS[seconds] + "." + ONE_DIGIT[tenths]
+    hours, minutes = divmod(minutes, 60)
+    return str(hours % 24) + ":" + TWO_DIGITS[minutes] + ":" + TWO_DIGITS[seconds] + "." + ONE_DIGIT[tenths]
+
+
+def format_time_percent(value: timedelta | int, total: timedelta | int) -> float:
+    """Formats a timedelta percentage as a float.
+
+    Args:
+        value (timedelta|int): the counted time.
+        total: (timedelta|int): the total time, in the same unit.
+
+    Returns:
+        float: the percentage of the timedelta.
+    """
+    if not total:
+        return 0
+    return value / total
@@ -0,0 +1,391 @@
+# -------------------- IMPORTS --------------------
+import asyncio
+import json
+from time import monotonic_ns
+
+from .engine import *
+
+
+# -------------------- CLASSES --------------------
+class WheelEntry:
+    __slots__ = "tick", "callback", "bucket"
+
+    def __init__(self, tick: int, callback) -> None:
+        """Builds a deadline of a timing wheel.
+
+        Args:
+            tick (int): the tick of the deadline.
+            callback (callable): the function called once the deadline is reached, without arguments.
+        """
+        self.tick = tick
+        self.callback = callback
+        self.bucket = None
+
+
+class TimingWheel:
+    def __init__(self, resolution: int = WHEEL_RESOLUTION_NS, now: int = 0, bits: int = WHEEL_BITS,
+                 levels: int = WHEEL_LEVELS) -> None:
+        """Builds a hierarchical timing wheel: the time is cut in ticks of the resolution, level 0 has a slot per tick
+        of the next 2 ** bits ticks, each slot of level 1 covers 2 ** bits ticks, and so on. A deadline is put in
+        the finest level which covers it, and moves down a level each time the wheel enters its slot. Scheduling and
+        cancelling are O(1), and advancing costs the deadlines reached (plus the cascades, amortized), whatever the
+        amount of deadlines scheduled. Deadlines beyond the last level wait in an overflow set.
+
+        Args:
+            resolution (int): the length of a tick, in nanoseconds. Deadlines are rounded up to a tick.
+            now (int): the current time, in nanoseconds.
+            bits (int): the log2 of the amount of slots of a level.
+            levels (int): the amount of levels.
+        """
+        self.resolution = resolution
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.slots = [[set() for _ in range(1 << bits)] for _ in range(levels)]
+        self.overflow = set()
+        self.current = now // resolution
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Returns the amount of scheduled deadlines.
+
+        Returns:
+            int: the amount of deadlines.
+        """
+        return self.count
+
+    def schedule(self, deadline: int, callback) -> WheelEntry:
+        """Schedules a call at a deadline.
+
+        Args:
+            deadline (int): the time of the call, in nanoseconds.
+            callback (callable): the function to call, without arguments.
+
+        Returns:
+            WheelEntry: the entry, to cancel the call.
+        """
+        entry = WheelEntry(-(-deadline // self.resolution), callback)
+        self._place(entry)
+        self.count += 1
+        return entry
+
+    def cancel(self, entry: WheelEntry) -> None:
+        """Cancels a call which was not made yet.
+
+        Args:
+            entry (WheelEntry): the entry of the call.
+        """
+        if entry.bucket is not None:
+            entry.bucket.discard(entry)
+            entry.bucket = None
+            self.count -= 1
+
+    def _place(self, entry: WheelEntry) -> None:
+        """Puts an entry in the finest level covering its deadline. A deadline already passed is due at the next
+        tick.
+
+        Args:
+            entry (WheelEntry): the entry.
+        """
+        tick = max(entry.tick, self.current)
+        delta = tick - self.current
+        for level, slots in enumerate(self.slots):
+            if delta < 1 << (self.bits * (level + 1)):
+                entry.bucket = slots[(tick >> (self.bits * level)) & self.mask]
+                entry.bucket.add(entry)
+                return
+        entry.bucket = self.overflow
+        self.overflow.add(entry)
+
+    def _cascade(self) -> None:
+        """Moves the entries of the slots the wheel just entered down to the finer levels, from the coarsest one.
+        """
+        wrapped = 1
+        while wrapped < len(self.slots) and not self.current & ((1 << (self.bits * (wrapped + 1))) - 1):
+            wrapped += 1
+        if wrapped == len(self.slots):
+            entries, self.overflow = self.overflow, set()
+            for entry in entries:
+                self._place(entry)
+        for level in range(min(wrapped, len(self.slots) - 1), 0, -1):
+            slots = self.slots[level]
+            index = (self.current >> (self.bits * level)) & self.mask
+            entries, slots[index] = slots[index], set()
+            for entry in entries:
+                self._place(entry)
+
+    def advance(self, now: int) -> int:
+        """Calls the entries whose tick is reached. The calls may schedule new entries, due at the next tick at the
+        earliest.
+
+        Args:
+            now (int): the current time, in nanoseconds.
+
+        Returns:
+            int: the amount of calls made.
+        """
+        target = now // self.resolution
+        calls = 0
+        while self.current <= target:
+            slots = self.slots[0]
+            index = self.current & self.mask
+            entries, slots[index] = slots[index], set()
+            self.current += 1
+            if not self.current & self.mask:
+                self._cascade()
+            self.count -= len(entries)
+            calls += len(entries)
+            for entry in entries:
+                entry.bucket = None
+                entry.callback()
+        return calls
+
+
+class HostedSession(EngineObserver):
+    def __init__(self, host: "SessionHost", key: str, engine: ChronoEngine) -> None:
+        """Builds a session of the host: an engine, without any user interface, whose next expiry is kept in the
+        timing wheel of the host. Every transition reschedules it.
+
+        Args:
+            host (SessionHost): the host.
+            key (str): the name of the session.
+            engine (ChronoEngine): the chronos (or timers, for a TimerEngine) of the session.
+        """
+        self.host = host
+        self.key = key
+        self.engine = engine
+        self.entry = None
+        engine.subscribe(self)
+
+    def reschedule(self) -> None:
+        """Moves the entry of the session in the wheel to its next expiry, or removes it if no timer can expire.
+        """
+        wheel = self.host.wheel
+        if self.entry is not None:
+            wheel.cancel(self.entry)
+            self.entry = None
+        if isinstance(self.engine, TimerEngine):
+            delay = self.engine.next_expiry()
+            if delay is not None:
+                self.entry = wheel.schedule(self.engine.models.clock() + delay, self.expire)
+
+    def expire(self) -> None:
+        """Expires the timers which reached their deadline, called by the wheel.
+        """
+        self.entry = None
+        self.engine.check_expiry()
+        self.reschedule()
+
+    def on_run(self, indexes: Iterable) -> None:
+        """Reschedules the session.
+
+        Args:
+            indexes (Iterable): which chronos / timers were run.
+        """
+        self.reschedule()
+
+    def on_pause(self, indexes: Iterable) -> None:
+        """Reschedules the session.
+
+        Args:
+            indexes (Iterable): which chronos / timers were paused.
+        """
+        self.reschedule()
+
+    def on_reset(self, indexes: Iterable) -> None:
+        """Reschedules the session.
+
+        Args:
+            indexes (Iterable): which chronos / timers were reset.
+        """
+        self.reschedule()
+
+    def on_add_time(self, indexes: Iterable) -> None:
+        """Reschedules the session.
+
+        Args:
+            indexes (Iterable): which timers were adjusted.
+        """
+        self.reschedule()
+
+    def on_expire(self, index: int) -> None:
+        """Tells the host a timer expired.
+
+        Args:
+            index (int): which timer.
+        """
+        self.host.expired(self.key, index)
+
+    def state(self) -> dict:
+        """Returns the state of the session.
+
+        Returns:
+            dict: the values (elapsed or remaining time, in nanoseconds), and which chronos / timers run.
+        """
+        models = self.engine.models
+        return {"values": models.values(), "running": [1 - paused for paused in models.paused]}
+
+
+class SessionHost:
+    def __init__(self, clock=monotonic_ns, resolution: int = WHEEL_RESOLUTION_NS, listener=None) -> None:
+        """Builds a host of independent sessions of chronos / timers, the exam rooms of a building for example. The
+        deadlines of every session are driven by a single timing wheel, so a tick of the host costs the timers
+        expiring, not the sessions hosted.
+
+        Args:
+            clock (Callable): the clock shared by every session, in nanoseconds.
+            resolution (int): the length of a tick of the wheel, in nanoseconds.
+            listener (Callable|None): called with the name of the session and the index of the timer, when a timer
+                expires.
+        """
+        self.clock = clock
+        self.wheel = TimingWheel(resolution, clock())
+        self.sessions = {}
+        self.listener = listener
+        self.writers = set()
+
+    def __len__(self) -> int:
+        """Returns the amount of sessions.
+
+        Returns:
+            int: the amount of sessions.
+        """
+        return len(self.sessions)
+
+    def open(self, key: str, size: int = 1, timer: bool = True) -> ChronoEngine:
+        """Opens a session, whose engine is driven like the engine of a controller.
+
+        Args:
+            key (str): the name of the session, unique.
+            size (int): the amount of chronos / timers, from 1 to HOST_MAX_SIZE.
+            timer (bool): True for timers, False for chronos.
+
+        Returns:
+            ChronoEngine: the engine of the session.
+        """
+        if key in self.sessions:
+            raise KeyError(f"session {key} already open")
+        if type(size) is not int or not 1 <= size <= HOST_MAX_SIZE:
+            raise ValueError(f"size must be an integer from 1 to {HOST_MAX_SIZE}")
+        engine = (TimerEngine if timer else ChronoEngine)(size, clock=self.clock)
+        self.sessions[key] = HostedSession(self, key, engine)
+        return engine
+
+    def close(self, key: str) -> None:
+        """Closes a session.
+
+        Args:
+            key (str): the name of the session.
+        """
+        session = self.sessions.pop(key)
+        if session.entry is not None:
+            self.wheel.cancel(session.entry)
+        session.engine.unsubscribe(session)
+
+    def expired(self, key: str, index: int) -> None:
+        """Reports a timer which expired, to the listener and to the connected clients.
+
+        Args:
+            key (str): the name of the session.
+            index (int): which timer.
+        """
+        if self.listener is not None:
+            self.listener(key, index)
+        if self.writers:
+            line = (json.dumps({"event": "expire", "session": key, "index": index}) + "\n").encode()
+            for writer in self.writers:
+                writer.write(line)
+
+    def advance(self) -> int:
+        """Expires the timers whose deadline is reached.
+
+        Returns:
+            int: the amount of sessions called.
+        """
+        return self.wheel.advance(self.clock())
+
+    async def run(self) -> None:
+        """Advances the wheel at every tick, forever.
+        """
+        period = self.wheel.resolution / NS_PER_SECOND
+        while True:
+            self.advance()
+            await asyncio.sleep(period)
+
+    def handle(self, command: dict) -> dict:
+        """Executes a command of a client: open, close, run, pause, reset, add_time (seconds) or state, of a session
+        (and of a chrono / timer, by index, all of them if missing).
+
+        Args:
+            command (dict): the command, as decoded from JSON.
+
+        Returns:
+            dict: the reply.
+        """
+        try:
+            operation, key = command["op"], command["session"]
+            if operation == "open":
+                self.open(key, command.get("size", 1), command.get("timer", True))
+                return {"ok": True}
+            if operation == "close":
+                self.close(key)
+                return {"ok": True}
+            session = self.sessions[key]
+            if operation == "state":
+                return {"ok": True, **session.state()}
+            if operation == "add_time":
+                session.engine.add_time(command["seconds"], command.get("index"))
+            elif operation in ("run", "pause", "reset"):
+                getattr(session.engine, operation)(command.get("index"))
+            else:
+                return {"ok": False, "error": f"unknown operation {operation}"}
+            return {"ok": True}
+        except (KeyError, TypeError, ValueError, IndexError, AttributeError) as error:
+            return {"ok": False, "error": repr(error)}
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves a client of the JSON Lines protocol: a command per line, a reply per line, and the expiries of
+        every session as they happen.
+
+        Args:
+            reader (StreamReader): the commands.
+            writer (StreamWriter): the replies and the events.
+        """
+        self.writers.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    reply = self.handle(json.loads(line))
+                except ValueError:
+                    reply = {"ok": False, "error": "invalid JSON"}
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    async def serve(self, host: str = SERVER_HOST, port: int = HOST_PORT) -> None:
+        """Serves the clients and drives the sessions, forever.
+
+        Args:
+            host (str): the address to listen on.
+            port (int): the port to listen on.
+        """
+        server = await asyncio.start_server(self.serve_client, host, port)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.run())
+
+
+# -------------------- FUNCTIONS --------------------
+def main() -> None:
+    """Runs the session host, as a service: python -m src.host [port].
+    """
+    import sys
+
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else HOST_PORT
+    asyncio.run(SessionHost().serve(port=port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# -------------------- IMPORTS --------------------
+import json
+from array import array
+from tkinter import StringVar
+
+from .scheduler import *
+from .views import RenderQueue
+
+
+# -------------------- CLASSES --------------------
+class Histogram:
+    def __init__(self, unit: str, size: int = HISTOGRAM_BUCKETS) -> None:
+        """Builds a histogram of fixed size, whatever the amount of values. Bucket i counts the values of i bits,
+        from 2 ** (i - 1) to 2 ** i - 1, the last bucket counts the larger values too.
+
+        Args:
+            unit (str): the unit of the values, for the reports.
+            size (int): the amount of buckets.
+        """
+        self.unit = unit
+        self.buckets = array("Q", bytes(8 * size))
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def add(self, value: int) -> None:
+        """Counts a value.
+
+        Args:
+            value (int): the value, not negative.
+        """
+        self.buckets[min(value.bit_length(), len(self.buckets) - 1)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def percentile(self, fraction: float) -> int:
+        """Returns an upper bound of a percentile: the largest value of the bucket containing it.
+
+        Args:
+            fraction (float): the percentile, from 0 to 1.
+
+        Returns:
+            int: the upper bound, 0 if the histogram is empty.
+        """
+        rank = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << bucket) - 1, self.maximum)
+        return 0
+
+    def summary(self) -> str:
+        """Returns a line describing the distribution.
+
+        Returns:
+            str: the mean, median, p99 and max.
+        """
+        mean = self.total / self.count if self.count else 0
+        return (f"mean {mean:.0f}, p50 <= {self.percentile(0.5)}, p99 <= {self.percentile(0.99)}, "
+                f"max {self.maximum} {self.unit}")
+
+    def to_dict(self) -> dict:
+        """Returns the histogram as JSON-ready data.
+
+        Returns:
+            dict: the statistics and the counts of the buckets.
+        """
+        return {
+            "unit": self.unit,
+            "count": self.count,
+            "total": self.total,
+            "max": self.maximum,
+            "buckets": {f"< {1 << bucket}": count for bucket, count in enumerate(self.buckets) if count},
+        }
+
+
+class TickProbe:
+    def __init__(self, scheduler: TickScheduler) -> None:
+        """Builds the instrumentation of the refresh loop: how late each tick wakes up compared to its deadline, how
+        long it lasts, and how many widgets it updates (labels set, canvas items queued). Nothing is measured until
+        installed, and uninstalling restores the original methods, so the refresh loop has no overhead when off.
+
+        Args:
+            scheduler (TickScheduler): the refresh loop to measure.
+        """
+        self.scheduler = scheduler
+        self.wake = Histogram("us")
+        self.duration = Histogram("us")
+        self.updates = Histogram("widgets")
+        self.counter = 0
+        self.patched = []
+
+    @property
+    def installed(self) -> bool:
+        """Returns True if the probe is measuring.
+
+        Returns:
+            bool: whether the probe is installed.
+        """
+        return "tick" in vars(self.scheduler)
+
+    def install(self) -> None:
+        """Wraps the tick of the scheduler and the methods updating widgets. A tick already pending calls the original
+        tick, the following ones are measured.
+        """
+        if self.installed:
+            return
+        self.scheduler.tick = self.tick
+        for cls, name in ((StringVar, "set"), (RenderQueue, "itemconfig")):
+            method = getattr(cls, name)
+            self.patched.append((cls, name, vars(cls).get(name)))
+            setattr(cls, name, self.counting(method))
+
+    def uninstall(self) -> None:
+        """Restores the original methods.
+        """
+        if not self.installed:
+            return
+        del self.scheduler.tick
+        for cls, name, method in reversed(self.patched):
+            if method is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, method)
+        self.patched.clear()
+
+    def counting(self, method):
+        """Returns a method which counts its calls, then calls the original one.
+
+        Args:
+            method (callable): the original method.
+
+        Returns:
+            callable: the counting method.
+        """
+        def counted(*args, **options):
+            self.counter += 1
+            return method(*args, **options)
+
+        return counted
+
+    def tick(self) -> None:
+        """Measures a tick of the scheduler.
+        """
+        scheduler = self.scheduler
+        start = scheduler.clock()
+        self.wake.add(max(start - scheduler.wake_time, 0) // NS_PER_MICROSECOND)
+        self.counter = 0
+        TickScheduler.tick(scheduler)
+        self.duration.add((scheduler.clock() - start) // NS_PER_MICROSECOND)
+        self.updates.add(self.counter)
+
+    def report(self) -> str:
+        """Returns the text of the debug overlay.
+
+        Returns:
+            str: a line per histogram.
+        """
+        return (f"ticks      {self.duration.count}\n"
+                f"wake late  {self.wake.summary()}\n"
+                f"duration   {self.duration.summary()}\n"
+                f"updates    {self.updates.summary()}")
+
+    def dump(self, path) -> None:
+        """Writes the histograms to a JSON file.
+
+        Args:
+            path (Path|str): the file to write.
+        """
+        data = {"wake_late": self.wake, "duration": self.duration, "updates": self.updates}
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({name: histogram.to_dict() for name, histogram in data.items()}, file, indent=2)
@@ -0,0 +1,249 @@
+# -------------------- IMPORTS --------------------
+import mmap
+import os
+from struct import Struct
+from time import time_ns
+
+from .engine import *
+
+
+# -------------------- CONSTANTS --------------------
+# kind (0 marks the end of the journal), event or mode, index or size, flags, memory, total, wall-clock start
+RECORD = Struct("<BBHIqqq")
+
+# Kinds of record
+SESSION = 1
+SLOT = 2
+END = 3
+
+# Events of the slot records
+SNAPSHOT, RUN, PAUSE, RESET, ADD_TIME, EXPIRE = range(6)
+
+# Flags of the slot records
+PAUSED = 1
+ARMED = 2
+
+
+# -------------------- CLASSES --------------------
+class Session:
+    def __init__(self, mode: int, size: int) -> None:
+        """Builds the state of a session read from a journal.
+
+        Args:
+            mode (int): the index of the mode in the menu.
+            size (int): the amount of chronos / timers.
+        """
+        self.mode = mode
+        self.size = size
+        self.slots = {}
+
+
+class SessionJournal(EngineObserver):
+    def __init__(self, path, capacity: int = JOURNAL_RECORDS, wall=time_ns) -> None:
+        """Builds an append-only journal of the transitions of an engine, so a session survives a crash of the
+        process. The file is memory-mapped: appending a record is a copy to memory, the kernel writes it to the disk.
+        Each record holds the resulting state of a chrono / timer, so only the records since the last session start
+        are replayed. Once the file is full, it is compacted to a snapshot of the current state.
+
+        Args:
+            path (Path|str): the journal file, created if needed.
+            capacity (int): the amount of records of the file.
+            wall (Callable): the wall clock, in nanoseconds, which survives a restart unlike the monotonic clock.
+        """
+        self.path = str(path)
+        self.capacity = capacity
+        self.wall = wall
+        self.engine = None
+        self.mode = 0
+        self.position = 0
+        self.file = None
+        self.map = None
+        if not os.path.exists(self.path):
+            self.create(self.path, b"")
+        self.open()
+
+    def open(self) -> None:
+        """Maps the file, and finds the end of the journal.
+        """
+        self.file = open(self.path, "r+b")
+        size = os.fstat(self.file.fileno()).st_size
+        if size < RECORD.size * self.capacity:
+            self.file.truncate(RECORD.size * self.capacity)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.capacity = len(self.map) // RECORD.size
+        self.position = 0
+        while self.position < self.capacity and self.map[self.position * RECORD.size]:
+            self.position += 1
+
+    def close(self) -> None:
+        """Unmaps the file. The kernel still writes what was appended, even if the process dies.
+        """
+        if self.map is not None:
+            self.map.close()
+            self.file.close()
+            self.map = self.file = None
+
+    def create(self, path: str, data: bytes) -> None:
+        """Writes a complete journal file, then atomically replaces the previous one, so a crash of the process keeps
+        either of them.
+
+        Args:
+            path (str): the journal file.
+            data (bytes): the records.
+        """
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(data)
+            file.truncate(max(RECORD.size * self.capacity, len(data)))
+        os.replace(temporary, path)
+
+    def replay(self) -> Session | None:
+        """Rebuilds the state of the last session.
+
+        Returns:
+            Session|None: the last session, None if it was closed or there is none.
+        """
+        session = None
+        for offset in range(0, self.position * RECORD.size, RECORD.size):
+            kind, event, index, flags, memory, total, wall_start = RECORD.unpack_from(self.map, offset)
+            if kind == SESSION:
+                session = Session(event, index)
+            elif kind == END:
+                session = None
+            elif kind == SLOT and session is not None:
+                session.slots[index] = flags, memory, total, wall_start
+        return session
+
+    def resume(self, engine: ChronoEngine, session: Session) -> None:
+        """Restores a session to the engine built for it, and records it as the current session. Running chronos /
+        timers went on counting while the application was closed.
+
+        Args:
+            engine (ChronoEngine): the engine of the restored mode, already attached.
+            session (Session): the replayed session.
+        """
+        now, wall = engine.models.clock(), self.wall()
+        states = {}
+        for index, (flags, memory, total, wall_start) in session.slots.items():
+            if index < len(engine):
+                states[index] = now - (wall - wall_start), memory, total, flags & PAUSED, flags & ARMED
+        engine.restore(states)
+        self.compact()
+
+    def attach(self, engine: ChronoEngine, mode: int) -> None:
+        """Starts recording a new session.
+
+        Args:
+            engine (ChronoEngine): the engine to record.
+            mode (int): the index of the mode in the menu.
+        """
+        self.detach()
+        self.engine, self.mode = engine, mode
+        engine.subscribe(self)
+        self.compact()
+
+    def detach(self) -> None:
+        """Stops recording the current session, which will not be restored.
+        """
+        if self.engine is not None:
+            self.engine.unsubscribe(self)
+            self.engine = None
+            self.append(RECORD.pack(END, 0, 0, 0, 0, 0, 0))
+
+    def compact(self) -> None:
+        """Rewrites the journal as a snapshot of the current session.
+        """
+        data = self.snapshot()
+        self.capacity = max(self.capacity, 2 * len(data) // RECORD.size)
+        self.close()
+        self.create(self.path, data)
+        self.open()
+
+    def snapshot(self) -> bytes:
+        """Returns the records describing the current session.
+
+        Returns:
+            bytes: the records, none if no session is recorded.
+        """
+        if self.engine is None:
+            return b""
+        header = RECORD.pack(SESSION, self.mode, len(self.engine), 0, 0, 0, 0)
+        return header + self.records(SNAPSHOT, range(len(self.engine)))
+
+    def records(self, event: int, indexes: Iterable) -> bytes:
+        """Returns the slot records of some chronos / timers.
+
+        Args:
+            event (int): the transition recorded.
+            indexes (Iterable): which chronos / timers.
+
+        Returns:
+            bytes: the records.
+        """
+        models = self.engine.models
+        armed = getattr(self.engine, "armed", None)
+        offset = self.wall() - models.clock()
+        return b"".join(
+            RECORD.pack(
+                SLOT, event, index,
+                models.paused[index] * PAUSED | (armed is not None and armed[index]) * ARMED,
+                models.memory[index], models.total[index], models.start[index] + offset,
+            )
+            for index in indexes
+        )
+
+    def append(self, data: bytes) -> None:
+        """Appends records, compacting the journal if they do not fit. The kind byte of the first record is written
+        last, so a record cut by a crash ends the journal instead of corrupting it.
+
+        Args:
+            data (bytes): the records.
+        """
+        count = len(data) // RECORD.size
+        if self.position + count >= self.capacity:
+            self.compact()
+            return
+        offset = self.position * RECORD.size
+        self.map[offset + 1:offset + len(data)] = data[1:]
+        self.map[offset] = data[0]
+        self.position += count
+
+    def on_run(self, indexes: Iterable) -> None:
+        """Records chronos / timers which were run.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        self.append(self.records(RUN, indexes))
+
+    def on_pause(self, indexes: Iterable) -> None:
+        """Records chronos / timers which were paused.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        self.append(self.records(PAUSE, indexes))
+
+    def on_reset(self, indexes: Iterable) -> None:
+        """Records chronos / timers which were reset.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        self.append(self.records(RESET, indexes))
+
+    def on_add_time(self, indexes: Iterable) -> None:
+        """Records timers whose duration was adjusted.
+
+        Args:
+            indexes (Iterable): which timers.
+        """
+        self.append(self.records(ADD_TIME, indexes))
+
+    def on_expire(self, index: int) -> None:
+        """Records a timer which expired, so it does not ring again once restored.
+
+        Args:
+            index (int): which timer.
+        """
+        self.append(self.records(EXPIRE, (index,)))
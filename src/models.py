@@ -1,97 +1,316 @@
 # -------------------- IMPORTS --------------------
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from time import monotonic_ns
+
+from .constants import *
+
+
+# -------------------- CONSTANTS --------------------
+# A clock returns a monotonic amount of nanoseconds, only differences between two reads are meaningful.
+Clock = Callable[[], int]
 
 
 # -------------------- CLASSES --------------------
-@dataclass
-class TimerModel:
-    start_time: datetime = datetime.now()
-    memory_time: timedelta = timedelta()
-    total_time: timedelta = timedelta()
-    paused: bool = True
+class ManualClock:
+    def __init__(self, now: int = 0) -> None:
+        """Builds a clock which only moves when asked to, so models can be driven without waiting.
+
+        Args:
+            now (int): the initial value of the clock, in nanoseconds.
+        """
+        self.now = now
+
+    def __call__(self) -> int:
+        """Returns the current value of the clock.
+
+        Returns:
+            int: the current time, in nanoseconds.
+        """
+        return self.now
+
+    def advance(self, seconds: int | float) -> None:
+        """Moves the clock forward.
+
+        Args:
+            seconds (int|float): the amount of time to move forward.
+        """
+        self.now += to_ns(seconds)
+
+
+class TimeBank:
+    def __init__(self, size: int, countdown: bool = False, clock: Clock = monotonic_ns) -> None:
+        """Builds a bank of chronos (or timers, if countdown), stored as contiguous arrays of integer nanoseconds
+        rather than a list of models. Every bulk operation reads the clock once. The paused ones are counted, so
+        knowing whether all of them run, or none, does not go through the arrays.
+
+        Args:
+            size (int): the amount of chronos / timers.
+            countdown (bool): True for timers (remaining time), False for chronos (elapsed time).
+            clock (Clock): the clock shared by every chrono / timer.
+        """
+        self.countdown = countdown
+        self.clock = clock
+        self.start = array("q", bytes(8 * size))
+        self.memory = array("q", bytes(8 * size))
+        self.total = array("q", bytes(8 * size))
+        self.paused = array("b", b"\x01" * size)
+        self.nb_paused = size
+
+    def __len__(self) -> int:
+        """Returns the amount of chronos / timers.
+
+        Returns:
+            int: the size of the bank.
+        """
+        return len(self.paused)
 
     @property
-    def remaining_time(self) -> timedelta:
-        """Returns the amount of time to display as a timedelta.
+    def all_paused(self) -> bool:
+        """Returns True if nothing is running.
 
         Returns:
-            timedelta: the amount of remaining time.
+            bool: whether every chrono / timer is paused.
         """
-        if self.paused:
-            return self.memory_time
-        else:
-            return self.start_time + self.memory_time - datetime.now()
+        return self.nb_paused == len(self.paused)
+
+    @property
+    def all_running(self) -> bool:
+        """Returns True if everything is running.
 
-    def run(self) -> None:
-        """Counts a duration by now.
+        Returns:
+            bool: whether no chrono / timer is paused.
         """
-        self.start_time = datetime.now()
-        self.paused = False
+        return self.nb_paused == 0
+
+    def elapsed_ns(self, index: int, now: int | None = None) -> int:
+        """Returns the elapsed time of one chrono, from the arrays alone: nothing is allocated but the result.
 
-    def pause(self) -> None:
-        """Stops counting duration, saving actual duration
+        Args:
+            index (int): which chrono.
+            now (int|None): the time to read the value at, the clock is read if None.
+
+        Returns:
+            int: the amount of elapsed time, in nanoseconds.
         """
-        self.memory_time = self.remaining_time
-        self.paused = True
+        if self.paused[index]:
+            return self.memory[index]
+        if now is None:
+            now = self.clock()
+        return self.memory[index] + now - self.start[index]
 
-    def reset(self) -> None:
-        """Resets the timer
+    def remaining_ns(self, index: int, now: int | None = None) -> int:
+        """Returns the remaining time of one timer, from the arrays alone: nothing is allocated but the result.
+
+        Args:
+            index (int): which timer.
+            now (int|None): the time to read the value at, the clock is read if None.
 
         Returns:
-            None
+            int: the amount of remaining time, in nanoseconds.
         """
-        self.start_time = datetime.now()
-        self.memory_time = timedelta()
-        self.total_time = timedelta()
-        self.paused = True
+        if self.paused[index]:
+            return self.memory[index]
+        if now is None:
+            now = self.clock()
+        return self.memory[index] + self.start[index] - now
 
-    def add_time(self, seconds: int|float) -> None:
-        """Adjusts the timer duration
+    def value(self, index: int, now: int | None = None) -> int:
+        """Returns the elapsed (or remaining, if countdown) time of one chrono / timer.
 
         Args:
-            seconds: (int|float): the amount of time to increase / decrease.
+            index (int): which chrono / timer.
+            now (int|None): the time to read the value at, the clock is read if None.
+
+        Returns:
+            int: the amount of time, in nanoseconds.
+        """
+        if self.countdown:
+            return self.remaining_ns(index, now)
+        return self.elapsed_ns(index, now)
+
+    def values(self) -> list:
+        """Returns the elapsed (or remaining, if countdown) time of every chrono / timer, for a single clock read.
+
+        Returns:
+            list: the amounts of time, in nanoseconds.
         """
-        if self.total_time + timedelta(seconds=seconds) > timedelta():
-            self.total_time += timedelta(seconds=seconds)
+        now = self.clock()
+        if self.countdown:
+            return [memory if paused else memory + start - now
+                    for start, memory, paused in zip(self.start, self.memory, self.paused)]
+        return [memory if paused else memory + now - start
+                for start, memory, paused in zip(self.start, self.memory, self.paused)]
+
+    def run(self, indexes: int | Iterable | None = None) -> None:
+        """Runs the selected chronos / timers which are paused.
+
+        Args:
+            indexes (int|Iterable|None): which chronos / timers, all of them if None.
+        """
+        now = self.clock()
+        for index in self.select(indexes):
+            if self.paused[index]:
+                self.start[index] = now
+                self.paused[index] = 0
+                self.nb_paused -= 1
+
+    def pause(self, indexes: int | Iterable | None = None) -> None:
+        """Pauses the selected chronos / timers, saving their actual duration.
+
+        Args:
+            indexes (int|Iterable|None): which chronos / timers, all of them if None.
+        """
+        now = self.clock()
+        for index in self.select(indexes):
+            if not self.paused[index]:
+                if self.countdown:
+                    self.memory[index] += self.start[index] - now
+                else:
+                    self.memory[index] += now - self.start[index]
+                self.paused[index] = 1
+                self.nb_paused += 1
+
+    def reset(self, indexes: int | Iterable | None = None) -> None:
+        """Resets the selected chronos / timers.
+
+        Args:
+            indexes (int|Iterable|None): which chronos / timers, all of them if None.
+        """
+        now = self.clock()
+        for index in self.select(indexes):
+            self.start[index] = now
+            self.memory[index] = 0
+            self.total[index] = 0
+            if not self.paused[index]:
+                self.paused[index] = 1
+                self.nb_paused += 1
+
+    def set_state(self, index: int, start: int, memory: int, total: int, paused: bool) -> None:
+        """Overwrites the state of one chrono / timer, as restored from a journal.
+
+        Args:
+            index (int): which chrono / timer.
+            start (int): when it was last run, in nanoseconds.
+            memory (int): its elapsed (or remaining) time when last paused, in nanoseconds.
+            total (int): the duration of the timer, in nanoseconds.
+            paused (bool): whether it is paused.
+        """
+        self.start[index] = start
+        self.memory[index] = memory
+        self.total[index] = total
+        self.nb_paused += (1 if paused else 0) - self.paused[index]
+        self.paused[index] = 1 if paused else 0
+
+    def add_time(self, seconds: int | float | Sequence, indexes: int | Iterable | None = None) -> None:
+        """Adjusts the duration of the selected timers, and their remaining time, so a started timer keeps the time
+        already elapsed.
+
+        Args:
+            seconds (int|float|Sequence): the amount of time to increase / decrease, or one amount per selected timer.
+            indexes (int|Iterable|None): which timers, all of them if None.
+        """
+        indexes = self.select(indexes)
+        if isinstance(seconds, Sequence):
+            deltas = [to_ns(amount) for amount in seconds]
         else:
-            self.total_time = timedelta()
-        self.memory_time = self.total_time
+            deltas = [to_ns(seconds)] * len(indexes)
+        for index, delta in zip(indexes, deltas):
+            self.total[index] = max(self.total[index] + delta, 0)
+            self.memory[index] = max(self.memory[index] + delta, 0)
 
+    def select(self, indexes: int | Iterable | None) -> Sequence:
+        """Normalizes a selection of chronos / timers, so it can be iterated several times.
 
-@dataclass
-class ChronoModel:
-    start_time: datetime = datetime.now()
-    memory_time: timedelta = timedelta()
-    paused: bool = True
+        Args:
+            indexes (int|Iterable|None): an index, some indexes, or None for all of them.
 
-    @property
-    def elapsed_time(self) -> timedelta:
-        """Returns the durtion between start and now, considering pauses.
+        Returns:
+            Sequence: the selected indexes.
+        """
+        if indexes is None:
+            return range(len(self))
+        if isinstance(indexes, int):
+            return (indexes,)
+        if isinstance(indexes, Sequence):
+            return indexes
+        return tuple(indexes)
+
+
+class LapBook:
+    def __init__(self, size: int) -> None:
+        """Builds the laps of some chronos, stored in capture order as contiguous arrays of integer nanoseconds. Each
+        lap keeps its chrono, its number for this chrono, its split (the elapsed time when captured) and its duration.
+
+        Args:
+            size (int): the amount of chronos.
+        """
+        self.chronos = array("I")
+        self.numbers = array("I")
+        self.splits = array("q")
+        self.laps = array("q")
+        self.counts = array("I", bytes(4 * size))
+        self.last = array("q", bytes(8 * size))
+
+    def __len__(self) -> int:
+        """Returns the amount of laps of every chrono.
 
         Returns:
-            timedelta: the amount of elapsed time.
+            int: the amount of laps.
         """
-        if self.paused:
-            return self.memory_time
-        else:
-            return datetime.now() - self.start_time + self.memory_time
+        return len(self.laps)
+
+    def record(self, index: int, split: int) -> None:
+        """Adds a lap to a chrono.
 
-    def run(self) -> None:
-        """Counts a duration by now.
+        Args:
+            index (int): which chrono.
+            split (int): the elapsed time of the chrono, in nanoseconds.
         """
-        self.start_time = datetime.now()
-        self.paused = False
+        self.counts[index] += 1
+        self.chronos.append(index)
+        self.numbers.append(self.counts[index])
+        self.splits.append(split)
+        self.laps.append(split - self.last[index])
+        self.last[index] = split
+
+    def clear(self, indexes: Iterable | None = None) -> None:
+        """Forgets the laps of some chronos.
 
-    def pause(self) -> None:
-        """Stops counting duration, saving actual duration.
+        Args:
+            indexes (Iterable|None): which chronos, all of them if None.
         """
-        self.memory_time = self.elapsed_time
-        self.paused = True
+        if indexes is None:
+            indexes = range(len(self.counts))
+        cleared = set(indexes)
+        kept = [lap for lap, index in enumerate(self.chronos) if index not in cleared]
+        for column in (self.chronos, self.numbers, self.splits, self.laps):
+            column[:] = array(column.typecode, [column[lap] for lap in kept])
+        for index in cleared:
+            self.counts[index] = 0
+            self.last[index] = 0
+
+    def rows(self, start: int = 0) -> Iterable:
+        """Yields the laps one by one, in capture order.
+
+        Args:
+            start (int): the first lap to yield.
 
-    def reset(self) -> None:
-        """Resets the chrono.
+        Yields:
+            tuple: the chrono, number, split and duration of a lap.
         """
-        self.start_time = datetime.now()
-        self.memory_time = timedelta()
-        self.paused = True
+        for lap in range(start, len(self.laps)):
+            yield self.chronos[lap], self.numbers[lap], self.splits[lap], self.laps[lap]
+
+
+# -------------------- FUNCTIONS --------------------
+def to_ns(seconds: int | float) -> int:
+    """Converts an amount of seconds to integer nanoseconds.
+
+    Args:
+        seconds (int|float): the amount of seconds.
+
+    Returns:
+        int: the same amount, in nanoseconds.
+    """
+    return round(seconds * NS_PER_SECOND)
@@ -0,0 +1,104 @@
+# -------------------- IMPORTS --------------------
+import json
+from collections import Counter, OrderedDict
+
+from .constants import *
+
+
+# -------------------- CLASSES --------------------
+class ModePool:
+    def __init__(self, size: int = POOL_SIZE, usage_path=USAGE) -> None:
+        """Builds a pool of the modes the user left, hidden and reset, so going back to a mode shows it again instead
+        of building it. Modes are keyed by (mode, amount of chronos built), the least recently used ones are closed
+        beyond the size of the pool. The pool also counts how often each mode is opened, across runs, so the most used
+        ones can be built in advance.
+
+        Args:
+            size (int): the maximum amount of hidden modes, 0 to close every mode left.
+            usage_path (Path|None): the file counting the uses of each mode, None to forget them on exit.
+        """
+        self.size = size
+        self.modes = OrderedDict()
+        self.usage_path = usage_path
+        self.usage = Counter()
+        self.load_usage()
+
+    def __contains__(self, key: tuple) -> bool:
+        """Returns True if a mode is hidden in the pool.
+
+        Args:
+            key (tuple): the (mode, amount of chronos) of the mode.
+
+        Returns:
+            bool: whether the mode can be reused.
+        """
+        return key in self.modes
+
+    def take(self, key: tuple):
+        """Removes a mode from the pool, to show it again.
+
+        Args:
+            key (tuple): the (mode, amount of chronos) of the mode.
+
+        Returns:
+            ModeController|None: the controller of the mode, None if it is not in the pool.
+        """
+        return self.modes.pop(key, None)
+
+    def release(self, key: tuple, controller) -> None:
+        """Hides and resets a mode left by the user, and keeps it, closing the least recently used modes beyond the
+        size of the pool.
+
+        Args:
+            key (tuple): the (mode, amount of chronos) of the mode.
+            controller (ModeController): the controller of the mode.
+        """
+        if self.size <= 0:
+            controller.close()
+            return
+        controller.hide()
+        self.modes[key] = controller
+        while len(self.modes) > self.size:
+            self.modes.popitem(last=False)[1].close()
+
+    def count(self, key: tuple) -> None:
+        """Counts a use of a mode. The counts are saved when the application closes, not on the Tk thread at each use.
+
+        Args:
+            key (tuple): the (mode, amount of chronos) of the mode.
+        """
+        self.usage[key] += 1
+
+    def most_used(self, amount: int) -> list:
+        """Returns the most used modes.
+
+        Args:
+            amount (int): the maximum amount of modes.
+
+        Returns:
+            list: the (mode, amount of chronos) of the modes, the most used first.
+        """
+        return [key for key, _ in self.usage.most_common(amount)]
+
+    def load_usage(self) -> None:
+        """Reads the counts of the previous runs, if any. A missing or damaged file counts nothing.
+        """
+        if self.usage_path is None:
+            return
+        try:
+            with open(self.usage_path, encoding="utf-8") as file:
+                counts = json.load(file)
+            self.usage.update({tuple(int(part) for part in key.split(",")): int(uses) for key, uses in counts.items()})
+        except (OSError, ValueError, AttributeError):
+            self.usage.clear()
+
+    def save_usage(self) -> None:
+        """Writes the counts, so the next runs build the most used modes in advance. Failing to write is harmless.
+        """
+        if self.usage_path is None:
+            return
+        try:
+            with open(self.usage_path, "w", encoding="utf-8") as file:
+                json.dump({f"{mode},{size}": uses for (mode, size), uses in self.usage.items()}, file)
+        except OSError:
+            pass
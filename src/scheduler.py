@@ -0,0 +1,85 @@
+# -------------------- IMPORTS --------------------
+from collections.abc import Callable
+from time import monotonic_ns
+
+from .constants import *
+
+
+# -------------------- CLASSES --------------------
+class TickScheduler:
+    def __init__(self, widget, clock: Callable[[], int] = monotonic_ns) -> None:
+        """Builds the application-wide refresh loop. Controllers subscribe a callback while they have running models.
+        Each callback returns the delay until its displayed values change (None to unsubscribe), and a single
+        callback is kept pending, for the earliest of these deadlines.
+
+        Args:
+            widget: any object with Tk's after / after_cancel methods (usually the main window).
+            clock (Callable): the clock the deadlines are measured with, in nanoseconds.
+        """
+        self.widget = widget
+        self.clock = clock
+        self.deadlines = {}
+        self.pending = None
+        self.wake_time = None
+
+    @property
+    def running(self) -> bool:
+        """Returns True if a tick is pending.
+
+        Returns:
+            bool: whether the scheduler is ticking.
+        """
+        return self.pending is not None
+
+    def subscribe(self, callback, delay: int = 0) -> None:
+        """Adds a callback, or moves its deadline if already subscribed. Subscribing twice is harmless.
+
+        Args:
+            callback (callable): the method to call, returning the next delay in nanoseconds, or None to unsubscribe.
+            delay (int): the amount of nanoseconds before the first call.
+        """
+        self.deadlines[callback] = self.clock() + delay
+        self._arm()
+
+    def unsubscribe(self, callback) -> None:
+        """Removes a callback. The scheduler stops ticking when nothing is subscribed anymore.
+
+        Args:
+            callback (callable): the method to remove.
+        """
+        self.deadlines.pop(callback, None)
+        self._arm()
+
+    def tick(self) -> None:
+        """Calls every subscriber whose deadline is reached, then schedules the next tick if needed. Each new deadline
+        is computed from the clock, so a late wake up does not delay the following ones.
+        """
+        self.pending = None
+        now = self.clock()
+        for callback, deadline in list(self.deadlines.items()):
+            if deadline <= now and callback in self.deadlines:
+                delay = callback()
+                if delay is None:
+                    self.deadlines.pop(callback, None)
+                else:
+                    self.deadlines[callback] = self.clock() + delay
+        self._arm()
+
+    def _arm(self) -> None:
+        """Keeps a single callback pending, for the earliest deadline. The wait is rounded down to whole milliseconds,
+        so it never ends after the deadline: a wake up less than 1 ms early finds nothing due, and waits again with a
+        delay of 0 until the deadline is reached.
+        """
+        if not self.deadlines:
+            if self.pending is not None:
+                self.widget.after_cancel(self.pending)
+                self.pending = None
+            return
+        deadline = min(self.deadlines.values())
+        if self.pending is not None:
+            if self.wake_time <= deadline:
+                return
+            self.widget.after_cancel(self.pending)
+        self.wake_time = deadline
+        delay = max((deadline - self.clock()) // NS_PER_MILLISECOND, 0)
+        self.pending = self.widget.after(delay, self.tick)
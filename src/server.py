@@ -0,0 +1,347 @@
+# -------------------- IMPORTS --------------------
+import json
+import socket
+import threading
+from collections import deque
+from time import monotonic_ns
+
+from .engine import *
+
+
+# -------------------- CONSTANTS --------------------
+# The page of the remote displays: the time is interpolated by the browser between the transitions
+PAGE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Time Manager</title>
+<style>body{font:2em Verdana;background:#f0f0f0;color:#000}td{padding:0 .5em}</style></head>
+<body><table id="chronos"></table>
+<script>
+let session = null;
+function format(ns) {
+  const tenths = Math.max(Math.floor(ns / 1e8), 0), seconds = Math.floor(tenths / 10) % 60;
+  const minutes = Math.floor(tenths / 600) % 60, hours = Math.floor(tenths / 36000) % 24;
+  const two = n => String(n).padStart(2, "0"), end = two(seconds) + "." + tenths % 10;
+  return hours ? hours + ":" + two(minutes) + ":" + end : two(minutes) + ":" + end;
+}
+function update(rows) {
+  const now = performance.now();
+  for (const [index, value, running, total] of rows) session.rows[index] = {value, running, total, at: now};
+}
+function draw() {
+  if (session) {
+    const now = performance.now(), sign = session.countdown ? -1 : 1, cells = [];
+    session.rows.forEach((row, index) => {
+      const value = row.value + (row.running ? sign * (now - row.at) * 1e6 : 0);
+      cells.push("<tr><td>" + (index + 1) + "</td><td>" + format(value) + "</td></tr>");
+    });
+    document.getElementById("chronos").innerHTML = cells.join("");
+  }
+  requestAnimationFrame(draw);
+}
+function connect() {
+  const socket = new WebSocket((location.protocol == "https:" ? "wss://" : "ws://") + location.host + "/ws");
+  socket.onmessage = message => {
+    const data = JSON.parse(message.data);
+    if (data.event == "session") {
+      session = {countdown: data.countdown, rows: []};
+      update(data.chronos);
+    } else if (data.event == "end") {
+      session = null;
+      document.getElementById("chronos").innerHTML = "";
+    } else if (session) {
+      update(data.chronos);
+    }
+  };
+  socket.onclose = () => setTimeout(connect, 1000);
+}
+connect();
+requestAnimationFrame(draw);
+</script></body>
+</html>
+"""
+
+
+# -------------------- CLASSES --------------------
+class StateChannel:
+    def __init__(self) -> None:
+        """Builds the set of the connected clients. Any object with a send(str) method is a client: a WebSocket of
+        the server, or a stand-in of the load test.
+        """
+        self.clients = set()
+
+    def __len__(self) -> int:
+        """Returns the amount of connected clients.
+
+        Returns:
+            int: the amount of clients.
+        """
+        return len(self.clients)
+
+    def connect(self, client, snapshot: str) -> None:
+        """Sends the current state to a new client, which then receives every event.
+
+        Args:
+            client: the client.
+            snapshot (str): the message describing the current state.
+        """
+        try:
+            client.send(snapshot)
+        except OSError:
+            return
+        self.clients.add(client)
+
+    def disconnect(self, client) -> None:
+        """Forgets a client.
+
+        Args:
+            client: the client.
+        """
+        self.clients.discard(client)
+
+    def publish(self, message: str) -> None:
+        """Sends a message, encoded once, to every client. The clients which cannot receive it are forgotten.
+
+        Args:
+            message (str): the message.
+        """
+        for client in list(self.clients):
+            try:
+                client.send(message)
+            except OSError:
+                self.clients.discard(client)
+
+
+class StatePublisher(EngineObserver):
+    def __init__(self, post, clock=monotonic_ns) -> None:
+        """Builds the observer turning the transitions of an engine into messages for the remote displays. Each
+        message only describes the chronos / timers of the transition: their value when it happened, whether they
+        run, and their duration. The clients count the time themselves between the messages, so nothing is sent
+        while the chronos / timers merely run.
+
+        Args:
+            post (Callable): sends a message to the clients, from the thread of the engine.
+            clock (Callable): the clock of the engine, in nanoseconds.
+        """
+        self.post = post
+        self.clock = clock
+        self.engine = None
+        self.mode = 0
+        self.countdown = False
+        self.rows = []
+
+    def attach(self, engine: ChronoEngine, mode: int) -> None:
+        """Starts publishing a new session.
+
+        Args:
+            engine (ChronoEngine): the engine to publish.
+            mode (int): the index of the mode in the menu.
+        """
+        self.detach()
+        self.engine, self.mode = engine, mode
+        self.clock, self.countdown = engine.models.clock, engine.countdown
+        self.rows = [None] * len(engine)
+        self.update(range(len(engine)))
+        engine.subscribe(self)
+        self.post(self.snapshot())
+
+    def detach(self) -> None:
+        """Stops publishing the current session, the clients clear their display.
+        """
+        if self.engine is not None:
+            self.engine.unsubscribe(self)
+            self.engine = None
+            self.rows = []
+            self.post(json.dumps({"event": "end"}))
+
+    def update(self, indexes: Iterable) -> list:
+        """Remembers the state of some chronos / timers, for the snapshots of the clients connecting later.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+
+        Returns:
+            list: the [index, value, running, duration] row of each one, values in nanoseconds.
+        """
+        models = self.engine.models
+        now = models.clock()
+        rows = []
+        for index in indexes:
+            running = 1 - models.paused[index]
+            value, total = models.value(index, now), models.total[index]
+            self.rows[index] = value, running, total, now
+            rows.append([index, value, running, total])
+        return rows
+
+    def snapshot(self) -> str:
+        """Returns the message describing the whole session, for a client connecting. It may be called from the
+        thread of the server: it only reads the remembered rows, skipping those of a session being attached.
+
+        Returns:
+            str: the message.
+        """
+        rows = self.rows
+        if not rows:
+            return json.dumps({"event": "end"})
+        now = self.clock()
+        sign = -1 if self.countdown else 1
+        chronos = [
+            [index, row[0] + sign * (now - row[3]) if row[1] else row[0], row[1], row[2]]
+            for index, row in enumerate(rows) if row is not None
+        ]
+        return json.dumps({"event": "session", "mode": self.mode, "countdown": self.countdown, "chronos": chronos})
+
+    def publish(self, event: str, indexes: Iterable) -> None:
+        """Sends the new state of the chronos / timers of a transition.
+
+        Args:
+            event (str): the transition.
+            indexes (Iterable): which chronos / timers.
+        """
+        self.post(json.dumps({"event": event, "chronos": self.update(indexes)}))
+
+    def on_run(self, indexes: Iterable) -> None:
+        """Publishes chronos / timers which were run.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        self.publish("run", indexes)
+
+    def on_pause(self, indexes: Iterable) -> None:
+        """Publishes chronos / timers which were paused.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        self.publish("pause", indexes)
+
+    def on_reset(self, indexes: Iterable) -> None:
+        """Publishes chronos / timers which were reset.
+
+        Args:
+            indexes (Iterable): which chronos / timers.
+        """
+        self.publish("reset", indexes)
+
+    def on_add_time(self, indexes: Iterable) -> None:
+        """Publishes timers whose duration was adjusted.
+
+        Args:
+            indexes (Iterable): which timers.
+        """
+        self.publish("add_time", indexes)
+
+    def on_expire(self, index: int) -> None:
+        """Publishes a timer which expired.
+
+        Args:
+            index (int): which timer.
+        """
+        self.publish("expire", (index,))
+
+
+class StateServer:
+    def __init__(self, host: str = SERVER_HOST, port: int = SERVER_PORT) -> None:
+        """Builds the server of the remote displays: a page, and a WebSocket publishing the transitions of the
+        current session. It runs on gevent, in its own thread, so the Tk main loop is never blocked by a client.
+        The listening socket is opened at once, so an unavailable port raises OSError here.
+
+        Args:
+            host (str): the address to listen on.
+            port (int): the port to listen on, 0 for any free port.
+        """
+        self.listener = socket.create_server((host, port))
+        self.port = self.listener.getsockname()[1]
+        self.channel = StateChannel()
+        self.publisher = StatePublisher(self.post)
+        self.outbox = deque()
+        self.wakeup = None
+        self.lock = None
+        self.server = None
+        self.error = None
+        self.ready = threading.Event()
+        self.thread = threading.Thread(target=self.serve, name="state-server", daemon=True)
+
+    def start(self) -> None:
+        """Starts the server thread, and waits until messages can be posted. Raises ImportError if the web stack of
+        requirements.txt is not installed.
+        """
+        self.thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            self.listener.close()
+            raise self.error
+
+    def stop(self) -> None:
+        """Stops the server, from any thread.
+        """
+        if self.thread.is_alive():
+            self.post(None)
+            self.thread.join()
+
+    def serve(self) -> None:
+        """Runs the server, in its thread: the gevent hub of the thread wakes up to send the posted messages.
+        """
+        try:
+            from bottle import Bottle
+            from gevent import get_hub, spawn
+            from gevent.lock import Semaphore
+            from gevent.pywsgi import WSGIServer
+            from geventwebsocket.handler import WebSocketHandler
+        except ImportError as error:
+            self.error = error
+            self.ready.set()
+            return
+
+        self.lock = Semaphore()
+        self.wakeup = get_hub().loop.async_()
+        self.wakeup.start(lambda: spawn(self.flush))
+        application = Bottle()
+        application.route("/", callback=lambda: PAGE)
+        application.route("/ws", callback=self.websocket)
+        self.server = WSGIServer(self.listener, application, handler_class=WebSocketHandler, log=None)
+        self.ready.set()
+        self.server.serve_forever()
+
+    def post(self, message: str | None) -> None:
+        """Queues a message for every client. Called from the thread of the engine, it only wakes the server up.
+
+        Args:
+            message (str|None): the message, None to stop the server.
+        """
+        self.outbox.append(message)
+        if self.wakeup is not None:
+            self.wakeup.send()
+
+    def flush(self) -> None:
+        """Sends the queued messages, in the server thread.
+        """
+        with self.lock:
+            while self.outbox:
+                message = self.outbox.popleft()
+                if message is None:
+                    self.server.stop()
+                    return
+                self.channel.publish(message)
+
+    def websocket(self) -> str:
+        """Serves a client: sends it the current state, then the transitions until it disconnects.
+
+        Returns:
+            str: an empty response, once the client is gone.
+        """
+        from bottle import abort, request
+
+        client = request.environ.get("wsgi.websocket")
+        if client is None:
+            abort(400, "WebSocket expected")
+        with self.lock:
+            self.channel.connect(client, self.publisher.snapshot())
+        try:
+            while client.receive() is not None:
+                pass
+        except OSError:
+            pass
+        finally:
+            self.channel.disconnect(client)
+        return ""
@@ -1,55 +1,239 @@
 # -------------------- IMPORTS --------------------
+from collections import OrderedDict
+from collections.abc import Sequence
+from math import atan2, ceil, degrees, floor, pi, sqrt
+from os import environ
 from tkinter import *
 from .constants import *
 
 
 # -------------------- CLASSES --------------------
+class RenderQueue:
+    def __init__(self, widget: Misc) -> None:
+        """Builds a queue of canvas changes. The changes requested during a tick are merged, then applied once when
+        Tk becomes idle, instead of forcing a synchronous (and re-entrant) redraw for each of them.
+
+        Args:
+            widget (Misc): the widget used to schedule the flush, which must outlive the canvases (the main window).
+        """
+        self.widget = widget
+        self.changes = {}
+        self.pending = None
+
+    def itemconfig(self, canvas: Canvas, item: int, **options) -> None:
+        """Queues a change of a canvas item. A later change of the same option, before the flush, wins.
+
+        Args:
+            canvas (Canvas): the canvas containing the item.
+            item (int): the id of the item.
+            **options: the options to change, as for Canvas.itemconfig.
+        """
+        self.changes.setdefault((canvas, item), {}).update(options)
+        if self.pending is None:
+            self.pending = self.widget.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """Applies every queued change, skipping the canvases destroyed in the meantime.
+        """
+        changes = self.changes
+        self.changes = {}
+        self.pending = None
+        for (canvas, item), options in changes.items():
+            if canvas.winfo_exists():
+                canvas.itemconfig(item, **options)
+
+
+class ImageCache:
+    def __init__(self, size: int = IMAGE_CACHE_SIZE) -> None:
+        """Builds a cache of decoded images, keyed by (path, subsample factor), shared by every view of the
+        application. Images are loaded on first use, and the least recently used ones are forgotten beyond the size
+        of the cache (the widgets using them keep them alive).
+
+        Args:
+            size (int): the maximum amount of images to keep.
+        """
+        self.size = size
+        self.images = OrderedDict()
+
+    def get(self, path, factor: int = 1) -> PhotoImage:
+        """Returns an image, loading it if needed. Subsampled images reuse the decoded original.
+
+        Args:
+            path (Path): the path of the image.
+            factor (int): the subsample factor.
+
+        Returns:
+            PhotoImage: the image.
+        """
+        key = (path, factor)
+        if key in self.images:
+            self.images.move_to_end(key)
+            return self.images[key]
+        if factor == 1:
+            image = PhotoImage(file=path)
+        else:
+            image = self.get(path).subsample(factor)
+        self.images[key] = image
+        while len(self.images) > self.size:
+            self.images.popitem(last=False)
+        return image
+
+    def preload(self, keys) -> None:
+        """Loads some images in advance.
+
+        Args:
+            keys (Iterable): the (path, subsample factor) tuples to load.
+        """
+        for path, factor in keys:
+            self.get(path, factor)
+
+
+class ClockFaceCache:
+    def __init__(self, widget: Misc, steps: int = CLOCK_FACE_STEPS, size: int = CLOCK_FACE_CACHE_SIZE) -> None:
+        """Builds a cache of pre-rendered clock faces, shared by every timer of the application: the circle of a
+        timer, with the slice of remaining time at one of a fixed amount of angles. A tick then swaps the image shown
+        by the clock, instead of Tk rasterizing the slice again. Faces are rendered on first use, the next one of a
+        countdown in advance when Tk is idle, and the least recently used ones are forgotten beyond the size of the
+        cache (the views keep the face they show). The full face of each diameter, shown by every timer at rest, is
+        always kept.
+
+        Args:
+            widget (Misc): the widget used to schedule the renderings in advance (the main window).
+            steps (int): the amount of angles of the slice, over a full turn.
+            size (int): the maximum amount of faces to keep.
+        """
+        self.widget = widget
+        self.steps = steps
+        self.size = size
+        self.faces = OrderedDict()
+        self.full = {}
+        self.bases = {}
+        self.rows = {}
+        self.queued = set()
+
+    def __len__(self) -> int:
+        """Returns the amount of faces kept.
+
+        Returns:
+            int: the amount of faces.
+        """
+        return len(self.faces)
+
+    def get(self, diameter: int, step: int) -> PhotoImage:
+        """Returns a face, rendering it if needed, and renders the face of the previous step when Tk is idle.
+
+        Args:
+            diameter (int): the diameter of the clock, as given to TimerView.
+            step (int): the extent of the slice, in steps of the full turn (steps for the full circle).
+
+        Returns:
+            PhotoImage: the face.
+        """
+        key = (diameter, step)
+        if key in self.faces:
+            self.faces.move_to_end(key)
+        elif step != self.steps or diameter not in self.full:
+            self.render(diameter, step)
+        previous = (diameter, step - 1)
+        if step > 0 and previous not in self.faces and previous not in self.queued:
+            self.queued.add(previous)
+            self.widget.after_idle(self.prefetch, diameter, step - 1)
+        if step == self.steps:
+            return self.full[diameter]
+        return self.faces[key]
+
+    def prefetch(self, diameter: int, step: int) -> None:
+        """Renders a face in advance, unless it was rendered meanwhile.
+
+        Args:
+            diameter (int): the diameter of the clock.
+            step (int): the extent of the slice, in steps.
+        """
+        self.queued.discard((diameter, step))
+        if (diameter, step) not in self.faces:
+            self.render(diameter, step)
+
+    def render(self, diameter: int, step: int) -> None:
+        """Renders a face: a copy of the empty face of the diameter, the pixels of the slice filled row by row.
+
+        Args:
+            diameter (int): the diameter of the clock.
+            step (int): the extent of the slice, in steps.
+        """
+        if diameter not in self.bases:
+            self.prepare(diameter)
+        face = self.bases[diameter].copy()
+        extent = 360 * step / self.steps
+        for y, start, angles in self.rows[diameter]:
+            run = None
+            for x, angle in enumerate(angles, start):
+                if angle < extent:
+                    if run is None:
+                        run = x
+                elif run is not None:
+                    face.put(CHRONO_COLOR, to=(run, y, x, y + 1))
+                    run = None
+            if run is not None:
+                face.put(CHRONO_COLOR, to=(run, y, start + len(angles), y + 1))
+        if step == self.steps:
+            self.full[diameter] = face
+            return
+        self.faces[(diameter, step)] = face
+        while len(self.faces) > self.size:
+            self.faces.popitem(last=False)
+
+    def prepare(self, diameter: int) -> None:
+        """Renders the empty face of a diameter, the circle of TimerView, and measures the angle of every pixel inside
+        its slice area: counterclockwise from the top, as the extent of an arc starting at 90 degrees.
+
+        Args:
+            diameter (int): the diameter of the clock.
+        """
+        center = (MARGIN + diameter) / 2
+        outer = (diameter - MARGIN) / 2
+        inner = outer - MARGIN
+        base = PhotoImage(width=diameter, height=diameter)
+        base.put(BG_COLOR, to=(0, 0, diameter, diameter))
+        rows = []
+        for y in range(diameter):
+            dy = y + 0.5 - center
+            if abs(dy) >= outer:
+                continue
+            half = sqrt(outer * outer - dy * dy)
+            base.put(TXT_COLOR, to=(ceil(center - half - 0.5), y, floor(center + half - 0.5) + 1, y + 1))
+            if abs(dy) >= inner:
+                continue
+            half = sqrt(inner * inner - dy * dy)
+            start, end = ceil(center - half - 0.5), floor(center + half - 0.5) + 1
+            rows.append((y, start, [degrees(atan2(center - x - 0.5, -dy)) % 360 for x in range(start, end)]))
+        self.bases[diameter] = base
+        self.rows[diameter] = rows
+
+
 class AssetsManager:
     def __init__(self, view):
-        if isinstance(view, SimultaneousChronoView):
-            self.home_img = PhotoImage(file=HOME).subsample(2)
-            self.run_img = PhotoImage(file=RUN).subsample(2)
-            self.pause_img = PhotoImage(file=PAUSE).subsample(2)
-            self.reset_img = PhotoImage(file=RESET).subsample(2)
-    
-        elif isinstance(view, MultiTimerView):
-            self.home_img = PhotoImage(file=HOME).subsample(1)
-            self.run_img = PhotoImage(file=RUN).subsample(1)
-            self.pause_img = PhotoImage(file=PAUSE).subsample(1)
-            self.reset_img = PhotoImage(file=RESET).subsample(1)
-            self.up_img = PhotoImage(file=UP).subsample(3)
-            self.down_img = PhotoImage(file=DOWN).subsample(3)
-        
-        elif isinstance(view, MultiChronoView):
-            self.home_img = PhotoImage(file=HOME).subsample(2)
-            self.run_img = PhotoImage(file=RUN).subsample(2)
-            self.pause_img = PhotoImage(file=PAUSE).subsample(2)
-            self.reset_img = PhotoImage(file=RESET).subsample(2)
-        
-        if isinstance(view, TimerView):
-            self.home_img = PhotoImage(file=HOME).subsample(3)
-            self.run_img = PhotoImage(file=RUN).subsample(3)
-            self.pause_img = PhotoImage(file=PAUSE).subsample(3)
-            self.reset_img = PhotoImage(file=RESET).subsample(3)
-            self.up_img = PhotoImage(file=UP).subsample(7)
-            self.down_img = PhotoImage(file=DOWN).subsample(7)
-        
-        if isinstance(view, ChronoView):
-            self.home_img = PhotoImage(file=HOME).subsample(1)
-            self.run_img = PhotoImage(file=RUN).subsample(1)
-            self.pause_img = PhotoImage(file=PAUSE).subsample(1)
-            self.reset_img = PhotoImage(file=RESET).subsample(1)
+        """Gets the images of a view from the image cache of the application, as described by its assets attribute.
+
+        Args:
+            view (Frame): the view, whose assets attribute maps attribute names to (path, subsample factor) tuples.
+        """
+        image_cache = view.master.image_cache
+        for name, (path, factor) in view.assets.items():
+            setattr(self, name, image_cache.get(path, factor))
 
 
 class SimultaneousChronoView(Frame):
+    assets = {"home_img": (HOME, 2), "run_img": (RUN, 2), "pause_img": (PAUSE, 2), "reset_img": (RESET, 2)}
+
     def __init__(self, controller, nb_chronos) -> None:
-        """Creates the view of fiew chronos (2 -> 16), with 3 buttons (home/run/reset) and a label where time is
+        """Creates the view of fiew chronos (2 -> 500), with 3 buttons (home/run/reset) and a label where time is
         displayed. Each chrono has an entry to set a name, and a pause button.
-        The controller binds it to the same amount of models.
+        Only the visible rows are built: scrolling rebinds them to other chronos, whose state (name, running) is
+        kept as plain data. The controller binds it to the same amount of models.
 
         Args:
             controller (SimultaneousChronoController): The controller of the view, in the controllers.py file
-            nb_chronos (int): How many chronos you want (2 -> 16).
+            nb_chronos (int): How many chronos you want (2 -> 500).
         """
         super().__init__()
         self.controller = controller
@@ -58,7 +242,12 @@ class SimultaneousChronoView(Frame):
         if nb_chronos not in range(2, MAX_SIM_CHRONOS + 1):
             nb_chronos = 2
         self.nb_chronos = nb_chronos
+        self.first = 0
+        self.chrono_names = [""] * self.nb_chronos
+        self.running = bytearray(self.nb_chronos)
+        self.nb_running = 0
         self.views = []
+        self.displayed_values = []
 
         self.grid(row=0, column=0)
 
@@ -118,28 +307,61 @@ class SimultaneousChronoView(Frame):
         )
         self.reset_btn.grid(row=0, column=3, padx=BIG_PAD)
 
-        # Time Manager
-        for i in range(self.nb_chronos):
+        # Export button
+        self.export_btn = Button(
+            self.button_frm,
+            text=EXPORT,
+            font=SMALL_FONT,
+            fg=TXT_COLOR,
+            command=self.controller.export,
+        )
+        self.export_btn.grid(row=0, column=4, padx=BIG_PAD)
+
+        # Time Manager, only the visible rows
+        for i in range(min(self.nb_chronos, SIM_VISIBLE_ROWS)):
             self.views.append(self._chrono_builder(i))
+            self.displayed_values.append("00:00.0")
+
+        # Scrollbar, if some rows are hidden
+        self.scrollbar = None
+        if self.nb_chronos > len(self.views):
+            self.scrollbar = Scrollbar(self.chronos_frm, orient=VERTICAL, command=self.scroll)
+            self.scrollbar.grid(row=0, column=7, rowspan=len(self.views), sticky=NS)
+            self.scrollbar.set(0, len(self.views) / self.nb_chronos)
+            for widget in (self.chronos_frm, *(widget for row in self.views for widget in row[1:])):
+                widget.bind("<MouseWheel>", self.on_wheel)
+                widget.bind("<Button-4>", self.on_wheel)
+                widget.bind("<Button-5>", self.on_wheel)
 
     def _chrono_builder(self, row) -> tuple:
-        """Builds a chrono on a line, with an empty entry (allowing to attach the chrono to a person, for example), a
-        button, and a label displaying the amount of time.
-        The chrono is recorded in a list.
+        """Builds a row on a line, with a number, an empty entry (allowing to attach the chrono to a person, for
+        example), a button, and a label displaying the amount of time. The row displays the chrono self.first + row.
+        The row is recorded in a list.
 
         Args:
-            row (int): The line in which the chrono is built, corresponding to the chrono number.
+            row (int): The line in which the row is built.
         """
         # Variable to display
         display_var = StringVar(value="00:00.0")
 
+        # Number label
+        number_lbl = Label(
+            self.chronos_frm,
+            text=row + 1,
+            font=SMALL_FONT,
+            bg=BG_COLOR,
+            fg=TXT_COLOR,
+            width=3,
+        )
+        number_lbl.grid(row=row, column=0, padx=SMALL_PAD)
+
         # Entry
         entry = Entry(
             self.chronos_frm,
             font=SMALL_FONT,
             width=12
         )
-        entry.grid(row=row, column=0, padx=SMALL_PAD)
+        entry.grid(row=row, column=1, padx=SMALL_PAD)
 
         # Run button
         run_btn = Button(
@@ -147,9 +369,9 @@ class SimultaneousChronoView(Frame):
             image=self.asset_manager.run_img,
             bg=BG_COLOR,
             border=0,
-            command=lambda: self.controller.run_one(row),
+            command=lambda: self.controller.run_one(self.first + row),
         )
-        run_btn.grid(row=row, column=1, padx=SMALL_PAD)
+        run_btn.grid(row=row, column=2, padx=SMALL_PAD)
 
         # Pause button
         pause_btn = Button(
@@ -157,10 +379,10 @@ class SimultaneousChronoView(Frame):
             image=self.asset_manager.pause_img,
             bg=BG_COLOR,
             border=0,
-            command=lambda: self.controller.pause_one(row),
+            command=lambda: self.controller.pause_one(self.first + row),
             state=DISABLED,
         )
-        pause_btn.grid(row=row, column=2, padx=SMALL_PAD)
+        pause_btn.grid(row=row, column=3, padx=SMALL_PAD)
 
         # Pause button
         stop_btn = Button(
@@ -168,9 +390,20 @@ class SimultaneousChronoView(Frame):
             image=self.asset_manager.reset_img,
             bg=BG_COLOR,
             border=0,
-            command=lambda: self.controller.reset_one(row),
+            command=lambda: self.controller.reset_one(self.first + row),
+        )
+        stop_btn.grid(row=row, column=4, padx=SMALL_PAD)
+
+        # Lap button
+        lap_btn = Button(
+            self.chronos_frm,
+            text=LAP,
+            font=SMALL_FONT,
+            fg=TXT_COLOR,
+            command=lambda: self.controller.lap_one(self.first + row),
+            state=DISABLED,
         )
-        stop_btn.grid(row=row, column=3, padx=SMALL_PAD)
+        lap_btn.grid(row=row, column=5, padx=SMALL_PAD)
 
         # Display label
         display_lbl = Label(
@@ -179,89 +412,181 @@ class SimultaneousChronoView(Frame):
             bg=BG_COLOR,
             fg=TXT_COLOR,
         )
-        display_lbl.grid(row=row, column=4, padx=SMALL_PAD)
+        display_lbl.grid(row=row, column=6, padx=SMALL_PAD)
 
         # Associates each chrono label with a StringVar variable
         display_lbl.config(textvariable=display_var)
 
-        return display_var, display_lbl, entry, run_btn, pause_btn, stop_btn
+        return display_var, display_lbl, entry, run_btn, pause_btn, stop_btn, lap_btn, number_lbl
+
+    @property
+    def visible(self) -> range:
+        """Returns the chronos displayed by the rows.
+
+        Returns:
+            range: the indexes of the visible chronos.
+        """
+        return range(self.first, self.first + len(self.views))
 
     def update_display(self, chrono, value) -> None:
-        """Displays the time value in the label of the chrono
+        """Displays the time value in the label of the chrono, if it is visible and changed since the last display.
 
         Args:
             chrono (int): The chrono to display.
             value (str): The time value to display.
         """
-        self.views[chrono][0].set(value)
+        row = chrono - self.first
+        if 0 <= row < len(self.views) and value != self.displayed_values[row]:
+            self.displayed_values[row] = value
+            self.views[row][0].set(value)
 
-    def update_every_60ms(self) -> None:
-        """Refreshes time display every 60 ms.
+    def scroll(self, action: str, amount: str, unit: str = "units") -> None:
+        """Scrolls the rows, as asked by the scrollbar.
+
+        Args:
+            action (str): "moveto" or "scroll".
+            amount (str): the position as a fraction for "moveto", the amount of units / pages for "scroll".
+            unit (str): "units" (rows) or "pages", for "scroll".
         """
-        self.after(60, self.controller.update_every_60ms)
+        if action == "moveto":
+            first = round(float(amount) * self.nb_chronos)
+        else:
+            first = self.first + int(amount) * (len(self.views) if unit == "pages" else 1)
+        self.show_rows(first)
 
-    def run_all(self) -> None:
-        """Runs all chronos.
+    def on_wheel(self, event) -> None:
+        """Scrolls the rows with the mouse wheel.
+
+        Args:
+            event (Event): the wheel event.
         """
-        self.run_btn.config(state=DISABLED)
-        self.pause_btn.config(state=NORMAL)
-        for number in range(len(self.views)):
-            self.run_one(number)
+        if event.num == 4 or event.delta > 0:
+            self.show_rows(self.first - WHEEL_ROWS)
+        else:
+            self.show_rows(self.first + WHEEL_ROWS)
 
-    def pause_all(self) -> None:
-        """Pauses all chronos.
+    def show_rows(self, first: int) -> None:
+        """Rebinds the rows to the chronos from first, keeping the typed names, then asks the controller for their
+        values.
+
+        Args:
+            first (int): the index of the chrono displayed by the first row.
         """
-        self.pause_btn.config(state=DISABLED)
-        self.run_btn.config(state=NORMAL)
-        for number in range(len(self.views)):
-            self.pause_one(number)
+        first = min(max(first, 0), self.nb_chronos - len(self.views))
+        if first == self.first:
+            return
+        for row, chrono in enumerate(self.views):
+            self.chrono_names[self.first + row] = chrono[2].get()
+        self.first = first
+        for row, chrono in enumerate(self.views):
+            index = first + row
+            chrono[7].config(text=index + 1)
+            chrono[2].delete(0, END)
+            chrono[2].insert(0, self.chrono_names[index])
+            self._show_state(row)
+        self.scrollbar.set(first / self.nb_chronos, (first + len(self.views)) / self.nb_chronos)
+        self.controller.display_visible()
+
+    def _show_state(self, row: int) -> None:
+        """Enables the buttons of a row according to the state of its chrono.
 
-    def reset_all(self) -> None:
-        """Resets all chronos.
+        Args:
+            row (int): the row to update.
         """
-        self.run_btn.config(state=NORMAL)
-        self.pause_btn.config(state=DISABLED)
-        for number in range(len(self.views)):
-            self.reset_one(number)
+        chrono = self.views[row]
+        running = self.running[self.first + row]
+        chrono[3].config(state=DISABLED if running else NORMAL)
+        chrono[4].config(state=NORMAL if running else DISABLED)
+        chrono[5].config(state=NORMAL)
+        chrono[6].config(state=NORMAL if running else DISABLED)
 
-    def run_one(self, value) -> None:
-        """Enables all PAUSE buttons, disables the RUN button.
+    def _set_running(self, indexes: Sequence, running: int) -> list:
+        """Sets the state of some chronos, in a single pass, counts the running ones, and returns the rows showing
+        them.
 
-        value (int): the index of the chrono to run.
+        Args:
+            indexes (Sequence): which chronos, each once.
+            running (int): 1 if they run, 0 otherwise.
+
+        Returns:
+            list: the visible rows to update, each once.
+        """
+        if len(indexes) == self.nb_chronos:
+            self.running[:] = bytes((running,)) * self.nb_chronos
+            self.nb_running = running * self.nb_chronos
+            return list(range(len(self.views)))
+        rows = []
+        for index in indexes:
+            self.nb_running += running - self.running[index]
+            self.running[index] = running
+            row = index - self.first
+            if 0 <= row < len(self.views):
+                rows.append(row)
+        return rows
+
+    def run_many(self, indexes: Sequence) -> None:
+        """Shows some chronos running: the global buttons are updated once, then each visible row once.
+
+        Args:
+            indexes (Sequence): which chronos were run, each once.
         """
+        for row in self._set_running(indexes, 1):
+            self._show_state(row)
         self.pause_btn.config(state=NORMAL)
-        for index, chrono in enumerate(self.views):
-            if index == value:
-                chrono[3].config(state=DISABLED)
-                chrono[4].config(state=NORMAL)
-                chrono[5].config(state=NORMAL)
+        if self.nb_running == self.nb_chronos:
+            self.run_btn.config(state=DISABLED)
 
-    def pause_one(self, value: int) -> None:
-        """Disables the PAUSE button of the selected chrono.
+    def pause_many(self, indexes: Sequence) -> None:
+        """Shows some chronos paused: the global buttons are updated once, then each visible row once.
 
         Args:
-           value (int): the index of the chrono to pause.
+            indexes (Sequence): which chronos were paused, each once.
         """
+        for row in self._set_running(indexes, 0):
+            self._show_state(row)
         self.run_btn.config(state=NORMAL)
-        for index, chrono in enumerate(self.views):
-            if index == value:
-                chrono[3].config(state=NORMAL)
-                chrono[4].config(state=DISABLED)
-                chrono[5].config(state=NORMAL)
+        if self.nb_running == 0:
+            self.pause_btn.config(state=DISABLED)
 
-    def reset_one(self, value) -> None:
-        """Enables all the buttons, and clears all the entries.
+    def reset_many(self, indexes: Sequence) -> None:
+        """Shows some chronos reset, and clears their names: the global buttons are updated once, then each visible
+        row once.
 
         Args:
-           value (int): the index of the chrono to reset.
+            indexes (Sequence): which chronos were reset, each once.
         """
+        if len(indexes) == self.nb_chronos:
+            self.chrono_names = [""] * self.nb_chronos
+        else:
+            for index in indexes:
+                self.chrono_names[index] = ""
+        for row in self._set_running(indexes, 0):
+            self._show_state(row)
+            self.views[row][2].delete(0, END)
         self.run_btn.config(state=NORMAL)
-        for index, chrono in enumerate(self.views):
-            if index == value:
-                chrono[3].config(state=NORMAL)
-                chrono[4].config(state=DISABLED)
-                chrono[5].config(state=NORMAL)
-                chrono[2].delete(0, END)
+        if self.nb_running == 0:
+            self.pause_btn.config(state=DISABLED)
+
+    def names(self) -> list:
+        """Returns the names typed in the entries of the chronos.
+
+        Returns:
+            list: the name of each chrono.
+        """
+        for row, chrono in enumerate(self.views):
+            self.chrono_names[self.first + row] = chrono[2].get()
+        return list(self.chrono_names)
+
+    def hide(self) -> None:
+        """Hides the view, scrolled back to the first chrono, so it can be shown again.
+        """
+        self.show_rows(0)
+        self.grid_remove()
+
+    def show(self) -> None:
+        """Shows the hidden view again.
+        """
+        self.grid()
 
     def delete(self) -> None:
         """Deletes the instance.
@@ -270,6 +595,9 @@ class SimultaneousChronoView(Frame):
 
 
 class MultiTimerView(Frame):
+    assets = {"home_img": (HOME, 1), "run_img": (RUN, 1), "pause_img": (PAUSE, 1), "reset_img": (RESET, 1),
+              "up_img": (UP, 3), "down_img": (DOWN, 3)}
+
     def __init__(self, controller, number):
         """Creates the view of 2 timers, with 4 buttons (home/run/pause/reset). Each timer has a label displaying
         the amount of remaining time, and a circle representing the amount of remaining time.
@@ -400,31 +728,15 @@ class MultiTimerView(Frame):
         """
         return self.diameter - self.margin
 
-    def update_every_60ms(self) -> None:
-        """Refreshes time display every 60 ms.
-        """
-        self.after(60, self.controller.update_every_60ms)
-
-        # The clock angles
-        for timer in self.views:
-            timer.clock.itemconfig(timer.arc, extent=timer.angle)
-            timer.clock.update()
-
-    def update_display(self, values_and_percents: list) -> None:
-        """Displays the time value in the label and updates the arc angle.
+    def update_display(self, timer: int, value: str, percent: float) -> None:
+        """Displays the time value in the label of a timer and updates its arc angle.
 
         Args:
-            values_and_percents (list): few tuples (str, float), one for each timer. The time value is the str,
-            the percent is the float.
+            timer (int): the index of the timer.
+            value (str): the time value to display.
+            percent (float): the percent of this time value.
         """
-        for index, value_and_percent in enumerate(values_and_percents):
-            if value_and_percent[1] == 0 or values_and_percents[1] == 1:
-                self.views[index].angle = 359.99
-            else:
-                self.views[index].angle = value_and_percent[1] * 360
-
-            # The clock angles
-            self.views[index].update_display(value_and_percent[0], value_and_percent[1])
+        self.views[timer].update_display(value, percent)
 
     def run(self) -> None:
         """Disables all buttons except PAUSE and RESET buttons.
@@ -455,6 +767,20 @@ class MultiTimerView(Frame):
         self.sub_1.config(state=NORMAL)
         self.sub_10.config(state=NORMAL)
 
+    def hide(self) -> None:
+        """Hides the view and its timers, so they can be shown again.
+        """
+        for timer in self.views:
+            timer.grid_remove()
+        self.grid_remove()
+
+    def show(self) -> None:
+        """Shows the hidden view and its timers again.
+        """
+        self.grid()
+        for timer in self.views:
+            timer.grid()
+
     def delete(self) -> None:
         """Deletes the instance.
         """
@@ -464,6 +790,8 @@ class MultiTimerView(Frame):
 
 
 class MultiChronoView(Frame):
+    assets = {"home_img": (HOME, 2), "run_img": (RUN, 2), "pause_img": (PAUSE, 2), "reset_img": (RESET, 2)}
+
     def __init__(self, controller, nb_chronos) -> None:
         """Creates the view of fiew chronos (2 -> 10), with 3 buttons (home/pause/reset) and a label where time is
         displayed. Each chrono has an entry to set a name, and a run button whiche pauses all the others.
@@ -480,6 +808,9 @@ class MultiChronoView(Frame):
             nb_chronos = 2
         self.nb_chronos = nb_chronos
         self.views = []
+        self.displayed_values = ["00:00.0"] * self.nb_chronos
+        # The index of the running chrono, so a transition only updates the rows which change
+        self.running = None
 
         self.config(bg=BG_COLOR)
 
@@ -524,6 +855,27 @@ class MultiChronoView(Frame):
         )
         self.reset_btn.grid(row=0, column=2, padx=BIG_PAD)
 
+        # Lap button
+        self.lap_btn = Button(
+            self.button_frm,
+            text=LAP,
+            font=SMALL_FONT,
+            fg=TXT_COLOR,
+            state=DISABLED,
+            command=self.controller.lap,
+        )
+        self.lap_btn.grid(row=0, column=3, padx=BIG_PAD)
+
+        # Export button
+        self.export_btn = Button(
+            self.button_frm,
+            text=EXPORT,
+            font=SMALL_FONT,
+            fg=TXT_COLOR,
+            command=self.controller.export,
+        )
+        self.export_btn.grid(row=0, column=4, padx=BIG_PAD)
+
         # Time Manager
         for i in range(self.nb_chronos):
             self.views.append(self._chrono_builder(i))
@@ -563,48 +915,379 @@ class MultiChronoView(Frame):
         return display_var, display_lbl, entry, run_btn
 
     def update_display(self, chrono: int, value: str) -> None:
-        """Displays the time value in the label of the chrono
+        """Displays the time value in the label of the chrono, if it changed since the last display.
 
         Args:
             chrono (int): The index of the chrono to display
             value (str): The time value to display.
         """
-        self.views[chrono][0].set(value)
-
-    def update_every_60ms(self) -> None:
-        """Refreshes time display every 60 ms.
-        """
-        self.after(60, self.controller.update_every_60ms)
+        if value != self.displayed_values[chrono]:
+            self.displayed_values[chrono] = value
+            self.views[chrono][0].set(value)
 
     def run(self, value: int) -> None:
-        """Enables all buttons except the RUN button of the chrono at the index in the self.views list
+        """Enables all buttons except the RUN button of the chrono at the index in the self.views list. Only the RUN
+        buttons of the previously running chrono and of this one change.
 
         Args:
             value (int): The index of the chrono to run.
         """
         self.pause_btn.config(state=NORMAL)
-        for index, chrono in enumerate(self.views):
-            if index == value:
-                chrono[3].config(state=DISABLED)
-            else:
-                chrono[3].config(state=NORMAL)
+        self.lap_btn.config(state=NORMAL)
+        if self.running is not None:
+            self.views[self.running][3].config(state=NORMAL)
+        self.running = value
+        self.views[value][3].config(state=DISABLED)
 
     def pause(self) -> None:
-        """Enables all RUN buttons, and disables the PAUSE button.
+        """Enables all RUN buttons, and disables the PAUSE and LAP buttons.
         """
         self.pause_btn.config(state=DISABLED)
+        self.lap_btn.config(state=DISABLED)
         self.reset_btn.config(state=NORMAL)
-        for chrono in self.views:
-            chrono[3].config(state=NORMAL)
+        if self.running is not None:
+            self.views[self.running][3].config(state=NORMAL)
+            self.running = None
 
     def reset(self) -> None:
         """Enables all the buttons, and clears all the entries.
         """
         self.pause_btn.config(state=NORMAL)
+        self.lap_btn.config(state=DISABLED)
+        self.running = None
         for chrono in self.views:
             chrono[3].config(state=NORMAL)
             chrono[2].delete(0, END)
 
+    def names(self) -> list:
+        """Returns the names typed in the entries of the chronos.
+
+        Returns:
+            list: the name of each chrono.
+        """
+        return [chrono[2].get() for chrono in self.views]
+
+    def hide(self) -> None:
+        """Hides the view, so it can be shown again.
+        """
+        self.grid_remove()
+
+    def show(self) -> None:
+        """Shows the hidden view again.
+        """
+        self.grid()
+
+    def delete(self) -> None:
+        """Deletes the instance.
+        """
+        self.destroy()
+
+
+class MultiChronoCanvasView(Frame):
+    assets = {"home_img": (HOME, 2), "pause_img": (PAUSE, 2), "reset_img": (RESET, 2)}
+
+    # Horizontal layout of a row: number, name box, run / pause glyph, time
+    number_x = 20
+    name_x = 40
+    name_width = 160
+    glyph_x = 225
+    glyph_size = 10
+    time_x = 250
+    width = 470
+
+    def __init__(self, controller, nb_chronos) -> None:
+        """Creates the same view as MultiChronoView, but the rows of the chronos are items drawn on a single canvas
+        instead of widgets: a number, a name typed in place, a run glyph (a pause glyph while the chrono runs), and
+        the time. Clicks are hit-tested from their coordinates. A tick only changes the text of canvas items, merged
+        by the render queue, and building the view costs a single widget whatever the amount of chronos.
+
+        Args:
+            controller (MultiChronoController): The controller of the view, in the controllers.py file.
+            nb_chronos (int): How many chronos you want (2 -> 100).
+        """
+        super().__init__()
+        self.controller = controller
+        self.asset_manager = AssetsManager(self)
+        if nb_chronos not in range(2, MAX_MLT_CANVAS_CHRONOS + 1):
+            nb_chronos = 2
+        self.nb_chronos = nb_chronos
+        self.running = None
+        self.displayed_values = ["00:00.0"] * self.nb_chronos
+        # The entry typing a name, built on the first edit and placed over the name box of the edited row
+        self.editor = None
+        self.editor_item = None
+        self.editing = None
+
+        self.config(bg=BG_COLOR)
+
+        self.grid(row=0, column=0)
+
+        # 2 frames, one for the buttons, one for the chronos
+        self.button_frm = Frame(self, bg=BG_COLOR)
+        self.button_frm.grid(row=0, column=0)
+
+        self.chronos_frm = Frame(self, bg=BG_COLOR)
+        self.chronos_frm.grid(row=1, column=0)
+
+        # Home button
+        self.home_btn = Button(
+            self.button_frm,
+            image=self.asset_manager.home_img,
+            bg=BG_COLOR,
+            border=0,
+            state=NORMAL,
+            command=self.controller.destroy,
+        )
+        self.home_btn.grid(row=0, column=0, padx=BIG_PAD)
+
+        # Pause button
+        self.pause_btn = Button(
+            self.button_frm,
+            image=self.asset_manager.pause_img,
+            bg=BG_COLOR,
+            border=0,
+            state=DISABLED,
+            command=self.controller.pause,
+        )
+        self.pause_btn.grid(row=0, column=1, padx=BIG_PAD)
+
+        # Reset button
+        self.reset_btn = Button(
+            self.button_frm,
+            image=self.asset_manager.reset_img,
+            bg=BG_COLOR,
+            border=0,
+            command=self.controller.reset,
+        )
+        self.reset_btn.grid(row=0, column=2, padx=BIG_PAD)
+
+        # Lap button
+        self.lap_btn = Button(
+            self.button_frm,
+            text=LAP,
+            font=SMALL_FONT,
+            fg=TXT_COLOR,
+            state=DISABLED,
+            command=self.controller.lap,
+        )
+        self.lap_btn.grid(row=0, column=3, padx=BIG_PAD)
+
+        # Export button
+        self.export_btn = Button(
+            self.button_frm,
+            text=EXPORT,
+            font=SMALL_FONT,
+            fg=TXT_COLOR,
+            command=self.controller.export,
+        )
+        self.export_btn.grid(row=0, column=4, padx=BIG_PAD)
+
+        # Canvas of the chronos, scrollable beyond MLT_VISIBLE_ROWS rows
+        self.canvas = Canvas(
+            self.chronos_frm,
+            width=self.width,
+            height=min(self.nb_chronos, MLT_VISIBLE_ROWS) * ROW_HEIGHT,
+            bg=BG_COLOR,
+            highlightthickness=0,
+            scrollregion=(0, 0, self.width, self.nb_chronos * ROW_HEIGHT),
+            yscrollincrement=ROW_HEIGHT,
+        )
+        self.canvas.grid(row=0, column=0)
+        if self.nb_chronos > MLT_VISIBLE_ROWS:
+            self.scrollbar = Scrollbar(self.chronos_frm, orient=VERTICAL, command=self.canvas.yview)
+            self.scrollbar.grid(row=0, column=1, sticky=NS)
+            self.canvas.config(yscrollcommand=self.scrollbar.set)
+            self.canvas.bind("<MouseWheel>", self.on_wheel)
+            self.canvas.bind("<Button-4>", self.on_wheel)
+            self.canvas.bind("<Button-5>", self.on_wheel)
+        self.canvas.bind("<Button-1>", self.on_click)
+
+        # Time Manager
+        self.name_items = []
+        self.run_items = []
+        self.time_items = []
+        for i in range(self.nb_chronos):
+            self._chrono_drawer(i)
+
+    def _chrono_drawer(self, row: int) -> None:
+        """Draws a chrono on a line, with its number, an empty name box (allowing to attach the chrono to a person, for
+        example), a run glyph, and the amount of time. The pause glyph of the row is hidden until it runs.
+        The items are recorded in lists.
+
+        Args:
+            row (int): The line in which the chrono is drawn, corresponding to the chrono number.
+        """
+        top = row * ROW_HEIGHT
+        middle = top + ROW_HEIGHT // 2
+        size = self.glyph_size
+
+        self.canvas.create_text(self.number_x, middle, text=row + 1, font=SMALL_FONT, fill=TXT_COLOR)
+        self.canvas.create_rectangle(self.name_x, middle - 12, self.name_x + self.name_width, middle + 12,
+                                     outline=CHRONO_COLOR, fill="white")
+        self.name_items.append(self.canvas.create_text(self.name_x + 4, middle, text="", anchor=W, font=SMALL_FONT,
+                                                       fill=TXT_COLOR))
+        self.run_items.append(self.canvas.create_polygon(
+            self.glyph_x - size, middle - size, self.glyph_x + size, middle, self.glyph_x - size, middle + size,
+            fill=TXT_COLOR,
+        ))
+        for left in (self.glyph_x - size, self.glyph_x + size // 3):
+            self.canvas.create_rectangle(left, middle - size, left + 2 * size // 3, middle + size, fill=TXT_COLOR,
+                                         width=0, state=HIDDEN, tags=f"pause{row}")
+        self.time_items.append(self.canvas.create_text(self.time_x, middle, text="00:00.0", anchor=W, font=BIG_FONT,
+                                                       fill=TXT_COLOR))
+
+    def on_click(self, event) -> None:
+        """Finds the row and the column clicked: the name box starts typing, the run glyph runs the chrono, the pause
+        glyph pauses it. A click anywhere ends the name being typed.
+
+        Args:
+            event (Event): the click event.
+        """
+        row = int(self.canvas.canvasy(event.y)) // ROW_HEIGHT
+        self.end_edit()
+        if row >= self.nb_chronos:
+            return
+        if self.name_x <= event.x < self.name_x + self.name_width:
+            self.edit(row, event.x)
+        elif abs(event.x - self.glyph_x) <= self.glyph_size:
+            if row == self.running:
+                self.controller.pause()
+            else:
+                self.controller.run(row)
+
+    def edit(self, row: int, x: int) -> None:
+        """Places the entry over the name box of a row, with its name, to type it.
+
+        Args:
+            row (int): the row.
+            x (int): where the name box was clicked, to put the cursor there.
+        """
+        if self.editor is None:
+            self.editor = Entry(self.canvas, font=SMALL_FONT, fg=TXT_COLOR, bd=0, highlightthickness=0,
+                                validate="key", validatecommand=(self.register(self.accept_name), "%P"))
+            for sequence in ("<Return>", "<Tab>", "<Escape>", "<FocusOut>"):
+                self.editor.bind(sequence, self.end_edit)
+        self.editing = row
+        self.editor.delete(0, END)
+        self.editor.insert(0, self.canvas.itemcget(self.name_items[row], "text"))
+        self.editor_item = self.canvas.create_window(self.name_x + 2, row * ROW_HEIGHT + ROW_HEIGHT // 2, anchor=W,
+                                                     width=self.name_width - 4, window=self.editor)
+        self.editor.focus_set()
+        self.editor.icursor(f"@{x - self.name_x - 2}")
+
+    def accept_name(self, name: str) -> bool:
+        """Validates a name being typed: it must fit in the name box.
+
+        Args:
+            name (str): the name, if the key is accepted.
+
+        Returns:
+            bool: whether the key is accepted.
+        """
+        return len(name) <= NAME_CHARS
+
+    def end_edit(self, event=None) -> None:
+        """Writes the name typed in its name box, and removes the entry.
+
+        Args:
+            event (Event|None): the key or focus event, if any.
+        """
+        if self.editing is None:
+            return
+        self.canvas.itemconfig(self.name_items[self.editing], text=self.editor.get())
+        self.canvas.delete(self.editor_item)
+        self.editing = self.editor_item = None
+
+    def on_wheel(self, event) -> None:
+        """Scrolls the rows with the mouse wheel.
+
+        Args:
+            event (Event): the wheel event.
+        """
+        if event.num == 4 or event.delta > 0:
+            self.canvas.yview_scroll(-WHEEL_ROWS, "units")
+        else:
+            self.canvas.yview_scroll(WHEEL_ROWS, "units")
+
+    def update_display(self, chrono: int, value: str) -> None:
+        """Displays the time value in the row of the chrono, if it changed since the last display.
+
+        Args:
+            chrono (int): The index of the chrono to display
+            value (str): The time value to display.
+        """
+        if value != self.displayed_values[chrono]:
+            self.displayed_values[chrono] = value
+            self.master.render_queue.itemconfig(self.canvas, self.time_items[chrono], text=value)
+
+    def _show_glyph(self, row: int, running: bool) -> None:
+        """Shows the run glyph of a row, or its pause glyph.
+
+        Args:
+            row (int): the row.
+            running (bool): whether its chrono runs.
+        """
+        self.canvas.itemconfig(self.run_items[row], state=HIDDEN if running else NORMAL)
+        self.canvas.itemconfig(f"pause{row}", state=NORMAL if running else HIDDEN)
+
+    def run(self, value: int) -> None:
+        """Enables all buttons, and shows the pause glyph of the chrono which runs.
+
+        Args:
+            value (int): The index of the chrono to run.
+        """
+        self.pause_btn.config(state=NORMAL)
+        self.lap_btn.config(state=NORMAL)
+        if self.running is not None:
+            self._show_glyph(self.running, False)
+        self.running = value
+        self._show_glyph(value, True)
+
+    def pause(self) -> None:
+        """Shows all run glyphs, and disables the PAUSE and LAP buttons.
+        """
+        self.pause_btn.config(state=DISABLED)
+        self.lap_btn.config(state=DISABLED)
+        self.reset_btn.config(state=NORMAL)
+        if self.running is not None:
+            self._show_glyph(self.running, False)
+            self.running = None
+
+    def reset(self) -> None:
+        """Enables all the buttons, and clears all the names.
+        """
+        self.pause_btn.config(state=NORMAL)
+        self.lap_btn.config(state=DISABLED)
+        if self.running is not None:
+            self._show_glyph(self.running, False)
+            self.running = None
+        self.end_edit()
+        for item in self.name_items:
+            self.canvas.dchars(item, 0, END)
+
+    def names(self) -> list:
+        """Returns the names typed in the rows of the chronos, the one being typed included.
+
+        Returns:
+            list: the name of each chrono.
+        """
+        names = [self.canvas.itemcget(item, "text") for item in self.name_items]
+        if self.editing is not None:
+            names[self.editing] = self.editor.get()
+        return names
+
+    def hide(self) -> None:
+        """Hides the view, scrolled back to the first chrono, so it can be shown again.
+        """
+        self.end_edit()
+        self.canvas.yview_moveto(0)
+        self.grid_remove()
+
+    def show(self) -> None:
+        """Shows the hidden view again.
+        """
+        self.grid()
+
     def delete(self) -> None:
         """Deletes the instance.
         """
@@ -612,6 +1295,9 @@ class MultiChronoView(Frame):
 
 
 class TimerView(Frame):
+    assets = {"home_img": (HOME, 3), "run_img": (RUN, 3), "pause_img": (PAUSE, 3), "reset_img": (RESET, 3),
+              "up_img": (UP, 7), "down_img": (DOWN, 7)}
+
     def __init__(self, controller, vertical: bool = False, column: int = 0, diameter: int = SMALL_DIAMETER) -> None:
         """Creates the view of a timer, with 3 buttons (home/run/pause/reset), a label where time is displayed, and
         a circle representing the amount of remaining time.
@@ -639,9 +1325,17 @@ class TimerView(Frame):
         self.column = column
         self.config(bg=BG_COLOR)
 
-        # Variable displayed in the label and arc's angle
+        # Variable displayed in the label and arc's angle, remembered to skip unchanged displays
         self.display_var = StringVar(value="00:00.0")
+        self.displayed_value = "00:00.0"
         self.angle = 359.99
+        self.arc_step = 360 / (pi * self.interior_diameter)
+
+        # The pre-rendered faces replace the slice by steps of the full turn
+        self.faces = self.master.clock_faces if environ.get(ARC_RENDERER) == "sprites" else None
+        if self.faces is not None:
+            self.step = self.faces.steps
+            self.arc_step = 360 / self.faces.steps
 
         self.grid(row=1, column=self.column)
 
@@ -735,15 +1429,19 @@ class TimerView(Frame):
         self.display_lbl = Label(self, font=self.font, fg=TXT_COLOR, bg=BG_COLOR, textvariable=self.display_var)
         self.display_lbl.grid(row=1, column=0)
 
-        # Clock
+        # Clock, a pie slice drawn by Tk, or a pre-rendered face
         self.clock = Canvas(self, height=self.diameter, width=self.diameter, bg=BG_COLOR)
         self.clock.grid(row=clock_coords[0], column=clock_coords[1], rowspan=clock_coords[2])
-        self.clock.create_oval(self.margin, self.margin, self.diameter, self.diameter,
-                               fill=self.circle_color, outline=self.circle_color)
-        self.arc = self.clock.create_arc(2 * self.margin, 2 * self.margin,
-                                         self.interior_diameter, self.interior_diameter,
-                                         start=90, extent=self.angle, outline=self.chrono_color,
-                                         fill=self.chrono_color)
+        if self.faces is None:
+            self.clock.create_oval(self.margin, self.margin, self.diameter, self.diameter,
+                                   fill=self.circle_color, outline=self.circle_color)
+            self.arc = self.clock.create_arc(2 * self.margin, 2 * self.margin,
+                                             self.interior_diameter, self.interior_diameter,
+                                             start=90, extent=self.angle, outline=self.chrono_color,
+                                             fill=self.chrono_color)
+        else:
+            self.face = self.faces.get(self.diameter, self.step)
+            self.arc = self.clock.create_image(0, 0, anchor=NW, image=self.face)
 
     @property
     def interior_diameter(self) -> int:
@@ -754,33 +1452,45 @@ class TimerView(Frame):
         """
         return self.diameter - self.margin
 
-    def update_every_60ms(self) -> None:
-        """Refreshes time display every 60 ms.
-        """
-        self.after(60, self.controller.update_every_60ms)
-
-        # The clock angle
-        self.clock.itemconfig(self.arc, extent=self.angle)
-        self.clock.update()
-
     def update_display(self, value: str, percent: float) -> None:
-        """Displays the time value in the label and updates the arc angle
+        """Displays the time value in the label and updates the arc angle, skipping what did not visibly change. The
+        angle is rounded down to the arc step, the angle moving the edge of the arc by a pixel (or to the step of the
+        pre-rendered faces).
 
         Args:
             value (str): the time value to display.
             percent (float): the percent of this time value.
         """
-        if percent == 0 or percent == 1:
-            self.angle = 359.99
+        # The clock angle, drawn when Tk is idle
+        if self.faces is not None:
+            self.update_face(percent)
         else:
-            self.angle = percent * 360
-
-        # The clock angle
-        self.clock.itemconfig(self.arc, extent=self.angle)
-        self.clock.update()
+            if percent == 0 or percent == 1:
+                angle = 359.99
+            else:
+                angle = min(int(percent * 360 / self.arc_step) * self.arc_step, 359.99)
+            if angle != self.angle:
+                self.angle = angle
+                self.master.render_queue.itemconfig(self.clock, self.arc, extent=self.angle)
 
         #  The label
-        self.display_var.set(value)
+        if value != self.displayed_value:
+            self.displayed_value = value
+            self.display_var.set(value)
+
+    def update_face(self, percent: float) -> None:
+        """Shows the pre-rendered face of the percent, when Tk is idle, if its step changed. The view keeps the face
+        it shows, so the cache can forget it.
+
+        Args:
+            percent (float): the percent of the time value.
+        """
+        steps = self.faces.steps
+        step = steps if percent == 0 or percent == 1 else min(int(percent * steps), steps)
+        if step != self.step:
+            self.step = step
+            self.face = self.faces.get(self.diameter, step)
+            self.master.render_queue.itemconfig(self.clock, self.arc, image=self.face)
 
     def run(self):
         """Disables all buttons except PAUSE and RESET.
@@ -811,6 +1521,16 @@ class TimerView(Frame):
         self.sub_1.config(state=NORMAL)
         self.sub_10.config(state=NORMAL)
 
+    def hide(self) -> None:
+        """Hides the view, so it can be shown again.
+        """
+        self.grid_remove()
+
+    def show(self) -> None:
+        """Shows the hidden view again.
+        """
+        self.grid()
+
     def delete(self) -> None:
         """Deletes the instance.
         """
@@ -818,6 +1538,8 @@ class TimerView(Frame):
 
 
 class ChronoView(Frame):
+    assets = {"home_img": (HOME, 1), "run_img": (RUN, 1), "pause_img": (PAUSE, 1), "reset_img": (RESET, 1)}
+
     def __init__(self, controller) -> None:
         """Creates the view of a chrono, with 4 buttons (home/run/pause/reset) and a label where time is displayed.
         The controller binds it to a model.
@@ -831,9 +1553,9 @@ class ChronoView(Frame):
         self.asset_manager = AssetsManager(self)
         self.font = SMALL_FONT
 
-        # Variable displayed in the label
+        # Variable displayed in the label, remembered to skip unchanged displays
         self.display_var = StringVar(value="00:00.0")
-
+        self.displayed_value = "00:00.0"
 
         self.grid(row=0, column=0)
 
@@ -883,39 +1605,83 @@ class ChronoView(Frame):
         )
         self.reset_btn.grid(row=1, column=3, padx=MARGIN)
 
+        # Lap label, displaying the last lap
+        self.lap_var = StringVar(value="")
+        self.lap_lbl = Label(self, bg=BG_COLOR, fg=TXT_COLOR, textvariable=self.lap_var, font=self.font)
+        self.lap_lbl.grid(row=2, column=0, columnspan=4, padx=MARGIN)
+
+        # Lap button
+        self.lap_btn = Button(
+            self,
+            text=LAP,
+            font=self.font,
+            fg=TXT_COLOR,
+            state=DISABLED,
+            command=self.controller.lap,
+        )
+        self.lap_btn.grid(row=3, column=0, columnspan=2, padx=MARGIN, pady=MARGIN)
+
+        # Export button
+        self.export_btn = Button(
+            self,
+            text=EXPORT,
+            font=self.font,
+            fg=TXT_COLOR,
+            command=self.controller.export,
+        )
+        self.export_btn.grid(row=3, column=2, columnspan=2, padx=MARGIN, pady=MARGIN)
+
     def update_display(self, value: str) -> None:
-        """Displays the time value in the label
+        """Displays the time value in the label, if it changed since the last display.
 
         Args:
             value (str): The time value to display.
         """
-        self.display_var.set(value)
+        if value != self.displayed_value:
+            self.displayed_value = value
+            self.display_var.set(value)
 
-    def update_every_60ms(self) -> None:
-        """Refreshes time display every 60 ms.
+    def update_lap(self, value: str) -> None:
+        """Displays the last lap.
+
+        Args:
+            value (str): The lap to display.
         """
-        self.after(60, self.controller.update_every_60ms)
+        self.lap_var.set(value)
 
     def run(self) -> None:
-        """Enables PAUSE and RESET buttons, and disables RUN button.
+        """Enables PAUSE, RESET and LAP buttons, and disables RUN button.
         """
         self.run_btn.config(state=DISABLED)
         self.pause_btn.config(state=NORMAL)
         self.reset_btn.config(state=NORMAL)
+        self.lap_btn.config(state=NORMAL)
 
     def pause(self) -> None:
-        """Enables RUN and RESET buttons, and disables PAUSE button.
+        """Enables RUN and RESET buttons, and disables PAUSE and LAP buttons.
         """
         self.run_btn.config(state=NORMAL)
         self.pause_btn.config(state=DISABLED)
         self.reset_btn.config(state=NORMAL)
+        self.lap_btn.config(state=DISABLED)
 
     def reset(self) -> None:
-        """Enables RUN buttons, and disables PAUSE and RESET button.
+        """Enables RUN buttons, and disables PAUSE, RESET and LAP buttons.
         """
         self.run_btn.config(state=NORMAL)
         self.pause_btn.config(state=DISABLED)
         self.reset_btn.config(state=DISABLED)
+        self.lap_btn.config(state=DISABLED)
+
+    def hide(self) -> None:
+        """Hides the view, so it can be shown again.
+        """
+        self.grid_remove()
+
+    def show(self) -> None:
+        """Shows the hidden view again.
+        """
+        self.grid()
 
     def delete(self) -> None:
         """Deletes the instance.
@@ -933,6 +1699,9 @@ class ApplicationView(Tk):
         """
         super().__init__()
         self.controller = controller
+        self.render_queue = RenderQueue(self)
+        self.image_cache = ImageCache()
+        self.clock_faces = ClockFaceCache(self)
         self.config(bg=BG_COLOR)
         self.iconbitmap(ICONE)
 
@@ -940,6 +1709,11 @@ class ApplicationView(Tk):
         self.menu_frm.grid(row=0, column=0)
         self.show_menu()
 
+        # Debug overlay, built when shown for the first time
+        self.debug_lbl = None
+        self.bind_all(DEBUG_KEY, lambda event: self.controller.toggle_debug())
+        self.bind_all(DEBUG_DUMP_KEY, lambda event: self.controller.dump_debug())
+
         self.one_chrono_btn = Button(
             self.menu_frm,
             fg=TXT_COLOR,
@@ -955,7 +1729,7 @@ class ApplicationView(Tk):
             fg=TXT_COLOR,
             width=SPINBOX_WIDTH,
             from_=2,
-            to=MAX_MLT_CHRONOS,
+            to=MAX_MLT_CANVAS_CHRONOS if multi_chrono_view() is MultiChronoCanvasView else MAX_MLT_CHRONOS,
             wrap=True,
             justify="right",
             font=SMALL_FONT,
@@ -1065,7 +1839,114 @@ class ApplicationView(Tk):
                 self.title(MULTITIMER)
                 self.controller.build_mlt_timer()
 
+    def show_overlay(self, text: str) -> None:
+        """Displays the debug overlay over the top right corner of the window.
+
+        Args:
+            text (str): the text of the overlay.
+        """
+        if self.debug_lbl is None:
+            self.debug_lbl = Label(self, font=DEBUG_FONT, justify=LEFT, bg=TXT_COLOR, fg=BG_COLOR)
+        self.debug_lbl.config(text=text)
+        self.debug_lbl.place(relx=1, rely=0, anchor=NE)
+        self.debug_lbl.lift()
+
+    def hide_overlay(self) -> None:
+        """Hides the debug overlay.
+        """
+        if self.debug_lbl is not None:
+            self.debug_lbl.place_forget()
+
+    def restore_app(self, index: int, nb_chronos: int) -> None:
+        """Builds the app of an interrupted session, with its amount of chronos. Only the spinbox of this app is set.
+
+        Args:
+            index (int): the index of the app.
+            nb_chronos (int): the amount of chronos / timers of the session.
+        """
+        spinbox = {2: self.spinbox_mlt, 3: self.spinbox_sim}.get(index)
+        if spinbox is not None:
+            spinbox.delete(0, END)
+            spinbox.insert(0, nb_chronos)
+        self.build_app(index)
+
+    def preload_assets(self) -> None:
+        """Loads the images of every view, so opening a mode does not read nor decode any file.
+        """
+        for view in (ChronoView, MultiChronoView, SimultaneousChronoView, TimerView, MultiTimerView):
+            self.image_cache.preload(view.assets.values())
+
+    def report_first_frame(self) -> None:
+        """Prints a line once the menu is visible, then quits. Used by the startup benchmark.
+        """
+        self.wait_visibility()
+        self.update_idletasks()
+        print(STARTUP_PROBE, flush=True)
+        self.destroy()
+
     def launch_app(self) -> None:
-        """Runs the GUI.
+        """Runs the GUI, loading the images once the menu is displayed.
         """
+        self.after_idle(self.preload_assets)
+        if environ.get(STARTUP_PROBE):
+            self.after_idle(self.report_first_frame)
         self.mainloop()
+
+
+# -------------------- FUNCTIONS --------------------
+def ask_export_path(parent: Misc) -> str:
+    """Asks the user where to export the laps. The dialog module is imported on first use.
+
+    Args:
+        parent (Misc): the view asking.
+
+    Returns:
+        str: the path of the file, empty if the user cancelled.
+    """
+    from tkinter import filedialog
+
+    return filedialog.asksaveasfilename(parent=parent, defaultextension=".csv", filetypes=EXPORT_TYPES)
+
+
+def show_export_error(parent: Misc, error: OSError) -> None:
+    """Tells the user the laps could not be written. The dialog module is imported on first use.
+
+    Args:
+        parent (Misc): the view which exported.
+        error (OSError): why the file could not be written.
+    """
+    from tkinter import messagebox
+
+    messagebox.showerror(EXPORT_ERROR, f"{error.filename or ''}\n{error.strerror or error}", parent=parent)
+
+
+def built_size(mode: int, size: int) -> int:
+    """Returns the amount of chronos the view of a mode builds when asked for some: 2 if the amount is out of range,
+    0 for the modes without an amount.
+
+    Args:
+        mode (int): the index of the mode in the menu.
+        size (int): the amount of chronos asked.
+
+    Returns:
+        int: the amount of chronos built.
+    """
+    if mode == 2:
+        maximum = MAX_MLT_CANVAS_CHRONOS if multi_chrono_view() is MultiChronoCanvasView else MAX_MLT_CHRONOS
+    elif mode == 3:
+        maximum = MAX_SIM_CHRONOS
+    else:
+        return 0
+    return size if size in range(2, maximum + 1) else 2
+
+
+def multi_chrono_view() -> type:
+    """Returns the view of the alternate chronos chosen by the MLT_RENDERER environment variable: rows drawn on a
+    single canvas if it is "canvas", a row of widgets per chrono otherwise.
+
+    Returns:
+        type: MultiChronoView or MultiChronoCanvasView.
+    """
+    if environ.get(MLT_RENDERER) == "canvas":
+        return MultiChronoCanvasView
+    return MultiChronoView